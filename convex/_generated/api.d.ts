@@ -31,9 +31,14 @@ import type * as playerNearbyCourses from "../playerNearbyCourses.js";
 import type * as playerPhotos from "../playerPhotos.js";
 import type * as playerProfessional from "../playerProfessional.js";
 import type * as players from "../players.js";
+import type * as roundStats from "../roundStats.js";
 import type * as tournamentResults from "../tournamentResults.js";
 import type * as tournaments from "../tournaments.js";
+import type * as utils_courseStatsAggregation from "../utils/courseStatsAggregation.js";
 import type * as utils_dataProcessing from "../utils/dataProcessing.js";
+import type * as utils_playerCounters from "../utils/playerCounters.js";
+import type * as utils_playerLookup from "../utils/playerLookup.js";
+import type * as utils_yearSummaries from "../utils/yearSummaries.js";
 
 /**
  * A utility for referencing Convex functions in your app's API.
@@ -62,9 +67,14 @@ declare const fullApi: ApiFromModules<{
   playerPhotos: typeof playerPhotos;
   playerProfessional: typeof playerProfessional;
   players: typeof players;
+  roundStats: typeof roundStats;
   tournamentResults: typeof tournamentResults;
   tournaments: typeof tournaments;
+  "utils/courseStatsAggregation": typeof utils_courseStatsAggregation;
   "utils/dataProcessing": typeof utils_dataProcessing;
+  "utils/playerCounters": typeof utils_playerCounters;
+  "utils/playerLookup": typeof utils_playerLookup;
+  "utils/yearSummaries": typeof utils_yearSummaries;
 }>;
 export declare const api: FilterApi<
   typeof fullApi,
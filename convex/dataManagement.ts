@@ -1,7 +1,88 @@
 import { mutation, query } from "./_generated/server";
 import { v } from "convex/values";
+import { Doc, Id, TableNames } from "./_generated/dataModel";
+import { DatabaseReader } from "./_generated/server";
+import { applyPlayerCounterDelta, clearPlayerCounts, deletePlayer, emptyCounts } from "./utils/playerCounters";
+import { YearDelta, addTournamentToYear, applyYearDeltas } from "./utils/yearSummaries";
 
 const BATCH_SIZE = 50; // Optimal batch size for Convex operations
+const MAX_CLEAR_BATCH = 500; // Rows deleted per clearTableBatch call, whatever the caller asks for
+const MAX_EXPORT_BATCH = 1000; // Rows returned per exportTablePage call
+const MAX_VALIDATE_BATCH = 1000; // Rows checked per validateTablePage call
+const MAX_ORPHAN_DELETE = 500; // Rows per deleteOrphanRows call
+
+// Tables the maintenance command clears page by page
+const clearableTable = v.union(
+  v.literal("pgaTournaments"),
+  v.literal("yearSummaries"),
+  v.literal("players"),
+  v.literal("playerStats"),
+  v.literal("tournamentResults"),
+  v.literal("roundStats"),
+  v.literal("playerCourseStats"),
+  v.literal("userFollows")
+);
+
+// Tables the export command snapshots for offline analysis
+const exportableTable = v.union(
+  v.literal("players"),
+  v.literal("tournamentResults"),
+  v.literal("pgaTournaments"),
+  v.literal("courses"),
+  v.literal("playerCourseStats")
+);
+
+// Tables the validate command checks, and the references checked for orphans
+const validatableTable = v.union(
+  v.literal("players"),
+  v.literal("tournamentResults"),
+  v.literal("playerStats"),
+  v.literal("userFollows"),
+  v.literal("playerCourseStats"),
+  v.literal("roundStats")
+);
+
+const REFERENCES: Record<string, string[]> = {
+  players: [],
+  tournamentResults: ["playerId"],
+  playerStats: ["playerId"],
+  userFollows: ["playerId"],
+  playerCourseStats: ["playerId", "courseId"],
+  roundStats: ["playerId", "courseId", "tournamentResultId"],
+};
+
+// Table each reference field points to
+const REFERENCED_TABLE: Record<string, TableNames> = {
+  playerId: "players",
+  courseId: "courses",
+  tournamentResultId: "tournamentResults",
+};
+
+function referenceKey(field: string, id: string): string {
+  return `${field}:${id}`;
+}
+
+// References (field:id keys) that no longer exist or are not IDs of the
+// field's table; each distinct reference is read once however many rows
+// point at it
+async function missingReferences(
+  db: DatabaseReader,
+  rows: Record<string, any>[],
+  fields: string[]
+): Promise<Set<string>> {
+  const refs = new Map<string, Id<TableNames> | null>();
+  for (const row of rows) {
+    for (const field of fields) {
+      if (row[field]) refs.set(referenceKey(field, row[field]), db.normalizeId(REFERENCED_TABLE[field], row[field]));
+    }
+  }
+  const keys = [...refs.keys()];
+  const docs = await Promise.all(keys.map((key) => {
+    const id = refs.get(key);
+    return id ? db.get(id) : null;
+  }));
+  return new Set(keys.filter((_, i) => !docs[i]));
+}
 
 // Unified clear database function with table options
 export const clearDatabase = mutation({
@@ -54,6 +135,7 @@ export const clearDatabase = mutation({
     // Clear specified tables
     if (tablesToClear.includes("all") || tablesToClear.includes("players")) {
       results.players = await clearTable("players");
+      await clearPlayerCounts(ctx.db);
     }
 
     if (tablesToClear.includes("all") || tablesToClear.includes("playerStats")) {
@@ -208,10 +290,12 @@ export const clearPlayersWithCascade = mutation({
     }
 
     // Finally, delete players
+    const playerCounts = emptyCounts();
     for (const player of players) {
-      await ctx.db.delete(player._id);
+      await deletePlayer(ctx.db, playerCounts, player);
       results.players++;
     }
+    await applyPlayerCounterDelta(ctx.db, playerCounts);
 
     return {
       success: true,
@@ -222,7 +306,189 @@ export const clearPlayersWithCascade = mutation({
   },
 });
 
-// Validate database integrity (PAGINATED)
+// Delete one page of a table (BOUNDED). The caller passes back the returned
+// cursor, so each call starts after the rows already deleted instead of
+// re-scanning them; player counters and year summaries are kept current.
+export const clearTableBatch = mutation({
+  args: {
+    table: clearableTable,
+    cursor: v.optional(v.union(v.string(), v.null())),
+    batchSize: v.optional(v.number()),
+  },
+  handler: async (ctx, args) => {
+    const batchSize = Math.min(args.batchSize || 200, MAX_CLEAR_BATCH);
+    const page = await ctx.db
+      .query(args.table)
+      .paginate({ cursor: args.cursor ?? null, numItems: batchSize });
+
+    if (args.table === "players") {
+      const playerCounts = emptyCounts();
+      for (const player of page.page as Doc<"players">[]) {
+        await deletePlayer(ctx.db, playerCounts, player);
+      }
+      await applyPlayerCounterDelta(ctx.db, playerCounts);
+    } else if (args.table === "pgaTournaments") {
+      const yearDeltas = new Map<number, YearDelta>();
+      for (const tournament of page.page as Doc<"pgaTournaments">[]) {
+        await ctx.db.delete(tournament._id);
+        addTournamentToYear(yearDeltas, tournament, -1);
+      }
+      await applyYearDeltas(ctx.db, yearDeltas);
+    } else {
+      for (const record of page.page) {
+        await ctx.db.delete(record._id);
+      }
+    }
+
+    return {
+      table: args.table,
+      deleted: page.page.length,
+      cursor: page.continueCursor,
+      hasMore: !page.isDone,
+    };
+  },
+});
+
+// One page of a table for the local snapshot export (PAGINATED), oldest
+// first. With `since`, only rows created after that _creationTime, so a
+// refresh reads just the new rows through the built-in creation-time index.
+export const exportTablePage = query({
+  args: {
+    table: exportableTable,
+    cursor: v.optional(v.union(v.string(), v.null())),
+    batchSize: v.optional(v.number()),
+    since: v.optional(v.number()),
+  },
+  handler: async (ctx, args) => {
+    const batchSize = Math.min(args.batchSize || 500, MAX_EXPORT_BATCH);
+    const page = await ctx.db
+      .query(args.table)
+      .withIndex("by_creation_time", (q) => q.gt("_creationTime", args.since ?? 0))
+      .paginate({ cursor: args.cursor ?? null, numItems: batchSize });
+
+    return {
+      table: args.table,
+      rows: page.page,
+      cursor: page.continueCursor,
+      hasMore: !page.isDone,
+    };
+  },
+});
+
+// Creation-time range of a table (BOUNDED: two index reads), which the
+// validate command splits into shards that are paged concurrently
+export const getTableTimeRange = query({
+  args: { table: validatableTable },
+  handler: async (ctx, args) => {
+    const first = await ctx.db.query(args.table).withIndex("by_creation_time").order("asc").first();
+    const last = await ctx.db.query(args.table).withIndex("by_creation_time").order("desc").first();
+    return {
+      table: args.table,
+      first: first?._creationTime ?? null,
+      last: last?._creationTime ?? null,
+    };
+  },
+});
+
+// Integrity facts for one page of one shard (PAGINATED). A shard is the rows
+// created in [from, to); the caller merges pages into a full report. Players
+// come back as compact rows for duplicate and ranking checks; other tables
+// report counts and the rows whose references are missing.
+export const validateTablePage = query({
+  args: {
+    table: validatableTable,
+    cursor: v.optional(v.union(v.string(), v.null())),
+    batchSize: v.optional(v.number()),
+    from: v.optional(v.number()),
+    to: v.optional(v.number()),
+  },
+  handler: async (ctx, args) => {
+    const batchSize = Math.min(args.batchSize || 500, MAX_VALIDATE_BATCH);
+    const page = await ctx.db
+      .query(args.table)
+      .withIndex("by_creation_time", (q) => {
+        const lower = q.gte("_creationTime", args.from ?? 0);
+        return args.to === undefined ? lower : lower.lt("_creationTime", args.to);
+      })
+      .paginate({ cursor: args.cursor ?? null, numItems: batchSize });
+    const rows = page.page as Record<string, any>[];
+
+    const counts: Record<string, number> = { rows: rows.length };
+    let players: { _id: string; name: string; espnId: string | null; country: string | null; worldRanking: number | null }[] = [];
+    let referencedPlayers: string[] = [];
+    if (args.table === "players") {
+      players = rows.map((p) => ({
+        _id: p._id,
+        name: p.name,
+        espnId: p.espnId ?? null,
+        country: p.country ?? null,
+        worldRanking: p.worldRanking ?? null,
+      }));
+    } else if (args.table === "tournamentResults") {
+      counts.withEarnings = rows.filter((r) => r.earnings !== undefined && r.earnings !== null && r.earnings > 0).length;
+      counts.withScores = rows.filter((r) => r.scores !== undefined && r.scores !== null).length;
+      // Lets the caller find players without results without a read per player
+      referencedPlayers = [...new Set(rows.map((r) => r.playerId as string))];
+    }
+
+    const fields = REFERENCES[args.table];
+    const missing = await missingReferences(ctx.db, rows, fields);
+    const orphans = rows
+      .map((row) => ({
+        _id: row._id as string,
+        missing: fields.filter((field) => missing.has(referenceKey(field, row[field]))),
+      }))
+      .filter((row) => row.missing.length > 0);
+
+    return {
+      table: args.table,
+      counts,
+      players,
+      referencedPlayers,
+      orphans,
+      cursor: page.continueCursor,
+      hasMore: !page.isDone,
+    };
+  },
+});
+
+// Delete rows the validate command found orphaned (BOUNDED). Each row's
+// references are checked again, so a row whose player has since been
+// re-imported is kept, as is any ID that is malformed or not from `table`.
+export const deleteOrphanRows = mutation({
+  args: {
+    table: validatableTable,
+    ids: v.array(v.string()),
+  },
+  handler: async (ctx, args) => {
+    if (args.table === "players") {
+      throw new Error("Players are not orphans; use players:deleteOrphanPlayers");
+    }
+    if (args.ids.length > MAX_ORPHAN_DELETE) {
+      throw new Error(`At most ${MAX_ORPHAN_DELETE} rows per call, got ${args.ids.length}`);
+    }
+
+    const docs = await Promise.all(args.ids.map((id) => {
+      const rowId = ctx.db.normalizeId(args.table, id);
+      return rowId ? ctx.db.get(rowId) : null;
+    }));
+    const rows = docs.filter((doc): doc is NonNullable<typeof doc> => doc !== null) as Record<string, any>[];
+    const fields = REFERENCES[args.table];
+    const missing = await missingReferences(ctx.db, rows, fields);
+
+    let deleted = 0;
+    for (const row of rows) {
+      if (fields.some((field) => missing.has(referenceKey(field, row[field])))) {
+        await ctx.db.delete(row._id);
+        deleted++;
+      }
+    }
+    return { table: args.table, deleted, kept: args.ids.length - deleted };
+  },
+});
+
+// Validate database integrity (PAGINATED). Only samples the first rows of
+// each table; `golfgod-import validate` checks every row.
 export const validateDatabase = query({
   args: {
     limit: v.optional(v.number()),
@@ -358,7 +624,8 @@ export const validateDatabase = query({
   },
 });
 
-// Clean up orphaned records (BATCHED)
+// Clean up orphaned records (BATCHED). For large tables use
+// `golfgod-import validate --cleanup`, which pages instead of re-scanning.
 export const cleanupOrphans = mutation({
   args: {
     batchSize: v.optional(v.number()),
@@ -1,5 +1,6 @@
 import { v } from "convex/values";
 import { mutation, query, internalMutation } from "./_generated/server";
+import { Doc, Id } from "./_generated/dataModel";
 import {
   parseCourseInfo,
   parseEarnings,
@@ -9,9 +10,18 @@ import {
   extractUniqueCourses,
   validateRounds,
   getCourseKey,
-  madeCut,
   parseDate,
 } from "./utils/dataProcessing";
+import { findPlayerByEspnId, normalizePlayerName } from "./utils/playerLookup";
+import { applyPlayerCounterDelta, emptyCounts, insertPlayer, patchPlayer } from "./utils/playerCounters";
+import {
+  CourseStatsDelta,
+  applyCourseStatsDelta,
+  emptyDelta,
+  mergeDeltas,
+  resultDelta,
+  statsFromDelta,
+} from "./utils/courseStatsAggregation";
 
 // Step 1: Import courses from master data
 export const importCourses = mutation({
@@ -143,10 +153,22 @@ export const createTournamentMappings = mutation({
   },
 });
 
+// Look up each distinct value once, concurrently; keys map to the same result
+async function lookupByKey<T>(
+  values: Map<string, string>,
+  lookup: (value: string) => Promise<T | null>
+): Promise<Map<string, T | null>> {
+  const distinct = [...new Set(values.values())];
+  const found = await Promise.all(distinct.map(lookup));
+  const byValue = new Map(distinct.map((value, i) => [value, found[i]]));
+  return new Map([...values].map(([key, value]) => [key, byValue.get(value) ?? null]));
+}
+
 // Step 3: Import tournament results (batched)
 export const importTournamentResultsBatch = mutation({
   args: {
     playerData: v.object({
+      playerId: v.optional(v.id("players")), // Resolved by the client; skips the lookup below
       player_id: v.string(),
       player_name: v.string(),
       espn_url: v.optional(v.string()),
@@ -158,12 +180,22 @@ export const importTournamentResultsBatch = mutation({
     let imported = 0;
     let skipped = 0;
     const errors: string[] = [];
+    const playerCounts = emptyCounts();
 
     // Find or create player
-    let player = await ctx.db
-      .query("players")
-      .filter((q) => q.eq(q.field("espnId"), args.playerData.player_id))
-      .first();
+    let player: Doc<"players"> | null;
+    if (args.playerData.playerId) {
+      player = await ctx.db.get(args.playerData.playerId);
+      if (!player) {
+        return { imported: 0, skipped: 0, errors: [`Player not found: ${args.playerData.playerId}`] };
+      }
+      if (!player.espnId) {
+        await patchPlayer(ctx.db, playerCounts, player, { espnId: args.playerData.player_id });
+        await applyPlayerCounterDelta(ctx.db, playerCounts);
+      }
+    } else {
+      player = await findPlayerByEspnId(ctx.db, args.playerData.player_id);
+    }
 
     if (!player) {
       // Try by name
@@ -175,12 +207,13 @@ export const importTournamentResultsBatch = mutation({
       if (byName) {
         player = byName;
         // Update ESPN ID
-        await ctx.db.patch(byName._id, { espnId: args.playerData.player_id });
+        await patchPlayer(ctx.db, playerCounts, byName, { espnId: args.playerData.player_id });
       } else {
         // Create new player
         const nameParts = args.playerData.player_name.split(" ");
-        const playerId = await ctx.db.insert("players", {
+        const playerId = await insertPlayer(ctx.db, playerCounts, {
           name: args.playerData.player_name,
+          normalizedName: normalizePlayerName(args.playerData.player_name),
           firstName: nameParts[0],
           lastName: nameParts.slice(1).join(" "),
           country: "Unknown",
@@ -190,22 +223,41 @@ export const importTournamentResultsBatch = mutation({
 
         player = await ctx.db.get(playerId);
       }
+      await applyPlayerCounterDelta(ctx.db, playerCounts);
     }
 
     if (!player) {
       return { imported: 0, skipped: 0, errors: ["Failed to create/find player"] };
     }
 
+    // Per-course aggregate deltas, applied once after all results are inserted
+    const courseDeltas = new Map<Id<"courses">, { course: Doc<"courses">; delta: CourseStatsDelta }>();
+
+    // Resolve each distinct course and each year's existing results once per
+    // batch instead of once per tournament row
+    const tournaments = args.playerData.tournaments;
+    // Keyed by the exact course name, as stored on each result and matched by
+    // recomputeDelta; a normalized key would merge distinct courses' deltas
+    const courseNames = tournaments.map((t) => parseCourseInfo(t.course_name || "").name);
+    const courses = await lookupByKey(new Map(courseNames.map((name) => [name, name])), (name) =>
+      ctx.db.query("courses").withIndex("by_name", (q) => q.eq("name", name)).first()
+    );
+    const years = [...new Set<number>(tournaments.map((t) => t.year))];
+    const existingByYear = await Promise.all(
+      years.map((year) =>
+        ctx.db
+          .query("tournamentResults")
+          .withIndex("by_player_year", (q) => q.eq("playerId", player!._id).eq("year", year))
+          .collect()
+      )
+    );
+    // "year|tournament" of every stored result, plus the ones this batch inserts
+    const existingKeys = new Set(existingByYear.flat().map((r) => `${r.year}|${r.tournament}`));
+
     // Import each tournament
-    for (const tournament of args.playerData.tournaments) {
+    for (const [i, tournament] of tournaments.entries()) {
       try {
-        // Find course
-        const courseInfo = parseCourseInfo(tournament.course_name || "");
-        const course = await ctx.db
-          .query("courses")
-          .withIndex("by_name", (q) => q.eq("name", courseInfo.name))
-          .first();
-
+        const course = courses.get(courseNames[i]);
         if (!course) {
           errors.push(`Course not found for tournament: ${tournament.tournament_name}`);
           skipped++;
@@ -213,18 +265,12 @@ export const importTournamentResultsBatch = mutation({
         }
 
         // Check if result already exists
-        const existing = await ctx.db
-          .query("tournamentResults")
-          .withIndex("by_player_year", (q) =>
-            q.eq("playerId", player!._id).eq("year", tournament.year)
-          )
-          .filter((q) => q.eq(q.field("tournament"), tournament.tournament_name))
-          .first();
-
-        if (existing) {
+        const resultKey = `${tournament.year}|${tournament.tournament_name}`;
+        if (existingKeys.has(resultKey)) {
           skipped++;
           continue;
         }
+        existingKeys.add(resultKey);
 
         // Validate and clean data
         const rounds = validateRounds(tournament.rounds || []);
@@ -234,7 +280,7 @@ export const importTournamentResultsBatch = mutation({
         const totalScore = parseTotalScore(tournament.total_score);
 
         // Insert tournament result
-        await ctx.db.insert("tournamentResults", {
+        const resultId = await ctx.db.insert("tournamentResults", {
           playerId: player._id,
           playerName: args.playerData.player_name,
           year: tournament.year,
@@ -252,16 +298,15 @@ export const importTournamentResultsBatch = mutation({
 
         imported++;
 
+        const delta = resultDelta({ year: tournament.year, position, scores: rounds.map(String), earnings });
+        const pending = courseDeltas.get(course._id);
+        courseDeltas.set(course._id, {
+          course,
+          delta: pending ? mergeDeltas(pending.delta, delta) : delta,
+        });
+
         // Create round stats if we have round data
         if (rounds.length > 0) {
-          const resultId = (await ctx.db
-            .query("tournamentResults")
-            .withIndex("by_player_year", (q) =>
-              q.eq("playerId", player!._id).eq("year", tournament.year)
-            )
-            .filter((q) => q.eq(q.field("tournament"), tournament.tournament_name))
-            .first())!._id;
-
           for (let i = 0; i < rounds.length; i++) {
             await ctx.db.insert("roundStats", {
               playerId: player._id,
@@ -280,10 +325,22 @@ export const importTournamentResultsBatch = mutation({
       }
     }
 
+    // Update only the (player, course) aggregates this batch touched
+    let aggregateWrites = 0;
+    for (const { course, delta } of courseDeltas.values()) {
+      try {
+        await applyCourseStatsDelta(ctx.db, player._id, course, delta, true);
+        aggregateWrites++;
+      } catch (error) {
+        errors.push(`Failed to update course stats for ${course.name}: ${error}`);
+      }
+    }
+
     return {
       imported,
       skipped,
       errors,
+      aggregateWrites,
       playerName: args.playerData.player_name,
       playerId: player._id,
     };
@@ -334,81 +391,12 @@ export const calculatePlayerCourseStats = mutation({
 
         if (!course) continue;
 
-        // Calculate aggregated stats
-        let totalStrokes = 0;
-        let totalRounds = 0;
-        let bestScore = Infinity;
-        let worstScore = -Infinity;
-        let cutsPlayed = 0;
-        let cutsMade = 0;
-        let wins = 0;
-        let top10s = 0;
-        let top25s = 0;
-        let totalEarnings = 0;
-
-        const r1Scores: number[] = [];
-        const r2Scores: number[] = [];
-        const r3Scores: number[] = [];
-        const r4Scores: number[] = [];
-
-        for (const result of courseResultsList) {
-          cutsPlayed++;
-
-          if (result.scores) {
-            const madeTheCut = madeCut(result.position, result.scores.map(s => parseInt(s)));
-            if (madeTheCut) cutsMade++;
-
-            result.scores.forEach((score, index) => {
-              const scoreNum = parseInt(score);
-              if (!isNaN(scoreNum)) {
-                totalStrokes += scoreNum;
-                totalRounds++;
-
-                if (scoreNum < bestScore) bestScore = scoreNum;
-                if (scoreNum > worstScore) worstScore = scoreNum;
-
-                if (index === 0) r1Scores.push(scoreNum);
-                else if (index === 1) r2Scores.push(scoreNum);
-                else if (index === 2) r3Scores.push(scoreNum);
-                else if (index === 3) r4Scores.push(scoreNum);
-              }
-            });
-          }
-
-          const posNum = parseInt(result.position.replace(/[^0-9]/g, ''));
-          if (!isNaN(posNum)) {
-            if (posNum === 1) wins++;
-            if (posNum <= 10) top10s++;
-            if (posNum <= 25) top25s++;
-          }
-
-          if (result.earnings) totalEarnings += result.earnings;
-        }
-
-        const scoringAverage = totalRounds > 0 ? totalStrokes / totalRounds : 0;
-        const avg = (arr: number[]) => arr.length > 0 ? arr.reduce((a, b) => a + b, 0) / arr.length : undefined;
-
+        // Full recompute from the same running sums the import path maintains
+        const totals = courseResultsList.map(resultDelta).reduce(mergeDeltas, emptyDelta());
         const stats = {
           playerId: player._id,
           courseId: course._id,
-          roundsPlayed: totalRounds,
-          scoringAverage,
-          bestScore: bestScore === Infinity ? 0 : bestScore,
-          worstScore: worstScore === -Infinity ? 0 : worstScore,
-          cutsPlayed,
-          cutsMade,
-          wins,
-          top10s,
-          top25s,
-          totalEarnings,
-          avgR1Score: avg(r1Scores),
-          avgR2Score: avg(r2Scores),
-          avgR3Score: avg(r3Scores),
-          avgR4Score: avg(r4Scores),
-          avgEarlyScore: avg([...r1Scores, ...r2Scores]),
-          avgWeekendScore: avg([...r3Scores, ...r4Scores]),
-          lastUpdated: Date.now(),
-          lastTournamentYear: Math.max(...courseResultsList.map(r => r.year)),
+          ...statsFromDelta(totals),
         };
 
         // Check if stats exist
@@ -1,5 +1,13 @@
 import { mutation, query } from "./_generated/server";
 import { v } from "convex/values";
+import { findPlayerByName, normalizePlayerName } from "./utils/playerLookup";
+import {
+  applyPlayerCounterDelta,
+  emptyCounts,
+  insertPlayer,
+  patchPlayer,
+  readPlayerCounts,
+} from "./utils/playerCounters";
 
 // Mutation to update a single player with photo data
 export const updatePlayerPhoto = mutation({
@@ -10,27 +18,18 @@ export const updatePlayerPhoto = mutation({
     worldRank: v.number(),
   },
   handler: async (ctx, args) => {
-    // Normalize the name for matching (handle case variations)
-    const normalizedInputName = args.playerName.toLowerCase().trim();
-
-    // Try to find player by name
-    const players = await ctx.db
-      .query("players")
-      .collect();
-
-    // Find matching player (case-insensitive)
-    const matchingPlayer = players.find(p =>
-      p.name.toLowerCase() === normalizedInputName ||
-      p.name.toLowerCase().replace(/\s+/g, " ") === normalizedInputName.replace(/\s+/g, " ")
-    );
+    // Find player by exact or normalized name (handles case/spacing variations)
+    const matchingPlayer = await findPlayerByName(ctx.db, args.playerName.trim());
+    const playerCounts = emptyCounts();
 
     if (matchingPlayer) {
       // Update existing player
-      await ctx.db.patch(matchingPlayer._id, {
+      await patchPlayer(ctx.db, playerCounts, matchingPlayer, {
         espnId: args.espnId,
         photoUrl: args.photoUrl,
         worldRanking: args.worldRank,
       });
+      await applyPlayerCounterDelta(ctx.db, playerCounts);
 
       return {
         success: true,
@@ -44,8 +43,9 @@ export const updatePlayerPhoto = mutation({
       const firstName = nameParts[0] || "";
       const lastName = nameParts.slice(1).join(" ") || "";
 
-      const newPlayerId = await ctx.db.insert("players", {
+      const newPlayerId = await insertPlayer(ctx.db, playerCounts, {
         name: args.playerName.trim(),
+        normalizedName: normalizePlayerName(args.playerName),
         firstName,
         lastName,
         country: "United States", // Default, can be updated later
@@ -54,6 +54,7 @@ export const updatePlayerPhoto = mutation({
         photoUrl: args.photoUrl,
         worldRanking: args.worldRank,
       });
+      await applyPlayerCounterDelta(ctx.db, playerCounts);
 
       return {
         success: true,
@@ -78,29 +79,16 @@ export const updatePlayerPhotosBatch = mutation({
   handler: async (ctx, args) => {
     const results = [];
     const errors = [];
-
-    // Get all existing players for efficient matching
-    const existingPlayers = await ctx.db
-      .query("players")
-      .collect();
-
-    // Create a map for faster lookups
-    const playerMap = new Map<string, typeof existingPlayers[0]>();
-    existingPlayers.forEach(player => {
-      playerMap.set(player.name.toLowerCase(), player);
-    });
+    const playerCounts = emptyCounts();
 
     for (const playerData of args.players) {
       try {
-        const normalizedInputName = playerData.playerName.toLowerCase().trim();
-        const existingPlayer = playerMap.get(normalizedInputName) ||
-          Array.from(playerMap.values()).find(p =>
-            p.name.toLowerCase().replace(/\s+/g, " ") === normalizedInputName.replace(/\s+/g, " ")
-          );
+        // Indexed lookup by exact or normalized name instead of scanning all players
+        const existingPlayer = await findPlayerByName(ctx.db, playerData.playerName.trim());
 
         if (existingPlayer) {
           // Update existing player
-          await ctx.db.patch(existingPlayer._id, {
+          await patchPlayer(ctx.db, playerCounts, existingPlayer, {
             espnId: playerData.espnId,
             photoUrl: playerData.photoUrl,
             worldRanking: playerData.worldRank,
@@ -118,8 +106,9 @@ export const updatePlayerPhotosBatch = mutation({
           const firstName = nameParts[0] || "";
           const lastName = nameParts.slice(1).join(" ") || "";
 
-          await ctx.db.insert("players", {
+          await insertPlayer(ctx.db, playerCounts, {
             name: playerData.playerName.trim(),
+            normalizedName: normalizePlayerName(playerData.playerName),
             firstName,
             lastName,
             country: "United States",
@@ -144,6 +133,7 @@ export const updatePlayerPhotosBatch = mutation({
       }
     }
 
+    await applyPlayerCounterDelta(ctx.db, playerCounts);
     return {
       processed: results.length,
       updated: results.filter(r => r.action === "updated").length,
@@ -155,23 +145,65 @@ export const updatePlayerPhotosBatch = mutation({
   },
 });
 
+// ID-addressed photo patches (player IDs come from players.resolvePlayers)
+export const updatePlayerPhotosById = mutation({
+  args: {
+    players: v.array(v.object({
+      playerId: v.id("players"),
+      espnId: v.string(),
+      photoUrl: v.string(),
+      worldRank: v.number(),
+    })),
+  },
+  handler: async (ctx, args) => {
+    let updated = 0;
+    const errors = [];
+    const playerCounts = emptyCounts();
+
+    for (const playerData of args.players) {
+      try {
+        const player = await ctx.db.get(playerData.playerId);
+        if (!player) throw new Error(`Player not found: ${playerData.playerId}`);
+        await patchPlayer(ctx.db, playerCounts, player, {
+          espnId: playerData.espnId,
+          photoUrl: playerData.photoUrl,
+          worldRanking: playerData.worldRank,
+        });
+        updated++;
+      } catch (error) {
+        errors.push({
+          playerId: playerData.playerId,
+          error: error instanceof Error ? error.message : String(error),
+        });
+      }
+    }
+
+    await applyPlayerCounterDelta(ctx.db, playerCounts);
+    return {
+      processed: updated,
+      updated,
+      created: 0,
+      errors: errors.length,
+      errorDetails: errors,
+    };
+  },
+});
+
 // Query to check the status of player photos
+// (BOUNDED: one read of the maintained counters; null until they are seeded)
 export const getPhotoUpdateStatus = query({
   handler: async (ctx) => {
-    const players = await ctx.db.query("players").collect();
-
-    const withPhotos = players.filter(p => p.photoUrl && p.photoUrl.length > 0);
-    const withEspnId = players.filter(p => p.espnId && p.espnId.length > 0);
-    const withWorldRanking = players.filter(p => p.worldRanking !== undefined && p.worldRanking !== null);
+    const counts = await readPlayerCounts(ctx.db);
+    if (!counts) return null;
 
     return {
-      totalPlayers: players.length,
-      playersWithPhotos: withPhotos.length,
-      playersWithEspnId: withEspnId.length,
-      playersWithWorldRanking: withWorldRanking.length,
-      missingPhotos: players.length - withPhotos.length,
-      missingEspnId: players.length - withEspnId.length,
-      missingWorldRanking: players.length - withWorldRanking.length,
+      totalPlayers: counts.total,
+      playersWithPhotos: counts.withPhoto,
+      playersWithEspnId: counts.withEspnId,
+      playersWithWorldRanking: counts.withWorldRanking,
+      missingPhotos: counts.total - counts.withPhoto,
+      missingEspnId: counts.total - counts.withEspnId,
+      missingWorldRanking: counts.total - counts.withWorldRanking,
     };
   },
 });
\ No newline at end of file
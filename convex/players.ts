@@ -1,6 +1,15 @@
 import { v } from "convex/values";
 import { query, mutation } from "./_generated/server";
 import { getAuthUserId } from "@convex-dev/auth/server";
+import { findPlayer, normalizePlayerName } from "./utils/playerLookup";
+import {
+  addPlayerCountsPage,
+  applyPlayerCounterDelta,
+  deletePlayer,
+  emptyCounts,
+  patchPlayer,
+  readPlayerCounts,
+} from "./utils/playerCounters";
 
 // Get all players for dropdown selection (PAGINATED)
 export const getAllPlayers = query({
@@ -70,6 +79,101 @@ export const getAllPlayerNamesAndIds = query({
   },
 });
 
+// Page through the roster (id, name, ESPN ID) for client-side identity resolution
+export const getPlayerRosterPage = query({
+  args: {
+    cursor: v.optional(v.union(v.string(), v.null())),
+    batchSize: v.optional(v.number()),
+  },
+  handler: async (ctx, args) => {
+    const batchSize = Math.min(args.batchSize || 500, 1000);
+    const page = await ctx.db
+      .query("players")
+      .paginate({ cursor: args.cursor ?? null, numItems: batchSize });
+
+    return {
+      players: page.page.map(player => ({
+        _id: player._id,
+        name: player.name,
+        espnId: player.espnId,
+      })),
+      cursor: page.continueCursor,
+      hasMore: !page.isDone,
+    };
+  },
+});
+
+// Resolve many players to document IDs in one call (by ESPN ID, then name)
+// Import scripts call this once per run and then send ID-addressed patches.
+export const resolvePlayers = query({
+  args: {
+    players: v.array(v.object({
+      espnId: v.optional(v.string()),
+      name: v.optional(v.string()),
+    })),
+  },
+  handler: async (ctx, args) => {
+    if (args.players.length > 500) {
+      throw new Error("resolvePlayers accepts at most 500 players per call");
+    }
+
+    return await Promise.all(
+      args.players.map(async (entry) => {
+        const { player, matchedBy } = await findPlayer(ctx.db, entry.espnId, entry.name);
+        return {
+          espnId: entry.espnId,
+          name: entry.name,
+          playerId: player?._id ?? null,
+          matchedBy,
+        };
+      })
+    );
+  },
+});
+
+// Whether any player still lacks normalizedName (BOUNDED: one read).
+// Importers backfill before their first name lookup while `pending` is true.
+export const getNameIndexStatus = query({
+  args: {},
+  handler: async (ctx) => {
+    const unnormalized = await ctx.db
+      .query("players")
+      .withIndex("by_normalized_name", (q) => q.eq("normalizedName", undefined))
+      .first();
+    return { pending: unnormalized !== null };
+  },
+});
+
+// Backfill normalizedName for players created before the index existed (BATCHED)
+export const backfillNormalizedNames = mutation({
+  args: {
+    cursor: v.optional(v.union(v.string(), v.null())),
+    batchSize: v.optional(v.number()),
+  },
+  handler: async (ctx, args) => {
+    const batchSize = Math.min(args.batchSize || 100, 200);
+    const page = await ctx.db
+      .query("players")
+      .paginate({ cursor: args.cursor ?? null, numItems: batchSize });
+
+    let updated = 0;
+    for (const player of page.page) {
+      const normalizedName = normalizePlayerName(player.name);
+      if (player.normalizedName !== normalizedName) {
+        await ctx.db.patch(player._id, { normalizedName });
+        updated++;
+      }
+    }
+
+    return {
+      updated,
+      processed: page.page.length,
+      cursor: page.continueCursor,
+      hasMore: !page.isDone,
+    };
+  },
+});
+
 // Get single player details by ID
 export const getPlayer = query({
   args: {
@@ -238,7 +342,12 @@ export const updatePlayerBio = mutation({
       }
     }
 
-    await ctx.db.patch(playerId, cleanUpdateData);
+    const player = await ctx.db.get(playerId);
+    if (!player) throw new Error(`Player not found: ${playerId}`);
+
+    const playerCounts = emptyCounts();
+    await patchPlayer(ctx.db, playerCounts, player, cleanUpdateData);
+    await applyPlayerCounterDelta(ctx.db, playerCounts);
     return { success: true };
   },
 });
@@ -248,6 +357,7 @@ export const cleanupPlayerData = mutation({
   handler: async (ctx) => {
     const players = await ctx.db.query("players").collect();
     let updated = 0;
+    const playerCounts = emptyCounts();
 
     for (const player of players) {
       const updates: any = {};
@@ -263,16 +373,18 @@ export const cleanupPlayerData = mutation({
       }
 
       if (Object.keys(updates).length > 0) {
-        await ctx.db.patch(player._id, updates);
+        await patchPlayer(ctx.db, playerCounts, player, updates);
         updated++;
       }
     }
 
+    await applyPlayerCounterDelta(ctx.db, playerCounts);
     return { playersUpdated: updated };
   },
 });
 
-// Find players with incomplete data (OPTIMIZED - Paginated)
+// Find players with incomplete data (OPTIMIZED - Paginated). Looks at the
+// first `limit` players only; `golfgod-import validate` covers every player.
 export const findOrphanPlayers = query({
   args: {
     limit: v.optional(v.number()),
@@ -320,6 +432,7 @@ export const deleteOrphanPlayers = mutation({
     const batchSize = Math.min(args.batchSize || 50, 100);
     const allPlayers = await ctx.db.query("players").take(batchSize);
     let deleted = 0;
+    const playerCounts = emptyCounts();
 
     for (const player of allPlayers) {
       // Check if player has any tournament results (just check first one)
@@ -330,11 +443,12 @@ export const deleteOrphanPlayers = mutation({
 
       // Delete if no results and either no espnId or country is "Unknown"
       if (!hasResults && (!player.espnId || player.country === "Unknown")) {
-        await ctx.db.delete(player._id);
+        await deletePlayer(ctx.db, playerCounts, player);
         deleted++;
       }
     }
 
+    await applyPlayerCounterDelta(ctx.db, playerCounts);
     return {
       deleted,
       message: `Deleted ${deleted} orphan players (processed ${batchSize} players)`,
@@ -354,16 +468,19 @@ export const deleteDuplicatePlayersWithoutEspnId = mutation({
 
     let deleted = 0;
     const deletedPlayers: string[] = [];
+    const playerCounts = emptyCounts();
 
     for (const player of allPlayers) {
       // Only delete players without ESPN ID
       if (!player.espnId) {
-        await ctx.db.delete(player._id);
+        await deletePlayer(ctx.db, playerCounts, player);
         deleted++;
         deletedPlayers.push(player.name);
       }
     }
 
+    await applyPlayerCounterDelta(ctx.db, playerCounts);
+
     return {
       deleted,
       deletedPlayers,
@@ -376,7 +493,10 @@ export const deleteDuplicatePlayersWithoutEspnId = mutation({
 export const getPlayerCount = query({
   args: {},
   handler: async (ctx) => {
-    // Use collect on small table (200 players with index is safe)
+    const counts = await readPlayerCounts(ctx.db);
+    if (counts) return { count: counts.total };
+
+    // Counters not seeded yet: fall back to counting the table
     const players = await ctx.db
       .query("players")
       .withIndex("by_name")
@@ -384,4 +504,38 @@ export const getPlayerCount = query({
 
     return { count: players.length };
   },
-});
\ No newline at end of file
+});
+
+// Completeness counters (photos, ESPN IDs, rankings, bio fields) in one read;
+// null until the rebuildPlayerCounters backfill seeds them
+export const getPlayerCounters = query({
+  args: {},
+  handler: async (ctx) => {
+    return await readPlayerCounts(ctx.db);
+  },
+});
+
+// Recount every player into the counters, one page per call (BATCHED). Seeds
+// them the first time and repairs them after bulk edits made outside these
+// mutations; the first page (no cursor) resets the counters, so run it to
+// the end with no imports writing players in the meantime.
+export const rebuildPlayerCounters = mutation({
+  args: {
+    cursor: v.optional(v.union(v.string(), v.null())),
+    batchSize: v.optional(v.number()),
+  },
+  handler: async (ctx, args) => {
+    const batchSize = Math.min(args.batchSize || 500, 1000);
+    const page = await ctx.db
+      .query("players")
+      .paginate({ cursor: args.cursor ?? null, numItems: batchSize });
+
+    await addPlayerCountsPage(ctx.db, page.page, !args.cursor);
+
+    return {
+      processed: page.page.length,
+      cursor: page.continueCursor,
+      hasMore: !page.isDone,
+    };
+  },
+});
@@ -0,0 +1,157 @@
+/**
+ * Round-level stats: bulk import support for scripts/golfgod_import/rounds.py
+ *
+ * roundStats holds ~4 rows per tournament result, so it is loaded in bulk:
+ * the import script pages down a key map of every result once, computes
+ * toPar locally, and sends one payload per result carrying all its rounds.
+ */
+
+import { v } from "convex/values";
+import { mutation, query } from "./_generated/server";
+import { Id } from "./_generated/dataModel";
+
+const MAX_RESULTS_PER_BATCH = 200;
+
+const roundFields = v.object({
+  round: v.number(),
+  score: v.number(),
+  toPar: v.number(),
+  teeTime: v.optional(v.string()),
+  fairwaysHit: v.optional(v.number()),
+  fairwaysPossible: v.optional(v.number()),
+  greensHit: v.optional(v.number()),
+  greensPossible: v.optional(v.number()),
+  putts: v.optional(v.number()),
+  scrambling: v.optional(v.string()),
+  sandSaves: v.optional(v.string()),
+  birdies: v.optional(v.number()),
+  pars: v.optional(v.number()),
+  bogeys: v.optional(v.number()),
+  doubleBogeys: v.optional(v.number()),
+  eagles: v.optional(v.number()),
+  sgTotal: v.optional(v.number()),
+  sgOtt: v.optional(v.number()),
+  sgApp: v.optional(v.number()),
+  sgArg: v.optional(v.number()),
+  sgPutt: v.optional(v.number()),
+  windSpeed: v.optional(v.number()),
+  temperature: v.optional(v.number()),
+  conditions: v.optional(v.string()),
+});
+
+// One page of the (ESPN ID, year, tournament) → result key map (PAGINATED).
+// Each distinct course and player on the page is read once.
+export const getRoundStatsKeyPage = query({
+  args: {
+    cursor: v.optional(v.union(v.string(), v.null())),
+    batchSize: v.optional(v.number()),
+  },
+  handler: async (ctx, args) => {
+    const batchSize = Math.min(args.batchSize || 500, 1000);
+    const page = await ctx.db
+      .query("tournamentResults")
+      .paginate({ cursor: args.cursor ?? null, numItems: batchSize });
+
+    const courseNames = [...new Set(page.page.map((r) => r.course).filter((c): c is string => !!c))];
+    const courses = await Promise.all(
+      courseNames.map((name) =>
+        ctx.db.query("courses").withIndex("by_name", (q) => q.eq("name", name)).first()
+      )
+    );
+    const courseByName = new Map(courseNames.map((name, i) => [name, courses[i]]));
+
+    const playerIds = [...new Set(page.page.map((r) => r.playerId))];
+    const players = await Promise.all(playerIds.map((id) => ctx.db.get(id)));
+    const espnById = new Map(playerIds.map((id, i) => [id, players[i]?.espnId ?? null]));
+
+    return {
+      results: page.page.map((r) => {
+        const course = r.course ? courseByName.get(r.course) : null;
+        return {
+          _id: r._id,
+          playerId: r.playerId,
+          espnId: espnById.get(r.playerId) ?? null,
+          year: r.year,
+          tournament: r.tournament,
+          courseId: course?._id ?? null,
+          par: course?.par ?? null,
+        };
+      }),
+      cursor: page.continueCursor,
+      hasMore: !page.isDone,
+    };
+  },
+});
+
+// Upsert every round of many tournament results (BOUNDED: one index read per
+// distinct result). Rows are keyed by (tournamentResultId, round), so
+// re-sending a result, or one split across two batches, patches in place.
+export const importRoundStatsBatch = mutation({
+  args: {
+    results: v.array(
+      v.object({
+        tournamentResultId: v.id("tournamentResults"),
+        playerId: v.id("players"),
+        courseId: v.id("courses"),
+        year: v.number(),
+        rounds: v.array(roundFields),
+      })
+    ),
+  },
+  handler: async (ctx, args) => {
+    if (args.results.length > MAX_RESULTS_PER_BATCH) {
+      throw new Error(`At most ${MAX_RESULTS_PER_BATCH} results per batch, got ${args.results.length}`);
+    }
+
+    let inserted = 0;
+    let updated = 0;
+    const errors: string[] = [];
+    const failedResults = new Set<Id<"tournamentResults">>();
+
+    // Existing rows of each distinct result, read once; inserts are added so a
+    // result sent twice in one batch still patches instead of duplicating
+    const resultIds = [...new Set(args.results.map((r) => r.tournamentResultId))];
+    const existing = await Promise.all(
+      resultIds.map((id) =>
+        ctx.db
+          .query("roundStats")
+          .withIndex("by_tournament_result", (q) => q.eq("tournamentResultId", id))
+          .collect()
+      )
+    );
+    const byResult = new Map(
+      resultIds.map((id, i) => [
+        id,
+        new Map<number, Id<"roundStats">>(existing[i].map((row) => [row.round, row._id])),
+      ])
+    );
+
+    for (const result of args.results) {
+      const byRound = byResult.get(result.tournamentResultId)!;
+      for (const round of result.rounds) {
+        try {
+          const fields = {
+            ...round,
+            playerId: result.playerId,
+            courseId: result.courseId,
+            tournamentResultId: result.tournamentResultId,
+            year: result.year,
+          };
+          const current = byRound.get(round.round);
+          if (current) {
+            await ctx.db.patch(current, fields);
+            updated++;
+          } else {
+            byRound.set(round.round, await ctx.db.insert("roundStats", fields));
+            inserted++;
+          }
+        } catch (error) {
+          errors.push(`Failed to import round ${round.round} of ${result.tournamentResultId}: ${error}`);
+          failedResults.add(result.tournamentResultId);
+        }
+      }
+    }
+
+    return { inserted, updated, rounds: inserted + updated, errors, failedResults: [...failedResults] };
+  },
+});
@@ -26,9 +26,12 @@ export default defineSchema({
     worldRanking: v.optional(v.number()),
     tourRanking: v.optional(v.number()),
     espnId: v.optional(v.string()),
+    normalizedName: v.optional(v.string()), // Lowercased, accent/punctuation-free name for lookups
   })
     .index("by_name", ["name"])
     .index("by_world_ranking", ["worldRanking"])
+    .index("by_espn_id", ["espnId"])
+    .index("by_normalized_name", ["normalizedName"])
     .searchIndex("search_name", {
       searchField: "name",
     }),
@@ -191,12 +194,52 @@ export default defineSchema({
     previous_winner_name: v.optional(v.string()), // Previous winner's name
     previous_winner_espn_id: v.optional(v.number()), // Previous winner's ESPN ID
     previous_winner_profile_url: v.optional(v.string()), // Previous winner's profile URL
+    searchText: v.optional(v.string()),   // Name and winner name, for search_text
   })
     .index("by_year", ["year"])
     .index("by_winner", ["winner_espn_id"])
     .index("by_tournament_id", ["tournament_id"])
     .index("by_year_and_name", ["year", "name"])
-    .index("by_status", ["status"]),
+    .index("by_status", ["status"])
+    .searchIndex("search_text", {
+      searchField: "searchText",
+      filterFields: ["year"],
+    }),
+
+  // Per-year tournament totals, maintained by the tournament mutations
+  yearSummaries: defineTable({
+    year: v.number(),
+    totalTournaments: v.number(),
+    completedTournaments: v.number(),
+    totalPrizeMoney: v.number(),           // Completed tournaments only
+    uniqueWinners: v.number(),
+    winnerCounts: v.array(v.object({       // Completed wins per winner, so removals stay exact
+      espnId: v.number(),
+      wins: v.number(),
+    })),
+    lastUpdated: v.number(),
+  })
+    .index("by_year", ["year"]),
+
+  // Player completeness counters maintained on every player write
+  // (see convex/utils/playerCounters.ts); readers sum the shards
+  playerCounters: defineTable({
+    shard: v.number(),
+    total: v.number(),
+    withPhoto: v.number(),
+    withEspnId: v.number(),
+    withWorldRanking: v.number(),
+    withBirthDate: v.number(),
+    withBirthPlace: v.number(),
+    withCollege: v.number(),
+    withHeight: v.number(),
+    withWeight: v.number(),
+    withTurnedPro: v.number(),
+    withSwing: v.number(),
+    completeBio: v.number(),             // All bio fields but college present
+    lastUpdated: v.number(),
+  })
+    .index("by_shard", ["shard"]),
 
   // Golf Courses table
   courses: defineTable({
@@ -254,6 +297,10 @@ export default defineSchema({
     avgR4Score: v.optional(v.number()),
     avgEarlyScore: v.optional(v.number()),    // R1+R2 average
     avgWeekendScore: v.optional(v.number()),  // R3+R4 average
+    // Running sums for incremental aggregation
+    totalStrokes: v.optional(v.number()),
+    roundSums: v.optional(v.array(v.number())),    // R1-R4 stroke sums
+    roundCounts: v.optional(v.array(v.number())),  // R1-R4 rounds counted
     // Advanced stats (when available)
     avgDrivingDistance: v.optional(v.number()),
     avgDrivingAccuracy: v.optional(v.number()),
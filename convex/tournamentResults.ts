@@ -1,5 +1,7 @@
 import { v } from "convex/values";
 import { mutation, query } from "./_generated/server";
+import { normalizePlayerName } from "./utils/playerLookup";
+import { applyPlayerCounterDelta, emptyCounts, insertPlayer } from "./utils/playerCounters";
 
 // Clear all tournament results
 export const clearAllResults = mutation({
@@ -90,6 +92,7 @@ export const importBatchResultsJSON = mutation({
   args: {
     players: v.array(
       v.object({
+        playerId: v.optional(v.id("players")), // Resolved by the client; skips the name search
         playerName: v.string(),
         years: v.array(
           v.object({
@@ -119,18 +122,18 @@ export const importBatchResultsJSON = mutation({
     for (const playerData of args.players) {
       try {
         // Find the player
-        const players = await ctx.db
-          .query("players")
-          .withSearchIndex("search_name", (q) => q.search("name", playerData.playerName))
-          .take(1);
-
-        if (players.length === 0) {
+        const player = playerData.playerId
+          ? await ctx.db.get(playerData.playerId)
+          : (await ctx.db
+              .query("players")
+              .withSearchIndex("search_name", (q) => q.search("name", playerData.playerName))
+              .first());
+
+        if (!player) {
           summary.errors.push(`Player not found: ${playerData.playerName}`);
           continue;
         }
 
-        const player = players[0];
-
         // Import their results
         for (const yearData of playerData.years) {
           for (const tournament of yearData.tournaments) {
@@ -223,6 +226,7 @@ export const importTournamentResults = mutation({
       failed: 0,
       errors: [] as string[],
     };
+    const playerCounts = emptyCounts();
 
     for (const result of args.results) {
       try {
@@ -242,8 +246,9 @@ export const importTournamentResults = mutation({
           const firstName = nameParts[0];
           const lastName = nameParts.slice(1).join(" ");
 
-          playerId = await ctx.db.insert("players", {
+          playerId = await insertPlayer(ctx.db, playerCounts, {
             name: result.name,
+            normalizedName: normalizePlayerName(result.name),
             firstName,
             lastName,
             country: "Unknown",
@@ -275,6 +280,7 @@ export const importTournamentResults = mutation({
       }
     }
 
+    await applyPlayerCounterDelta(ctx.db, playerCounts);
     return importResults;
   },
 });
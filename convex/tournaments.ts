@@ -1,35 +1,70 @@
 import { v } from "convex/values";
+import { Doc } from "./_generated/dataModel";
 import { mutation, query } from "./_generated/server";
+import {
+  YearDelta,
+  addTournamentToYear,
+  applyYearDeltas,
+  rebuildYear,
+  replaceTournamentInYear,
+  tournamentYearBefore,
+  tournamentYears,
+} from "./utils/yearSummaries";
+
+// Years recomputed per rebuildYearSummaries call, to stay under the read limit
+const MAX_REBUILD_YEARS = 5;
+
+// Documents (matches and year lookups) one searchTournaments call reads at most
+const SEARCH_READ_BUDGET = 2000;
+
+// Text indexed by search_text: the tournament name plus its winner's name
+function tournamentSearchText(t: { name: string; winner_name?: string }): string {
+  return [t.name, t.winner_name].filter(Boolean).join(" ");
+}
+
+// Tournament fields accepted from the schedule import
+const tournamentInput = v.object({
+  tournament_id: v.string(),
+  name: v.string(),
+  year: v.number(),
+  dates_raw: v.optional(v.string()),
+  start_date: v.optional(v.string()),
+  end_date: v.optional(v.string()),
+  winner_name: v.optional(v.string()),
+  winner_espn_id: v.optional(v.number()),
+  winner_profile_url: v.optional(v.string()),
+  winning_score: v.optional(v.string()),
+  prize_money: v.optional(v.number()),
+  status: v.string(),
+  espn_tournament_id: v.optional(v.string()),
+  espn_leaderboard_url: v.optional(v.string()),
+  scraped_at: v.string(),
+  // Previous winner fields for scheduled tournaments
+  previous_winner_name: v.optional(v.string()),
+  previous_winner_espn_id: v.optional(v.number()),
+  previous_winner_profile_url: v.optional(v.string()),
+});
+
+// Per-row results of upsertTournamentsBulk, in input order
+const UPSERT_INSERTED = 0;
+const UPSERT_UPDATED = 1;
+const UPSERT_UNCHANGED = 2;   // Nothing but scraped_at differed; no write
+const UPSERT_DUPLICATE = 3;   // A later row in the batch has the same tournament_id
+const UPSERT_ERROR = 4;
+
+// A re-scrape alone is not a change worth a write
+const IGNORED_FOR_CHANGES = new Set(["scraped_at"]);
 
 // Import tournament data in batches
 export const importTournamentsBatch = mutation({
   args: {
-    tournaments: v.array(v.object({
-      tournament_id: v.string(),
-      name: v.string(),
-      year: v.number(),
-      dates_raw: v.optional(v.string()),
-      start_date: v.optional(v.string()),
-      end_date: v.optional(v.string()),
-      winner_name: v.optional(v.string()),
-      winner_espn_id: v.optional(v.number()),
-      winner_profile_url: v.optional(v.string()),
-      winning_score: v.optional(v.string()),
-      prize_money: v.optional(v.number()),
-      status: v.string(),
-      espn_tournament_id: v.optional(v.string()),
-      espn_leaderboard_url: v.optional(v.string()),
-      scraped_at: v.string(),
-      // Previous winner fields for scheduled tournaments
-      previous_winner_name: v.optional(v.string()),
-      previous_winner_espn_id: v.optional(v.number()),
-      previous_winner_profile_url: v.optional(v.string()),
-    }))
+    tournaments: v.array(tournamentInput)
   },
   handler: async (ctx, args) => {
     let imported = 0;
     let skipped = 0;
     const errors: string[] = [];
+    const yearDeltas = new Map<number, YearDelta>();
 
     for (const tournament of args.tournaments) {
       try {
@@ -41,11 +76,14 @@ export const importTournamentsBatch = mutation({
 
         if (existing) {
           // Update existing tournament
-          await ctx.db.patch(existing._id, tournament);
+          const searchText = tournamentSearchText({ ...existing, ...tournament });
+          await ctx.db.patch(existing._id, { ...tournament, searchText });
+          replaceTournamentInYear(yearDeltas, existing, { ...existing, ...tournament });
           skipped++;
         } else {
           // Insert new tournament
-          await ctx.db.insert("pgaTournaments", tournament);
+          await ctx.db.insert("pgaTournaments", { ...tournament, searchText: tournamentSearchText(tournament) });
+          addTournamentToYear(yearDeltas, tournament, 1);
           imported++;
         }
       } catch (error) {
@@ -53,6 +91,8 @@ export const importTournamentsBatch = mutation({
       }
     }
 
+    await applyYearDeltas(ctx.db, yearDeltas);
+
     return {
       imported,
       updated: skipped,
@@ -62,6 +102,75 @@ export const importTournamentsBatch = mutation({
   },
 });
 
+// Bulk upsert: dedupe tournament_ids, resolve every existing row in one
+// parallel lookup pass, and write only rows that changed. Returns one action
+// code per input row (UPSERT_*) plus totals.
+export const upsertTournamentsBulk = mutation({
+  args: {
+    tournaments: v.array(tournamentInput)
+  },
+  handler: async (ctx, args) => {
+    const actions: number[] = new Array(args.tournaments.length).fill(UPSERT_DUPLICATE);
+    const errors: string[] = [];
+    const yearDeltas = new Map<number, YearDelta>();
+
+    // Last occurrence of each tournament_id wins
+    const latest = new Map<string, number>();
+    args.tournaments.forEach((t, i) => latest.set(t.tournament_id, i));
+
+    const rows = [...latest.values()];
+    const existing = await Promise.all(rows.map(i =>
+      ctx.db
+        .query("pgaTournaments")
+        .withIndex("by_tournament_id", q => q.eq("tournament_id", args.tournaments[i].tournament_id))
+        .first()
+    ));
+
+    for (const [n, i] of rows.entries()) {
+      const tournament = args.tournaments[i];
+      const current = existing[n];
+      try {
+        if (!current) {
+          await ctx.db.insert("pgaTournaments", { ...tournament, searchText: tournamentSearchText(tournament) });
+          addTournamentToYear(yearDeltas, tournament, 1);
+          actions[i] = UPSERT_INSERTED;
+          continue;
+        }
+
+        const merged = { ...current, ...tournament };
+        const searchText = tournamentSearchText(merged);
+        const changed = searchText !== current.searchText ||
+          (Object.keys(tournament) as (keyof typeof tournament)[]).some(field =>
+            !IGNORED_FOR_CHANGES.has(field) && current[field] !== tournament[field]
+          );
+        if (!changed) {
+          actions[i] = UPSERT_UNCHANGED;
+          continue;
+        }
+
+        await ctx.db.patch(current._id, { ...tournament, searchText });
+        replaceTournamentInYear(yearDeltas, current, merged);
+        actions[i] = UPSERT_UPDATED;
+      } catch (error) {
+        actions[i] = UPSERT_ERROR;
+        errors.push(`Error importing ${tournament.name} (${tournament.year}): ${error}`);
+      }
+    }
+
+    await applyYearDeltas(ctx.db, yearDeltas);
+
+    const count = (code: number) => actions.filter(a => a === code).length;
+    return {
+      actions,
+      inserted: count(UPSERT_INSERTED),
+      updated: count(UPSERT_UPDATED),
+      unchanged: count(UPSERT_UNCHANGED),
+      duplicates: count(UPSERT_DUPLICATE),
+      errors,
+    };
+  },
+});
+
 // Clear all tournament data (for fresh import) - BATCHED
 export const clearTournaments = mutation({
   args: {
@@ -77,6 +186,10 @@ export const clearTournaments = mutation({
 
       if (tournaments.length === 0) {
         hasMore = false;
+        // Nothing left to summarize
+        for (const summary of await ctx.db.query("yearSummaries").collect()) {
+          await ctx.db.delete(summary._id);
+        }
       } else {
         for (const tournament of tournaments) {
           await ctx.db.delete(tournament._id);
@@ -89,6 +202,34 @@ export const clearTournaments = mutation({
   },
 });
 
+// Delete specific tournaments by tournament_id (tombstones from change-detected re-imports)
+export const deleteTournaments = mutation({
+  args: {
+    tournament_ids: v.array(v.string()),
+  },
+  handler: async (ctx, args) => {
+    let deleted = 0;
+    const yearDeltas = new Map<number, YearDelta>();
+
+    for (const tournamentId of args.tournament_ids) {
+      const existing = await ctx.db
+        .query("pgaTournaments")
+        .withIndex("by_tournament_id", q => q.eq("tournament_id", tournamentId))
+        .first();
+
+      if (existing) {
+        await ctx.db.delete(existing._id);
+        addTournamentToYear(yearDeltas, existing, -1);
+        deleted++;
+      }
+    }
+
+    await applyYearDeltas(ctx.db, yearDeltas);
+
+    return { deleted, total: args.tournament_ids.length };
+  },
+});
+
 // Get tournaments by year (PAGINATED)
 export const getTournamentsByYear = query({
   args: {
@@ -224,69 +365,168 @@ export const getAvailableYears = query({
   },
 });
 
-// Get year summary for all years (PAGINATED)
+// Get year summary for all years, newest first (reads the materialized yearSummaries table)
 export const getYearSummaries = query({
   args: {
     limit: v.optional(v.number()),
   },
   handler: async (ctx, args) => {
-    const limit = Math.min(args.limit || 200, 500); // Default 200, max 500
-    const tournaments = await ctx.db.query("pgaTournaments").take(limit);
+    const limit = Math.min(args.limit || 200, 500); // Years, not tournaments
+    const summaries = await ctx.db
+      .query("yearSummaries")
+      .withIndex("by_year")
+      .order("desc")
+      .take(limit);
 
-    const summaryMap = new Map<number, any>();
-
-    tournaments.forEach(t => {
-      if (!summaryMap.has(t.year)) {
-        summaryMap.set(t.year, {
-          year: t.year,
-          totalTournaments: 0,
-          completedTournaments: 0,
-          totalPrizeMoney: 0,
-          uniqueWinners: new Set(),
-        });
-      }
+    return summaries.map(s => ({
+      year: s.year,
+      totalTournaments: s.totalTournaments,
+      completedTournaments: s.completedTournaments,
+      totalPrizeMoney: s.totalPrizeMoney,
+      uniqueWinners: s.uniqueWinners,
+    }));
+  },
+});
 
-      const summary = summaryMap.get(t.year)!;
-      summary.totalTournaments++;
+// Page through the fields year summaries are built from (for verification scripts)
+export const getTournamentSummaryPage = query({
+  args: {
+    cursor: v.optional(v.union(v.string(), v.null())),
+    batchSize: v.optional(v.number()),
+  },
+  handler: async (ctx, args) => {
+    const batchSize = Math.min(args.batchSize || 500, 1000);
+    const page = await ctx.db
+      .query("pgaTournaments")
+      .paginate({ cursor: args.cursor ?? null, numItems: batchSize });
 
-      if (t.status === "completed") {
-        summary.completedTournaments++;
-        if (t.prize_money) {
-          summary.totalPrizeMoney += t.prize_money;
-        }
-        if (t.winner_espn_id) {
-          summary.uniqueWinners.add(t.winner_espn_id);
-        }
-      }
-    });
+    return {
+      tournaments: page.page.map(t => ({
+        year: t.year,
+        status: t.status,
+        prize_money: t.prize_money,
+        winner_espn_id: t.winner_espn_id,
+      })),
+      cursor: page.continueCursor,
+      hasMore: !page.isDone,
+    };
+  },
+});
+
+// Years whose summary row is missing or has no tournaments behind it
+// (BOUNDED: two index reads per year). Deployments with tournaments imported
+// before yearSummaries existed start with every year missing; the importer
+// seeds them through rebuildYearSummaries a few years per call.
+export const getUnsummarizedYears = query({
+  args: {},
+  handler: async (ctx) => {
+    const years = await tournamentYears(ctx.db);
+    const summarized = (await ctx.db.query("yearSummaries").withIndex("by_year").collect()).map(s => s.year);
+    const withTournaments = new Set(years);
+    const withSummary = new Set(summarized);
+    return {
+      missing: years.filter(year => !withSummary.has(year)),
+      stale: summarized.filter(year => !withTournaments.has(year)),
+    };
+  },
+});
 
-    // Convert to array and process
-    return Array.from(summaryMap.values())
-      .map(s => ({
-        ...s,
-        uniqueWinners: s.uniqueWinners.size,
-      }))
-      .sort((a, b) => b.year - a.year);
+// Rebuild the materialized summaries for a few years from pgaTournaments
+// (BOUNDED: at most MAX_REBUILD_YEARS years of tournaments read per call)
+export const rebuildYearSummaries = mutation({
+  args: {
+    years: v.array(v.number()),
+  },
+  handler: async (ctx, args) => {
+    if (args.years.length > MAX_REBUILD_YEARS) {
+      throw new Error(`At most ${MAX_REBUILD_YEARS} years per call, got ${args.years.length}`);
+    }
+    for (const year of args.years) {
+      await rebuildYear(ctx.db, year);
+    }
+    return { rebuilt: args.years.length };
   },
 });
 
-// Search tournaments by name (PAGINATED)
+// Search tournaments by name or winner name, newest year first (PAGINATED)
+// Years are walked through the by_year index, so search does not depend on
+// yearSummaries being seeded. One call keeps reading years, skipping those
+// without matches, until the page is full, no years are left, or
+// SEARCH_READ_BUDGET documents have been read. A year the page fills up in
+// continues from an offset into that year's matches on the next call (a
+// year holds a few dozen tournaments, so re-reading the skipped ones is
+// cheap). The cursor is JSON: {"year": number, "offset": number}.
 export const searchTournaments = query({
   args: {
     searchTerm: v.string(),
     limit: v.optional(v.number()),
+    cursor: v.optional(v.union(v.string(), v.null())),
   },
   handler: async (ctx, args) => {
     const limit = Math.min(args.limit || 100, 200); // Default 100, max 200
-    const allTournaments = await ctx.db.query("pgaTournaments").take(limit * 2); // Take 2x for filtering
+    if (!args.searchTerm.trim()) return { tournaments: [], cursor: null, hasMore: false };
+
+    let year: number | null;
+    let offset = 0;
+    if (args.cursor) {
+      ({ year, offset } = JSON.parse(args.cursor));
+    } else {
+      year = await tournamentYearBefore(ctx.db);
+    }
+
+    const tournaments: Doc<"pgaTournaments">[] = [];
+    let reads = 0;
+    while (year !== null && reads < SEARCH_READ_BUDGET) {
+      const room = limit - tournaments.length;
+      const matches = await ctx.db
+        .query("pgaTournaments")
+        .withSearchIndex("search_text", q => q.search("searchText", args.searchTerm).eq("year", year!))
+        .take(offset + room + 1);
+      reads += matches.length + 1;
+      tournaments.push(...matches.slice(offset, offset + room));
+
+      if (matches.length > offset + room) {
+        // Page full with matches of this year left
+        return { tournaments, cursor: JSON.stringify({ year, offset: offset + room }), hasMore: true };
+      }
+      year = await tournamentYearBefore(ctx.db, year);
+      offset = 0;
+      if (tournaments.length === limit) break;
+    }
+
+    return year === null
+      ? { tournaments, cursor: null, hasMore: false }
+      : { tournaments, cursor: JSON.stringify({ year, offset: 0 }), hasMore: true };
+  },
+});
+
+// Backfill searchText for tournaments imported before search_text existed (BATCHED)
+export const backfillTournamentSearchText = mutation({
+  args: {
+    cursor: v.optional(v.union(v.string(), v.null())),
+    batchSize: v.optional(v.number()),
+  },
+  handler: async (ctx, args) => {
+    const batchSize = Math.min(args.batchSize || 100, 200);
+    const page = await ctx.db
+      .query("pgaTournaments")
+      .paginate({ cursor: args.cursor ?? null, numItems: batchSize });
 
-    const searchLower = args.searchTerm.toLowerCase();
-    const filtered = allTournaments.filter(t =>
-      t.name.toLowerCase().includes(searchLower) ||
-      t.winner_name?.toLowerCase().includes(searchLower)
-    );
+    let updated = 0;
+    for (const tournament of page.page) {
+      const searchText = tournamentSearchText(tournament);
+      if (tournament.searchText !== searchText) {
+        await ctx.db.patch(tournament._id, { searchText });
+        updated++;
+      }
+    }
 
-    return filtered.sort((a, b) => b.year - a.year).slice(0, limit);
+    return {
+      updated,
+      processed: page.page.length,
+      cursor: page.continueCursor,
+      hasMore: !page.isDone,
+    };
   },
 });
 
@@ -304,6 +544,7 @@ export const fix2026TournamentData = mutation({
 
     let updated = 0;
     const errors: string[] = [];
+    const yearDeltas = new Map<number, YearDelta>();
 
     for (const tournament of tournaments2026) {
       try {
@@ -332,13 +573,18 @@ export const fix2026TournamentData = mutation({
           updates.winning_score = undefined;
         }
 
+        updates.searchText = tournamentSearchText({ ...tournament, ...updates });
+
         await ctx.db.patch(tournament._id, updates);
+        replaceTournamentInYear(yearDeltas, tournament, { ...tournament, ...updates });
         updated++;
       } catch (error) {
         errors.push(`Error updating ${tournament.name}: ${error}`);
       }
     }
 
+    await applyYearDeltas(ctx.db, yearDeltas);
+
     return {
       totalTournaments: tournaments2026.length,
       updated,
@@ -0,0 +1,216 @@
+// Incremental player-course aggregation from running sums and counts
+import { Doc, Id } from "../_generated/dataModel";
+import { DatabaseWriter } from "../_generated/server";
+import { madeCut } from "./dataProcessing";
+
+export type CourseStatsDelta = {
+  roundsPlayed: number;
+  totalStrokes: number;
+  bestScore: number;
+  worstScore: number;
+  cutsPlayed: number;
+  cutsMade: number;
+  wins: number;
+  top10s: number;
+  top25s: number;
+  totalEarnings: number;
+  roundSums: number[];   // Stroke sums for R1-R4
+  roundCounts: number[]; // Rounds counted for R1-R4
+  lastTournamentYear: number;
+};
+
+export function emptyDelta(): CourseStatsDelta {
+  return {
+    roundsPlayed: 0,
+    totalStrokes: 0,
+    bestScore: Infinity,
+    worstScore: -Infinity,
+    cutsPlayed: 0,
+    cutsMade: 0,
+    wins: 0,
+    top10s: 0,
+    top25s: 0,
+    totalEarnings: 0,
+    roundSums: [0, 0, 0, 0],
+    roundCounts: [0, 0, 0, 0],
+    lastTournamentYear: 0,
+  };
+}
+
+/**
+ * Contribution of a single tournament result to its player-course aggregate
+ */
+export function resultDelta(result: {
+  year: number;
+  position: string;
+  scores?: string[];
+  earnings?: number;
+}): CourseStatsDelta {
+  const delta = emptyDelta();
+  delta.cutsPlayed = 1;
+  delta.lastTournamentYear = result.year;
+
+  if (result.scores) {
+    if (madeCut(result.position, result.scores.map(s => parseInt(s)))) delta.cutsMade = 1;
+
+    result.scores.forEach((score, index) => {
+      const scoreNum = parseInt(score);
+      if (isNaN(scoreNum)) return;
+
+      delta.totalStrokes += scoreNum;
+      delta.roundsPlayed++;
+      if (scoreNum < delta.bestScore) delta.bestScore = scoreNum;
+      if (scoreNum > delta.worstScore) delta.worstScore = scoreNum;
+
+      if (index < 4) {
+        delta.roundSums[index] += scoreNum;
+        delta.roundCounts[index]++;
+      }
+    });
+  }
+
+  const posNum = parseInt(result.position.replace(/[^0-9]/g, ''));
+  if (!isNaN(posNum)) {
+    if (posNum === 1) delta.wins = 1;
+    if (posNum <= 10) delta.top10s = 1;
+    if (posNum <= 25) delta.top25s = 1;
+  }
+
+  if (result.earnings) delta.totalEarnings = result.earnings;
+
+  return delta;
+}
+
+/**
+ * Combine two deltas (sums add, best/worst take min/max)
+ */
+export function mergeDeltas(a: CourseStatsDelta, b: CourseStatsDelta): CourseStatsDelta {
+  return {
+    roundsPlayed: a.roundsPlayed + b.roundsPlayed,
+    totalStrokes: a.totalStrokes + b.totalStrokes,
+    bestScore: Math.min(a.bestScore, b.bestScore),
+    worstScore: Math.max(a.worstScore, b.worstScore),
+    cutsPlayed: a.cutsPlayed + b.cutsPlayed,
+    cutsMade: a.cutsMade + b.cutsMade,
+    wins: a.wins + b.wins,
+    top10s: a.top10s + b.top10s,
+    top25s: a.top25s + b.top25s,
+    totalEarnings: a.totalEarnings + b.totalEarnings,
+    roundSums: a.roundSums.map((sum, i) => sum + b.roundSums[i]),
+    roundCounts: a.roundCounts.map((count, i) => count + b.roundCounts[i]),
+    lastTournamentYear: Math.max(a.lastTournamentYear, b.lastTournamentYear),
+  };
+}
+
+/**
+ * Running sums stored on an existing aggregate row, or null for rows written
+ * before incremental aggregation (those are rebuilt from their results once)
+ */
+function storedDelta(stats: Doc<"playerCourseStats">): CourseStatsDelta | null {
+  if (stats.totalStrokes === undefined || !stats.roundSums || !stats.roundCounts) {
+    return null;
+  }
+  return {
+    roundsPlayed: stats.roundsPlayed,
+    totalStrokes: stats.totalStrokes,
+    bestScore: stats.roundsPlayed > 0 ? stats.bestScore : Infinity,
+    worstScore: stats.roundsPlayed > 0 ? stats.worstScore : -Infinity,
+    cutsPlayed: stats.cutsPlayed,
+    cutsMade: stats.cutsMade,
+    wins: stats.wins,
+    top10s: stats.top10s,
+    top25s: stats.top25s,
+    totalEarnings: stats.totalEarnings,
+    roundSums: stats.roundSums,
+    roundCounts: stats.roundCounts,
+    lastTournamentYear: stats.lastTournamentYear,
+  };
+}
+
+/**
+ * Convert running sums into the stored playerCourseStats fields
+ */
+export function statsFromDelta(delta: CourseStatsDelta) {
+  const avg = (sum: number, count: number) => count > 0 ? sum / count : undefined;
+  const [r1, r2, r3, r4] = delta.roundSums;
+  const [c1, c2, c3, c4] = delta.roundCounts;
+
+  return {
+    roundsPlayed: delta.roundsPlayed,
+    scoringAverage: delta.roundsPlayed > 0 ? delta.totalStrokes / delta.roundsPlayed : 0,
+    bestScore: delta.bestScore === Infinity ? 0 : delta.bestScore,
+    worstScore: delta.worstScore === -Infinity ? 0 : delta.worstScore,
+    cutsPlayed: delta.cutsPlayed,
+    cutsMade: delta.cutsMade,
+    wins: delta.wins,
+    top10s: delta.top10s,
+    top25s: delta.top25s,
+    totalEarnings: delta.totalEarnings,
+    avgR1Score: avg(r1, c1),
+    avgR2Score: avg(r2, c2),
+    avgR3Score: avg(r3, c3),
+    avgR4Score: avg(r4, c4),
+    avgEarlyScore: avg(r1 + r2, c1 + c2),
+    avgWeekendScore: avg(r3 + r4, c3 + c4),
+    totalStrokes: delta.totalStrokes,
+    roundSums: delta.roundSums,
+    roundCounts: delta.roundCounts,
+    lastUpdated: Date.now(),
+    lastTournamentYear: delta.lastTournamentYear,
+  };
+}
+
+/**
+ * Full aggregate for one (player, course) pair from its tournament results
+ */
+async function recomputeDelta(
+  db: DatabaseWriter,
+  playerId: Id<"players">,
+  courseName: string
+): Promise<CourseStatsDelta> {
+  const results = await db
+    .query("tournamentResults")
+    .withIndex("by_player", (q) => q.eq("playerId", playerId))
+    .filter((q) => q.eq(q.field("course"), courseName))
+    .collect();
+
+  return results.map(resultDelta).reduce(mergeDeltas, emptyDelta());
+}
+
+/**
+ * Apply a delta to the (player, course) aggregate: one read and one write
+ * once the row carries running sums. When `alreadyStored` is true the
+ * delta's results are already in tournamentResults, so seeding from
+ * history must not add them a second time.
+ */
+export async function applyCourseStatsDelta(
+  db: DatabaseWriter,
+  playerId: Id<"players">,
+  course: Doc<"courses">,
+  delta: CourseStatsDelta,
+  alreadyStored: boolean
+): Promise<void> {
+  const existing = await db
+    .query("playerCourseStats")
+    .withIndex("by_player_course", (q) =>
+      q.eq("playerId", playerId).eq("courseId", course._id)
+    )
+    .first();
+
+  // Rows without running sums (missing or legacy) are seeded from history once
+  const stored = existing ? storedDelta(existing) : null;
+  let merged: CourseStatsDelta;
+  if (stored) {
+    merged = mergeDeltas(stored, delta);
+  } else {
+    const rebuilt = await recomputeDelta(db, playerId, course.name);
+    merged = alreadyStored ? rebuilt : mergeDeltas(rebuilt, delta);
+  }
+
+  const stats = { playerId, courseId: course._id, ...statsFromDelta(merged) };
+  if (existing) {
+    await db.patch(existing._id, stats);
+  } else {
+    await db.insert("playerCourseStats", stats);
+  }
+}
@@ -0,0 +1,162 @@
+// Maintained player completeness counters, sharded to spread write contention
+import { Doc, Id } from "../_generated/dataModel";
+import { DatabaseReader, DatabaseWriter } from "../_generated/server";
+
+// Concurrent import batches each add to a random shard instead of all
+// conflicting on one document; readers sum the shards
+export const COUNTER_SHARDS = 8;
+
+type PlayerFields = Partial<Doc<"players">>;
+
+// Bio fields a complete profile needs (college is optional)
+const REQUIRED_BIO_FIELDS = ["birthDate", "birthPlace", "height", "weight", "turnedPro", "swing"] as const;
+
+export function isBioComplete(player: PlayerFields): boolean {
+  return REQUIRED_BIO_FIELDS.every(field => !!player[field]);
+}
+
+// Counter → whether a player counts towards it
+const COUNTERS = {
+  total: (_p: PlayerFields) => true,
+  withPhoto: (p: PlayerFields) => !!p.photoUrl,
+  withEspnId: (p: PlayerFields) => !!p.espnId,
+  withWorldRanking: (p: PlayerFields) => p.worldRanking !== undefined && p.worldRanking !== null,
+  withBirthDate: (p: PlayerFields) => !!p.birthDate,
+  withBirthPlace: (p: PlayerFields) => !!p.birthPlace,
+  withCollege: (p: PlayerFields) => !!p.college,
+  withHeight: (p: PlayerFields) => !!p.height,
+  withWeight: (p: PlayerFields) => !!p.weight,
+  withTurnedPro: (p: PlayerFields) => !!p.turnedPro,
+  withSwing: (p: PlayerFields) => !!p.swing,
+  completeBio: isBioComplete,
+};
+
+export type CounterName = keyof typeof COUNTERS;
+export type PlayerCounts = Record<CounterName, number>;
+const COUNTER_NAMES = Object.keys(COUNTERS) as CounterName[];
+
+export function emptyCounts(): PlayerCounts {
+  return Object.fromEntries(COUNTER_NAMES.map(name => [name, 0])) as PlayerCounts;
+}
+
+/**
+ * Add (sign 1) or remove (sign -1) one player's contribution to the counters
+ */
+export function countPlayer(delta: PlayerCounts, player: PlayerFields, sign: 1 | -1): void {
+  for (const name of COUNTER_NAMES) {
+    if (COUNTERS[name](player)) delta[name] += sign;
+  }
+}
+
+export function countPlayers(players: PlayerFields[]): PlayerCounts {
+  const counts = emptyCounts();
+  players.forEach(player => countPlayer(counts, player, 1));
+  return counts;
+}
+
+/**
+ * Patch a player and record how the patch moved it between counters
+ */
+export async function patchPlayer(
+  db: DatabaseWriter,
+  delta: PlayerCounts,
+  player: Doc<"players">,
+  updates: PlayerFields
+): Promise<void> {
+  await db.patch(player._id, updates);
+  countPlayer(delta, player, -1);
+  countPlayer(delta, { ...player, ...updates }, 1);
+}
+
+export async function insertPlayer(
+  db: DatabaseWriter,
+  delta: PlayerCounts,
+  player: Omit<Doc<"players">, "_id" | "_creationTime">
+): Promise<Id<"players">> {
+  const playerId = await db.insert("players", player);
+  countPlayer(delta, player, 1);
+  return playerId;
+}
+
+export async function deletePlayer(db: DatabaseWriter, delta: PlayerCounts, player: Doc<"players">): Promise<void> {
+  await db.delete(player._id);
+  countPlayer(delta, player, -1);
+}
+
+/**
+ * Sum of all shards, or null before the counters have been seeded
+ */
+export async function readPlayerCounts(db: DatabaseReader): Promise<PlayerCounts | null> {
+  const shards = await db.query("playerCounters").take(COUNTER_SHARDS);
+  if (shards.length === 0) return null;
+
+  const counts = emptyCounts();
+  for (const shard of shards) {
+    for (const name of COUNTER_NAMES) counts[name] += shard[name];
+  }
+  return counts;
+}
+
+/**
+ * Add one page of players to shard 0. The first page of a recount (reset)
+ * drops every shard so the count starts from that page alone.
+ */
+export async function addPlayerCountsPage(
+  db: DatabaseWriter,
+  players: PlayerFields[],
+  reset: boolean
+): Promise<PlayerCounts> {
+  const counts = countPlayers(players);
+  if (reset) await clearPlayerCounts(db);
+
+  const shard = reset
+    ? null
+    : await db
+        .query("playerCounters")
+        .withIndex("by_shard", q => q.eq("shard", 0))
+        .first();
+
+  if (!shard) {
+    await db.insert("playerCounters", { shard: 0, ...counts, lastUpdated: Date.now() });
+    return counts;
+  }
+
+  const merged = emptyCounts();
+  for (const name of COUNTER_NAMES) merged[name] = shard[name] + counts[name];
+  await db.patch(shard._id, { ...merged, lastUpdated: Date.now() });
+  return counts;
+}
+
+/**
+ * Apply a mutation's accumulated delta to one random shard. Call after the
+ * player writes. Before the counters are seeded (players imported before the
+ * counters existed) the delta is dropped: readers keep getting null until the
+ * paged rebuildPlayerCounters backfill has counted the whole table.
+ */
+export async function applyPlayerCounterDelta(db: DatabaseWriter, delta: PlayerCounts): Promise<void> {
+  if (COUNTER_NAMES.every(name => delta[name] === 0)) return;
+  if (!(await db.query("playerCounters").first())) return;
+
+  const shardNumber = Math.floor(Math.random() * COUNTER_SHARDS);
+  const shard = await db
+    .query("playerCounters")
+    .withIndex("by_shard", q => q.eq("shard", shardNumber))
+    .first();
+
+  if (!shard) {
+    await db.insert("playerCounters", { shard: shardNumber, ...delta, lastUpdated: Date.now() });
+    return;
+  }
+
+  const merged = emptyCounts();
+  for (const name of COUNTER_NAMES) merged[name] = shard[name] + delta[name];
+  await db.patch(shard._id, { ...merged, lastUpdated: Date.now() });
+}
+
+/**
+ * Delete every shard (after the players table itself was cleared)
+ */
+export async function clearPlayerCounts(db: DatabaseWriter): Promise<void> {
+  const shards = await db.query("playerCounters").take(COUNTER_SHARDS);
+  await Promise.all(shards.map(shard => db.delete(shard._id)));
+}
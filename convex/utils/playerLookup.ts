@@ -0,0 +1,71 @@
+// Indexed player lookups shared by the import mutations
+import { Doc } from "../_generated/dataModel";
+import { DatabaseReader } from "../_generated/server";
+
+/**
+ * Normalize a player name for matching
+ * Examples:
+ *   "Ludvig Åberg" → "ludvig aberg"
+ *   "  Si Woo  Kim " → "si woo kim"
+ *   "J.J. Spaun" → "jj spaun"
+ */
+export function normalizePlayerName(name: string): string {
+  return name
+    .normalize("NFD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .toLowerCase()
+    .replace(/[^a-z0-9\s-]/g, "")
+    .replace(/[\s-]+/g, " ")
+    .trim();
+}
+
+/**
+ * Find a player by ESPN ID using the by_espn_id index
+ */
+export async function findPlayerByEspnId(
+  db: DatabaseReader,
+  espnId: string
+): Promise<Doc<"players"> | null> {
+  return await db
+    .query("players")
+    .withIndex("by_espn_id", (q) => q.eq("espnId", espnId))
+    .first();
+}
+
+/**
+ * Find a player by name: exact name first, then the normalized-name index
+ */
+export async function findPlayerByName(
+  db: DatabaseReader,
+  name: string
+): Promise<Doc<"players"> | null> {
+  const exact = await db
+    .query("players")
+    .withIndex("by_name", (q) => q.eq("name", name))
+    .first();
+  if (exact) return exact;
+
+  return await db
+    .query("players")
+    .withIndex("by_normalized_name", (q) => q.eq("normalizedName", normalizePlayerName(name)))
+    .first();
+}
+
+/**
+ * Resolve a player by ESPN ID, falling back to name
+ */
+export async function findPlayer(
+  db: DatabaseReader,
+  espnId: string | undefined,
+  name: string | undefined
+): Promise<{ player: Doc<"players"> | null; matchedBy: "espnId" | "name" | null }> {
+  if (espnId) {
+    const byEspnId = await findPlayerByEspnId(db, espnId);
+    if (byEspnId) return { player: byEspnId, matchedBy: "espnId" };
+  }
+  if (name) {
+    const byName = await findPlayerByName(db, name);
+    if (byName) return { player: byName, matchedBy: "name" };
+  }
+  return { player: null, matchedBy: null };
+}
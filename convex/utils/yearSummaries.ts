@@ -0,0 +1,184 @@
+// Materialized per-year tournament summaries maintained from row deltas
+import { Doc } from "../_generated/dataModel";
+import { DatabaseReader, DatabaseWriter } from "../_generated/server";
+
+type SummaryFields = Pick<Doc<"pgaTournaments">, "year" | "status" | "prize_money" | "winner_espn_id">;
+
+export type YearDelta = {
+  totalTournaments: number;
+  completedTournaments: number;
+  totalPrizeMoney: number;
+  winnerCounts: Map<number, number>; // Winner ESPN ID → completed wins that year
+};
+
+function emptyYearDelta(): YearDelta {
+  return {
+    totalTournaments: 0,
+    completedTournaments: 0,
+    totalPrizeMoney: 0,
+    winnerCounts: new Map(),
+  };
+}
+
+/**
+ * Add (sign 1) or remove (sign -1) one tournament's contribution to its
+ * year. Only completed tournaments count towards prize money and winners.
+ */
+export function addTournamentToYear(
+  deltas: Map<number, YearDelta>,
+  tournament: SummaryFields,
+  sign: 1 | -1
+): void {
+  let delta = deltas.get(tournament.year);
+  if (!delta) {
+    delta = emptyYearDelta();
+    deltas.set(tournament.year, delta);
+  }
+
+  delta.totalTournaments += sign;
+  if (tournament.status !== "completed") return;
+
+  delta.completedTournaments += sign;
+  if (tournament.prize_money) delta.totalPrizeMoney += sign * tournament.prize_money;
+  if (tournament.winner_espn_id) {
+    const wins = (delta.winnerCounts.get(tournament.winner_espn_id) ?? 0) + sign;
+    delta.winnerCounts.set(tournament.winner_espn_id, wins);
+  }
+}
+
+/**
+ * Record an update as the removal of the old row plus the addition of the new one
+ */
+export function replaceTournamentInYear(
+  deltas: Map<number, YearDelta>,
+  before: SummaryFields,
+  after: SummaryFields
+): void {
+  addTournamentToYear(deltas, before, -1);
+  addTournamentToYear(deltas, after, 1);
+}
+
+function isEmptyDelta(delta: YearDelta): boolean {
+  return delta.totalTournaments === 0 &&
+    delta.completedTournaments === 0 &&
+    delta.totalPrizeMoney === 0 &&
+    [...delta.winnerCounts.values()].every(wins => wins === 0);
+}
+
+function summaryFields(year: number, delta: YearDelta) {
+  const winnerCounts = [...delta.winnerCounts.entries()]
+    .filter(([, wins]) => wins > 0)
+    .map(([espnId, wins]) => ({ espnId, wins }))
+    .sort((a, b) => a.espnId - b.espnId);
+
+  return {
+    year,
+    totalTournaments: delta.totalTournaments,
+    completedTournaments: delta.completedTournaments,
+    totalPrizeMoney: delta.totalPrizeMoney,
+    uniqueWinners: winnerCounts.length,
+    winnerCounts,
+    lastUpdated: Date.now(),
+  };
+}
+
+/**
+ * The newest year with tournaments before `year` (the newest overall when
+ * omitted), or null: one index read that jumps past the whole year
+ */
+export async function tournamentYearBefore(db: DatabaseReader, year?: number): Promise<number | null> {
+  const next = await db
+    .query("pgaTournaments")
+    .withIndex("by_year", q => (year === undefined ? q : q.lt("year", year)))
+    .order("desc")
+    .first();
+  return next?.year ?? null;
+}
+
+/**
+ * Every year that has tournaments, newest first: one index read per year,
+ * not one per tournament
+ */
+export async function tournamentYears(db: DatabaseReader): Promise<number[]> {
+  const years: number[] = [];
+  for (let year = await tournamentYearBefore(db); year !== null; year = await tournamentYearBefore(db, year)) {
+    years.push(year);
+  }
+  return years;
+}
+
+/**
+ * Full summary for one year from its tournaments
+ */
+export async function recomputeYear(db: DatabaseReader, year: number): Promise<YearDelta> {
+  const tournaments = await db
+    .query("pgaTournaments")
+    .withIndex("by_year", q => q.eq("year", year))
+    .collect();
+
+  const deltas = new Map<number, YearDelta>();
+  tournaments.forEach(t => addTournamentToYear(deltas, t, 1));
+  return deltas.get(year) ?? emptyYearDelta();
+}
+
+/**
+ * Write a year's summary from scratch, deleting it when the year is empty
+ */
+export async function rebuildYear(db: DatabaseWriter, year: number): Promise<void> {
+  const existing = await db
+    .query("yearSummaries")
+    .withIndex("by_year", q => q.eq("year", year))
+    .first();
+  const delta = await recomputeYear(db, year);
+
+  if (delta.totalTournaments === 0) {
+    if (existing) await db.delete(existing._id);
+  } else if (existing) {
+    await db.patch(existing._id, summaryFields(year, delta));
+  } else {
+    await db.insert("yearSummaries", summaryFields(year, delta));
+  }
+}
+
+/**
+ * Apply accumulated deltas: one read and one write per touched year. Call
+ * after the tournament writes, so a year without a summary row yet (data
+ * imported before the table existed) is seeded from what is now stored
+ * instead of from the delta alone.
+ */
+export async function applyYearDeltas(db: DatabaseWriter, deltas: Map<number, YearDelta>): Promise<number> {
+  let writes = 0;
+
+  for (const [year, delta] of deltas) {
+    if (isEmptyDelta(delta)) continue;
+
+    const existing = await db
+      .query("yearSummaries")
+      .withIndex("by_year", q => q.eq("year", year))
+      .first();
+
+    if (!existing) {
+      await rebuildYear(db, year);
+      writes++;
+      continue;
+    }
+
+    const merged = emptyYearDelta();
+    merged.totalTournaments = existing.totalTournaments + delta.totalTournaments;
+    merged.completedTournaments = existing.completedTournaments + delta.completedTournaments;
+    merged.totalPrizeMoney = existing.totalPrizeMoney + delta.totalPrizeMoney;
+    existing.winnerCounts.forEach(({ espnId, wins }) => merged.winnerCounts.set(espnId, wins));
+    delta.winnerCounts.forEach((wins, espnId) =>
+      merged.winnerCounts.set(espnId, (merged.winnerCounts.get(espnId) ?? 0) + wins)
+    );
+
+    if (merged.totalTournaments <= 0) {
+      await db.delete(existing._id);
+    } else {
+      await db.patch(existing._id, summaryFields(year, merged));
+    }
+    writes++;
+  }
+
+  return writes;
+}
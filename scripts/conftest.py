@@ -0,0 +1,14 @@
+"""
+Shared pytest setup for the golfgod_import tests (run from scripts/: python -m pytest)
+"""
+
+import pytest
+
+from golfgod_import import config
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    """Keep manifests, journals and reject files of each test in its own directory"""
+    monkeypatch.setattr(config, "STATE_DIR", tmp_path / "state")
+    return tmp_path / "state"
@@ -0,0 +1,3 @@
+"""
+Shared runtime for the GolfGod Convex import scripts
+"""
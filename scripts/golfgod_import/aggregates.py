@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Replay a results directory through importTournamentResultsBatch and report
+how many playerCourseStats writes each imported result cost.
+
+importTournamentResultsBatch folds each new result into the running sums of
+its (player, course) aggregate, so writes per result should stay near 1
+regardless of how much history a player already has. The report puts that
+next to what a full calculatePlayerCourseStats recompute would have read.
+
+Usage (from the scripts directory):
+    python -m golfgod_import.aggregates ../data/player_results --backend stub
+    python -m golfgod_import.aggregates ../data/player_results --replays 2 --limit 50
+"""
+
+import argparse
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from .cli import _add_common
+from .results_files import iter_player_files, load_player_file, split_by_year
+from .runtime import ImportRuntime
+
+
+def replay(runtime: ImportRuntime, directory: str, limit: int = 0, split_years: bool = False) -> Dict[str, float]:
+    """Import every player file and tally aggregate writes against imported rows"""
+    totals = {"files": 0, "imported": 0, "skipped": 0, "aggregateWrites": 0, "historyReads": 0, "errors": 0}
+    history: Dict[str, int] = defaultdict(int)
+    start = time.perf_counter()
+
+    for path in iter_player_files(directory):
+        if limit and totals["files"] >= limit:
+            break
+        player = load_player_file(path)
+        totals["files"] += 1
+
+        # --split-years sends one call per season, as a weekly refresh would
+        payloads = split_by_year(player) if split_years else [player]
+
+        for payload in payloads:
+            try:
+                result = runtime.mutation("importMasterData:importTournamentResultsBatch", {"playerData": payload})
+            except Exception as e:
+                print(f"  {path.name}: {e}")
+                totals["errors"] += 1
+                continue
+
+            imported = result.get("imported", 0)
+            totals["imported"] += imported
+            totals["skipped"] += result.get("skipped", 0)
+            totals["aggregateWrites"] += result.get("aggregateWrites", 0)
+            totals["errors"] += len(result.get("errors") or [])
+            if imported:
+                # A full recompute re-reads every result the player has so far
+                history[player["player_id"]] += imported
+                totals["historyReads"] += history[player["player_id"]]
+
+    totals["seconds"] = time.perf_counter() - start
+    return totals
+
+
+def print_report(label: str, totals: Dict[str, float]) -> None:
+    imported = totals["imported"]
+    per_result = totals["aggregateWrites"] / imported if imported else 0.0
+    recompute = totals["historyReads"] / imported if imported else 0.0
+    print(f"{label}: {totals['files']} files, {imported} imported, {totals['skipped']} skipped, "
+          f"{totals['errors']} errors in {totals['seconds']:.2f}s")
+    print(f"  aggregate writes: {totals['aggregateWrites']} ({per_result:.2f} per imported result)")
+    print(f"  full recompute would read: {totals['historyReads']} results ({recompute:.1f} per imported result)")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("directory", help="Directory of {espnId}_{First}_{Last}.json player files")
+    _add_common(parser)
+    parser.add_argument("--limit", type=int, default=0, help="Only replay the first N files")
+    parser.add_argument("--replays", type=int, default=1, help="Replay the directory N times")
+    parser.add_argument("--split-years", action="store_true", help="Send one call per player season")
+    args = parser.parse_args(argv)
+
+    if not list(iter_player_files(args.directory)):
+        print(f"No player files found in {args.directory}")
+        sys.exit(1)
+
+    with ImportRuntime.create(args.backend, args.url) as runtime:
+        for i in range(args.replays):
+            print_report(f"Replay {i + 1}", replay(runtime, args.directory, args.limit, args.split_years))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Adaptive batch sizing driven by measured mutation latency and payload size.
+
+A batch is closed when it reaches the current record count or when the next
+record would push the JSON payload over `max_bytes`. The count grows while
+the p95 latency of recent batches stays well under the target, and halves
+when p95 goes over it or a batch times out or fails in transport (errors
+caused by bad records are bisected by the dispatcher and do not count).
+Converged sizes are remembered per mutation in .import_state so the next
+run starts where this one settled.
+"""
+
+import json
+import math
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .config import state_path
+from .dispatcher import is_rate_limited, percentile
+
+# Convex stops a mutation after about 1s of execution; stay under it
+TARGET_P95_SECONDS = 1.0
+# Well under Convex's 8 MiB argument limit, leaving room for overhead
+MAX_PAYLOAD_BYTES = 1024 * 1024
+WINDOW = 6            # Batches observed before each resize decision
+GROW_BELOW = 0.6      # Grow while p95 < GROW_BELOW * target
+GROWTH = 1.5
+
+
+def payload_bytes(record: Dict[str, Any]) -> int:
+    return len(json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+class BatchSizer:
+    """Chunks records for one mutation and adapts the size from feedback"""
+
+    def __init__(
+        self,
+        name: str,
+        initial_size: int,
+        adaptive: bool = True,
+        min_size: int = 1,
+        max_size: int = 1000,
+        target_p95: float = TARGET_P95_SECONDS,
+        max_bytes: int = MAX_PAYLOAD_BYTES,
+        window: int = WINDOW
+    ):
+        self.name = name
+        self.adaptive = adaptive
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_p95 = target_p95
+        self.max_bytes = max_bytes
+        self.window = window
+        self.size = max(min_size, min(max_size, initial_size))
+        self.initial_size = self.size
+        self.lock = threading.Lock()
+        self.recent: List[float] = []
+        self.history: List[int] = [self.size]
+        self.byte_capped = 0
+        self.records = 0
+        self.seconds = 0.0
+        self.max_batch_bytes = 0
+
+    def batches(self, records: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        """Group records by the current size, never exceeding max_bytes"""
+        batch: List[Dict[str, Any]] = []
+        batch_bytes = 0
+        for record in records:
+            size = payload_bytes(record)
+            if batch and batch_bytes + size > self.max_bytes:
+                self.byte_capped += 1
+                yield self._emit(batch, batch_bytes)
+                batch, batch_bytes = [], 0
+            batch.append(record)
+            batch_bytes += size
+            if len(batch) >= self.size:
+                yield self._emit(batch, batch_bytes)
+                batch, batch_bytes = [], 0
+        if batch:
+            yield self._emit(batch, batch_bytes)
+
+    def _emit(self, batch: List[Dict[str, Any]], batch_bytes: int) -> List[Dict[str, Any]]:
+        self.max_batch_bytes = max(self.max_batch_bytes, batch_bytes)
+        return batch
+
+    def observe(self, count: int, seconds: float, error: Optional[Exception] = None) -> None:
+        """Feed back one batch outcome from the dispatcher"""
+        with self.lock:
+            if error is None:
+                self.records += count
+                self.seconds += seconds
+            if not self.adaptive:
+                return
+            if error is not None and not is_rate_limited(error):
+                self._resize(max(self.min_size, self.size // 2))
+                return
+            if count < self.size // 2:
+                return  # Byte-capped or trailing batches say little about this size
+            self.recent.append(seconds)
+            if len(self.recent) < self.window:
+                return
+            p95 = percentile(self.recent, 95)
+            if p95 > self.target_p95:
+                self._resize(max(self.min_size, self.size // 2))
+            elif p95 < self.target_p95 * GROW_BELOW:
+                self._resize(min(self.max_size, math.ceil(self.size * GROWTH)))
+            else:
+                self.recent = []
+
+    def _resize(self, size: int) -> None:
+        self.recent = []
+        if size != self.size:
+            self.size = size
+            self.history.append(size)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "mutation": self.name,
+            "adaptive": self.adaptive,
+            "initialSize": self.initial_size,
+            "convergedSize": self.size,
+            "sizes": self.history,
+            "byteCappedBatches": self.byte_capped,
+            "maxBatchBytes": self.max_batch_bytes,
+            "recordsPerSec": round(self.records / self.seconds, 1) if self.seconds else 0.0,
+        }
+
+    def print_summary(self) -> None:
+        s = self.summary()
+        mode = "adaptive" if self.adaptive else "fixed"
+        print(f"Batch size ({self.name}, {mode}): {s['initialSize']} → {s['convergedSize']} records "
+              f"via {s['sizes']}, {s['byteCappedBatches']} byte-capped, "
+              f"max {s['maxBatchBytes'] / 1024:.0f} KB, {s['recordsPerSec']} records/sec per call")
+
+    def save(self) -> None:
+        """Remember the converged size for the next run"""
+        if not self.adaptive:
+            return
+        sizes = load_sizes()
+        sizes[self.name] = self.size
+        with open(state_path("batch_sizes.json"), "w", encoding="utf-8") as f:
+            json.dump(sizes, f, indent=2, sort_keys=True)
+
+
+def load_sizes() -> Dict[str, int]:
+    path = state_path("batch_sizes.json")
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def batch_sizer(name: str, fixed_size: Optional[int], default_size: int, **kwargs: Any) -> BatchSizer:
+    """Fixed sizer when a size was given, otherwise adaptive from the last converged size"""
+    if fixed_size:
+        return BatchSizer(name, fixed_size, adaptive=False, **kwargs)
+    return BatchSizer(name, load_sizes().get(name, default_size), **kwargs)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Compare per-batch `npx convex run` subprocesses against the pooled runtime.
+
+Runs fully offline against the stub backend. The subprocess path launches a
+fresh interpreter per batch (python -m golfgod_import.stub), which models the
+process startup cost the legacy 2026 importer paid on every batch.
+
+Pass --sweep to instead tune dispatcher concurrency against a stub that
+rate-limits above --max-in-flight concurrent calls, or --batch-sizes to
+compare fixed batch sizes with the adaptive sizer against a stub whose
+latency grows per record and times out above --timeout.
+
+Usage (from the scripts directory):
+    python -m golfgod_import.bench --tournaments 200 --batch-size 10
+    python -m golfgod_import.bench --sweep 1,2,4,8 --latency 0.05 --max-in-flight 6
+    python -m golfgod_import.bench --batch-sizes 10,25,50 --tournaments 5000 \
+        --latency 0.02 --per-record-latency 0.002 --timeout 1.0
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .batching import BatchSizer
+from .dispatcher import BatchDispatcher, chunked
+from .runtime import ImportRuntime, SubprocessBackend
+from .stub import StubBackend
+
+
+def synthetic_tournaments(count: int, year: int = 2026) -> List[Dict[str, Any]]:
+    """Build schedule rows shaped like pga_tour_schedules_playwright_2015_2026.json"""
+    return [
+        {
+            "tournament_id": f"{year}_bench_open_{i}",
+            "name": f"Bench Open {i}",
+            "year": year,
+            "status": "completed",
+            "winner_name": f"Player {i % 50}",
+            "winner_espn_id": 1000 + i % 50,
+            "prize_money": 8000000 + i,
+            "scraped_at": "2026-01-01T00:00:00",
+        }
+        for i in range(count)
+    ]
+
+
+def time_runtime(runtime: ImportRuntime, records: List[Dict[str, Any]], batch_size: int) -> float:
+    start = time.perf_counter()
+    for _, _, result in runtime.run_batches(
+        "tournaments:importTournamentsBatch", records, batch_size, "tournaments"
+    ):
+        if isinstance(result, Exception):
+            raise result
+    runtime.mutation("tournaments:fix2026TournamentData", {})
+    return time.perf_counter() - start
+
+
+def sweep_concurrency(records: List[Dict[str, Any]], batch_size: int, levels: List[int],
+                      latency: float, max_in_flight: int) -> None:
+    """Report batches/sec and latency percentiles for each concurrency level"""
+    for level in levels:
+        runtime = ImportRuntime(StubBackend(latency=latency, max_in_flight=max_in_flight))
+        dispatcher = BatchDispatcher(
+            runtime, "tournaments:importTournamentsBatch", "tournaments",
+            concurrency=level, base_backoff=max(latency, 0.01)
+        )
+        for _ in dispatcher.dispatch(chunked(records, batch_size)):
+            pass
+        dispatcher.stats.print_summary(f"concurrency={level}")
+
+
+def compare_batch_sizes(records: List[Dict[str, Any]], sizes: List[int], latency: float,
+                        per_record_latency: float, timeout: float, concurrency: int) -> None:
+    """Records/sec for each fixed batch size against the adaptive sizer"""
+    name = "tournaments:importTournamentsBatch"
+    runs = [(f"fixed {size}", BatchSizer(name, size, adaptive=False)) for size in sizes]
+    runs.append(("adaptive", BatchSizer(name, sizes[0], target_p95=timeout * 0.8)))
+
+    for label, sizer in runs:
+        backend = StubBackend(latency=latency, per_record_latency=per_record_latency, timeout=timeout)
+        dispatcher = BatchDispatcher(ImportRuntime(backend), name, "tournaments",
+                                     concurrency=concurrency, sizer=sizer)
+        start = time.perf_counter()
+        sent = failed = 0
+        for _, batch, result in dispatcher.dispatch(sizer.batches(records)):
+            if isinstance(result, Exception):
+                failed += len(batch)
+            else:
+                sent += len(batch)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:>10}: {sent / elapsed:8.1f} records/sec, {failed} records failed, "
+              f"final size {sizer.size}, sizes {sizer.history}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tournaments", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated seconds per call")
+    parser.add_argument("--sweep", help="Comma-separated dispatcher concurrency levels to compare")
+    parser.add_argument("--max-in-flight", type=int, default=6, help="Stub rate limit for --sweep")
+    parser.add_argument("--batch-sizes", help="Comma-separated fixed batch sizes to compare with adaptive")
+    parser.add_argument("--per-record-latency", type=float, default=0.002,
+                        help="Simulated seconds per record for --batch-sizes")
+    parser.add_argument("--timeout", type=float, default=1.0, help="Stub mutation timeout for --batch-sizes")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    records = synthetic_tournaments(args.tournaments)
+
+    if args.sweep:
+        levels = [int(level) for level in args.sweep.split(",")]
+        sweep_concurrency(records, args.batch_size, levels, args.latency, args.max_in_flight)
+        return
+
+    if args.batch_sizes:
+        sizes = [int(size) for size in args.batch_sizes.split(",")]
+        print(f"{len(records)} tournaments, {args.latency * 1000:.0f}ms + "
+              f"{args.per_record_latency * 1000:.1f}ms/record, timeout {args.timeout}s")
+        compare_batch_sizes(records, sizes, args.latency, args.per_record_latency,
+                            args.timeout, args.concurrency)
+        return
+
+    batches = (len(records) + args.batch_size - 1) // args.batch_size
+
+    pooled = time_runtime(ImportRuntime(StubBackend(latency=args.latency)), records, args.batch_size)
+
+    scripts_dir = str(Path(__file__).resolve().parent.parent)
+    command = [sys.executable, "-c",
+               f"import sys; sys.path.insert(0, {scripts_dir!r}); "
+               "from golfgod_import.stub import main; main(sys.argv)"]
+    subprocess_time = time_runtime(ImportRuntime(SubprocessBackend(command)), records, args.batch_size)
+
+    print(f"Batches: {batches} x {args.batch_size} tournaments")
+    print(f"  subprocess: {subprocess_time:.3f}s ({batches / subprocess_time:.1f} batches/sec)")
+    print(f"  pooled:     {pooled:.3f}s ({batches / pooled:.1f} batches/sec)")
+    print(f"  speedup:    {subprocess_time / pooled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Offline end-to-end benchmark of the importers against a stored baseline.
+
+For each scale (1x, 10x, 100x of the real source sizes) this generates
+synthetic schedules, results, round stats, photos and bios
+(golfgod_import.synthetic), starts the local HTTP stand-in
+(golfgod_import.standin) with the requested latency and failure injection,
+and runs each importer through the real CLI code path over --backend http. Every run gets a scratch state directory and
+sends everything (--full --no-cache), so runs are comparable.
+
+Results are compared with the stored baseline for the same settings and
+any step that got slower by more than --tolerance is reported as a
+regression (exit code 1). --save-baseline records this run as the new
+baseline.
+
+Usage (from the scripts directory):
+    python -m golfgod_import.benchsuite --scales 1,10 --latency 0.02 --jitter 0.01
+    python -m golfgod_import.benchsuite --scales 1,10 --latency 0.02 --jitter 0.01 --save-baseline
+    python -m golfgod_import.benchsuite --scales 100 --failure-rate 0.01 --throttle-rate 0.01
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import config
+from .cli import parse_args, run_command
+from .profiling import Profiler
+from .runtime import ImportRuntime
+from .standin import StandIn
+from .stub import StubBackend
+from .synthetic import generate
+
+STEPS = ("tournaments", "results", "rounds", "photos", "bios")
+# CLI flag carrying each importer's input, and the dataset key it comes from
+INPUTS = {
+    "tournaments": ("--schedule-file", "schedule_file"),
+    "results": ("--results-dir", "results_dir"),
+    "rounds": ("--rounds-file", "rounds_file"),
+    "photos": ("--photos-file", "photos_file"),
+    "bios": ("--bios-file", "bios_file"),
+}
+SETTINGS = ("latency", "jitter", "failure_rate", "throttle_rate", "concurrency", "workers", "batch_size", "seed")
+
+
+def run_step(url: str, step: str, dataset: Dict[str, Any], args: argparse.Namespace) -> Dict[str, Any]:
+    """Run one importer against the stand-in; returns its timings"""
+    flag, key = INPUTS[step]
+    argv = [step, "--backend", "http", "--url", url, "--full", "--no-cache",
+            "--concurrency", str(args.concurrency), flag, dataset[key]]
+    if step == "results" and args.workers:
+        argv += ["--workers", str(args.workers)]
+    if args.batch_size:
+        argv += ["--batch-size", str(args.batch_size)]
+
+    profiler = Profiler(enabled=True)
+    output = io.StringIO()
+    error = None
+    start = time.perf_counter()
+    with ImportRuntime.create("http", url, profiler) as runtime:
+        with contextlib.redirect_stdout(sys.stdout if args.verbose else output):
+            try:
+                code = run_command(runtime, step, parse_args(argv))
+            except Exception as e:
+                # Injected failures can still escape an importer; record the step as failed
+                code, error = 1, f"{type(e).__name__}: {e}"
+    seconds = time.perf_counter() - start
+
+    calls = profiler.report()["calls"]
+    records = dataset["records"][step]
+    return {
+        "exitCode": code,
+        "error": error,
+        "seconds": round(seconds, 3),
+        "records": records,
+        "recordsPerSec": round(records / seconds, 1) if seconds else 0.0,
+        "calls": sum(c["calls"] for c in calls.values()),
+        "errors": sum(c["errors"] for c in calls.values()),
+        "retries": sum(c["retries"] for c in calls.values()),
+        "requestBytes": sum(c["requestBytes"] for c in calls.values()),
+        "p95Ms": max((c["p95Ms"] for c in calls.values()), default=0.0),
+    }
+
+
+def run_scale(scale: int, args: argparse.Namespace, data_root: Path) -> Dict[str, Any]:
+    print(f"\n{scale}x: generating datasets...", flush=True)
+    dataset = generate(data_root / f"{scale}x", scale, args.seed)
+    print("  " + ", ".join(f"{count} {name}" for name, count in dataset["records"].items()))
+
+    standin = StandIn(StubBackend(), latency=args.latency, jitter=args.jitter,
+                      failure_rate=args.failure_rate, throttle_rate=args.throttle_rate, seed=args.seed)
+    results: Dict[str, Any] = {}
+    previous = config.STATE_DIR
+    with standin, tempfile.TemporaryDirectory(prefix="golfgod-bench-") as state_dir:
+        # Fresh manifests, checkpoints and batch sizes; env var for spawned workers
+        config.STATE_DIR = Path(state_dir)
+        os.environ["GOLFGOD_IMPORT_STATE_DIR"] = state_dir
+        try:
+            results.update(run_steps(standin, dataset, args))
+        finally:
+            config.STATE_DIR = previous
+            os.environ.pop("GOLFGOD_IMPORT_STATE_DIR", None)
+        results["standin"] = dict(standin.counts)
+    return results
+
+
+def run_steps(standin: StandIn, dataset: Dict[str, Any], args: argparse.Namespace) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for step in args.steps:
+        r = results[step] = run_step(standin.url, step, dataset, args)
+        print(f"  {step:<12} {r['seconds']:>8.2f}s  {r['recordsPerSec']:>9.1f} records/sec  "
+              f"{r['calls']} calls, {r['errors']} errors, {r['retries']} retries, p95 ≤{r['p95Ms']}ms"
+              + (f"  (exit {r['exitCode']})" if r["exitCode"] else ""), flush=True)
+        if r["error"]:
+            print(f"  {'':<12} failed: {r['error']}", flush=True)
+    return results
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float) -> List[str]:
+    """Print seconds against the baseline; returns the regressions"""
+    regressions = []
+    print(f"\nAgainst baseline from {baseline['created']} (tolerance {tolerance:.0%}):")
+    for scale, steps in current["results"].items():
+        for step, r in steps.items():
+            before = baseline["results"].get(scale, {}).get(step)
+            if step == "standin" or not before:
+                continue
+            if r["exitCode"] or before.get("exitCode"):
+                # A failed run's time says nothing about speed
+                print(f"  {scale:>5} {step:<12} not compared (exit {before.get('exitCode')} → {r['exitCode']})")
+                continue
+            change = (r["seconds"] - before["seconds"]) / before["seconds"] if before["seconds"] else 0.0
+            flag = ""
+            if change > tolerance:
+                flag = "  REGRESSION"
+                regressions.append(f"{scale} {step}")
+            elif change < -tolerance:
+                flag = "  faster"
+            print(f"  {scale:>5} {step:<12} {before['seconds']:>8.2f}s → {r['seconds']:>8.2f}s ({change:+.1%}){flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="1,10", help="Comma-separated dataset scale factors, e.g. 1,10,100")
+    parser.add_argument("--steps", default=",".join(STEPS), help="Importers to run, in order")
+    parser.add_argument("--latency", type=float, default=0.02, help="Stand-in seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.01, help="Stand-in extra random delay per request")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests failing with a 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests rejected with a 429")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2, help="Result parser processes")
+    parser.add_argument("--batch-size", type=int, help="Fixed records per mutation (default: importer's own)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--baseline", help="Baseline JSON (default: .import_state/bench/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Slowdown reported as a regression")
+    parser.add_argument("--verbose", action="store_true", help="Show the importers' own output")
+    args = parser.parse_args(argv)
+    args.steps = [step for step in args.steps.split(",") if step]
+
+    # Resolved before runs swap STATE_DIR for scratch directories
+    baseline_path = Path(args.baseline) if args.baseline else config.state_path("bench", "baseline.json")
+    data_root = config.state_path("bench", "data", "x").parent
+
+    current = {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "settings": {name: getattr(args, name) for name in SETTINGS},
+        "results": {f"{scale}x": run_scale(int(scale), args, data_root) for scale in args.scales.split(",")},
+    }
+
+    failed = [f"{scale} {step}" for scale, steps in current["results"].items()
+              for step, r in steps.items() if step != "standin" and r["exitCode"]]
+    if failed:
+        print(f"\n⚠️  {len(failed)} steps failed: {', '.join(failed)}")
+
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(current, indent=2))
+        print(f"\nBaseline saved to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"\nNo baseline at {baseline_path}; run with --save-baseline to create one")
+        return 0
+    baseline = json.loads(baseline_path.read_text())
+    if baseline.get("settings") != current["settings"]:
+        print(f"\nBaseline settings differ ({baseline.get('settings')}); not comparing")
+        return 0
+
+    regressions = compare(baseline, current, args.tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressions: {', '.join(regressions)}")
+        return 1
+    print("\n✅ No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Import player biographies from CSV into the players table
+"""
+
+import os
+from typing import Any, Dict, List
+
+from .batching import batch_sizer
+from .cache import ParseCache
+from .checkpoint import CheckpointJournal
+from .dispatcher import BatchDispatcher
+from .manifest import ChangeManifest
+from .normalize import normalize_bios
+from .rejects import RejectFile
+from .resolver import PlayerIndex, ReviewFile, ensure_name_index, resolve_players, split_resolved
+from .runtime import ImportRuntime
+from .snapshots import BIO_COUNTERS, print_diff, take_snapshot
+
+BIOS_FILE = "/Users/tjmcgovern/golfdata/player_bios_all_200.csv"
+BATCH_SIZE = 20  # Process in batches of 20
+CACHE_KIND = "bios:1"  # Bump when normalize_bios output changes
+MUTATION = "playerBios:updatePlayerBiosById"
+
+def run(client: ImportRuntime, args: Any) -> int:
+    """Import the bios CSV; returns a process exit code"""
+    csv_file = args.bios_file or BIOS_FILE
+
+    if not os.path.exists(csv_file):
+        print(f"Error: CSV file not found at {csv_file}")
+        return 1
+
+    print(f"Reading CSV file: {csv_file}")
+
+    total_stats = {
+        'total_processed': 0,
+        'total_updated': 0,
+        'total_skipped': 0,
+        'total_errors': []
+    }
+
+    manifest = ChangeManifest("bios", "espnId")
+    profiler = client.profiler
+
+    profiler.phase("status")
+    before = take_snapshot(client)
+
+    profiler.phase("read")
+    try:
+        with ParseCache(enabled=not args.no_cache) as cache:
+            records, skipped_rows = cache.load(CACHE_KIND, csv_file, normalize_bios)
+            cache.print_summary("bios")
+    except Exception as e:
+        print(f"Error reading CSV file: {e}")
+        return 1
+
+    for row_num in skipped_rows:
+        print(f"  Skipping row {row_num}: Missing ESPN ID or player name")
+    total_stats['total_skipped'] += len(skipped_rows)
+
+    # Only send bios that are new or changed since the last run
+    bios = [bio for bio in records if manifest.classify(bio) != "unchanged" or args.full]
+
+    # Resolve every ESPN ID / name to a player _id locally, then patch by ID
+    profiler.phase("resolve")
+    print(f"Resolving {len(bios)} players...")
+    review = ReviewFile("bios")
+    ensure_name_index(client)
+    index = PlayerIndex.load(client, args.min_confidence)
+    matched, unmatched = split_resolved(bios, resolve_players(index, bios, review=review))
+    review.save()
+    for bio in unmatched:
+        total_stats['total_skipped'] += 1
+        total_stats['total_errors'].append(f"Player not found: {bio['playerName']} (ESPN ID: {bio['espnId']})")
+
+    payloads = [
+        dict({k: v for k, v in bio.items() if k not in ('espnId', 'playerName')}, playerId=player_id)
+        for player_id, bio in matched
+    ]
+    espn_ids = {player_id: bio['espnId'] for player_id, bio in matched}
+
+    def mark_sent(batch: List[Dict[str, Any]]) -> None:
+        manifest.mark_keys(espn_ids[p['playerId']] for p in batch)
+
+    # Batches that finished in an interrupted run are skipped on --resume
+    journal = CheckpointJournal("bios", resume=args.resume)
+    sizer = batch_sizer(MUTATION, args.batch_size, BATCH_SIZE)
+    rejects = RejectFile("bios", resume=args.resume)
+    dispatcher = BatchDispatcher(
+        client, MUTATION, "players", concurrency=args.concurrency, sizer=sizer, rejects=rejects
+    )
+
+    profiler.phase("send")
+    batches = sizer.batches(journal.pending(MUTATION, payloads, on_skip=mark_sent))
+    for batch_num, batch, result in dispatcher.dispatch(batches):
+        print(f"\nBatch {batch_num}: {len(batch)} players...")
+
+        if isinstance(result, Exception):
+            journal.record(MUTATION, batch_num, batch, result)
+            print(f"Error calling Convex mutation: {result}")
+            result = {"updated": 0, "skipped": len(batch), "errors": [str(result)]}
+        else:
+            # Players whose update errored stay unsent for the next run / --resume
+            failed_ids = set(result.get('failed') or ())
+            failed = [p for p in batch if p['playerId'] in failed_ids]
+            journal.record(MUTATION, batch_num, batch, result, failed)
+            mark_sent([p for p in batch if p['playerId'] not in failed_ids])
+
+        # Update statistics
+        total_stats['total_processed'] += len(batch)
+        total_stats['total_updated'] += result.get('updated', 0)
+        total_stats['total_skipped'] += result.get('skipped', 0)
+        if result.get('errors'):
+            total_stats['total_errors'].extend(result['errors'])
+
+        print(f"  Updated: {result.get('updated', 0)}")
+        print(f"  Skipped: {result.get('skipped', 0)}")
+
+        if result.get('errors'):
+            for error in result['errors'][:5]:  # Show first 5 errors
+                print(f"  Error: {error}")
+
+    print()
+    dispatcher.stats.print_summary("updatePlayerBiosById")
+    sizer.print_summary()
+    sizer.save()
+    journal.print_summary()
+    journal.close()
+    rejects.print_summary()
+    rejects.close()
+    manifest.print_summary()
+    manifest.save()
+
+    # Print final summary
+    print("\n" + "="*50)
+    print("IMPORT SUMMARY")
+    print("="*50)
+    print(f"Total rows processed: {total_stats['total_processed']}")
+    print(f"Successfully updated: {total_stats['total_updated']}")
+    print(f"Skipped: {total_stats['total_skipped']}")
+    print(f"Errors encountered: {len(total_stats['total_errors'])}")
+
+    if total_stats['total_errors']:
+        print("\nFirst 10 errors:")
+        for error in total_stats['total_errors'][:10]:
+            print(f"  - {error}")
+
+    print("\n✅ Biography import completed!")
+
+    # Completeness from the maintained counters, against the snapshot taken before sending
+    profiler.phase("completeness")
+    after = take_snapshot(client)
+    print_diff(before, after, BIO_COUNTERS)
+
+    return 0
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of normalized, mutation-ready records per source file.
+
+Each entry is keyed by the transform that produced it and the source path.
+It stores the file's size, mtime and content hash. A lookup whose size and
+mtime still match loads the cached records without touching the source. If
+only the mtime changed, the content hash is checked before reuse. Anything
+else is a miss, and the records are parsed again and stored.
+
+Entries are serialized with msgpack when it is installed (pip install
+msgpack) and pickle otherwise. They live under .import_state/parse_cache,
+with a SQLite index shared safely by the results worker processes. The
+least recently used entries are evicted once the cache grows past its size
+limit.
+
+Bump a transform's kind string (e.g. "bios:1" → "bios:2") whenever its
+output shape changes, so stale entries are never read.
+
+    python -m golfgod_import.cache            # Show what is cached
+    python -m golfgod_import.cache --clear
+"""
+
+import argparse
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+from .config import state_path
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+HASH_CHUNK = 1024 * 1024
+FORMAT = "msgpack" if msgpack is not None else "pickle"
+
+
+def file_hash(path: Union[str, Path]) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _dumps(value: Any) -> bytes:
+    if msgpack is not None:
+        return msgpack.packb(value, use_bin_type=True)
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _loads(data: bytes, fmt: str) -> Any:
+    if fmt == "msgpack":
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    return pickle.loads(data)
+
+
+class ParseCache:
+    """Normalized records per (transform, source file), evicted LRU by total size"""
+
+    def __init__(self, enabled: bool = True, root: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.enabled = enabled
+        self.root = root or state_path("parse_cache", "index.sqlite").parent
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.root / "index.sqlite"), timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    size INTEGER,
+                    mtime_ns INTEGER,
+                    sha1 TEXT,
+                    format TEXT,
+                    bytes INTEGER,
+                    last_used REAL
+                )"""
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def _key(kind: str, path: Path) -> str:
+        return hashlib.sha1(f"{kind}\0{path}".encode("utf-8")).hexdigest()
+
+    def _file(self, key: str, fmt: str) -> Path:
+        return self.root / f"{key}.{fmt}"
+
+    def get(self, kind: str, path: Union[str, Path]) -> Optional[Any]:
+        """Cached records for an unchanged source file, else None"""
+        if not self.enabled:
+            return None
+        path = Path(path).resolve()
+        key = self._key(kind, path)
+        row = self.conn.execute(
+            "SELECT size, mtime_ns, sha1, format FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        size, mtime_ns, sha1, fmt = row
+        stat = path.stat()
+        if stat.st_size != size:
+            return None
+        if stat.st_mtime_ns != mtime_ns:
+            if file_hash(path) != sha1:
+                return None
+            self.conn.execute("UPDATE entries SET mtime_ns = ? WHERE key = ?", (stat.st_mtime_ns, key))
+        if fmt == "msgpack" and msgpack is None:
+            return None
+        try:
+            with open(self._file(key, fmt), "rb") as f:
+                value = _loads(f.read(), fmt)
+        except (OSError, ValueError, pickle.UnpicklingError):
+            return None  # Evicted or torn by another process; parse again
+        self.conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        self.conn.commit()
+        return value
+
+    def put(self, kind: str, path: Union[str, Path], value: Any, stat: Optional[os.stat_result] = None,
+            sha1: Optional[str] = None) -> None:
+        """Store records for a source file and evict down to max_bytes"""
+        if not self.enabled:
+            return
+        path = Path(path).resolve()
+        stat = stat or path.stat()
+        sha1 = sha1 or file_hash(path)
+        key = self._key(kind, path)
+        data = _dumps(value)
+        target = self._file(key, FORMAT)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, kind, str(path), stat.st_size, stat.st_mtime_ns, sha1, FORMAT, len(data), time.time())
+        )
+        self.conn.commit()
+        self.evict(keep=key)
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """Drop least recently used entries until the cache fits max_bytes"""
+        total = self.conn.execute("SELECT COALESCE(SUM(bytes), 0) FROM entries").fetchone()[0]
+        evicted = 0
+        if total <= self.max_bytes:
+            return evicted
+        for key, fmt, size in self.conn.execute(
+            "SELECT key, format, bytes FROM entries ORDER BY last_used"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self._file(key, fmt).unlink(missing_ok=True)
+            self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        self.conn.commit()
+        return evicted
+
+    def load(self, kind: str, path: Union[str, Path], parse: Callable[[Union[str, Path]], Any]) -> Any:
+        """parse(path), served from the cache while the file is unchanged"""
+        value = self.get(kind, path)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        stat, sha1 = self._fingerprint(path)
+        value = parse(path)
+        self.put(kind, path, value, stat, sha1)
+        return value
+
+    def stream(
+        self,
+        kind: str,
+        path: Union[str, Path],
+        parse: Callable[[Union[str, Path]], Iterable[Any]]
+    ) -> Iterator[Any]:
+        """Like load for a record stream; a miss streams through and is stored once fully read"""
+        cached = self.get(kind, path)
+        if cached is not None:
+            self.hits += 1
+            yield from cached
+            return
+        self.misses += 1
+        stat, sha1 = self._fingerprint(path)
+        records = []
+        for record in parse(path):
+            records.append(record)
+            yield record
+        self.put(kind, path, records, stat, sha1)
+
+    def _fingerprint(self, path: Union[str, Path]) -> Any:
+        # Taken before parsing, so an edit during the parse is caught next run
+        if not self.enabled:
+            return None, None
+        return Path(path).stat(), file_hash(path)
+
+    def stats(self) -> Dict[str, Any]:
+        entries, total = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM entries").fetchone()
+        kinds = dict(self.conn.execute("SELECT kind, COUNT(*) FROM entries GROUP BY kind").fetchall())
+        return {"entries": entries, "bytes": total, "maxBytes": self.max_bytes, "kinds": kinds}
+
+    def print_summary(self, label: str) -> None:
+        if self.enabled and (self.hits or self.misses):
+            print(f"Parse cache ({label}): {self.hits} hits, {self.misses} misses")
+
+    def clear(self) -> int:
+        rows = self.conn.execute("SELECT key, format FROM entries").fetchall()
+        for key, fmt in rows:
+            self._file(key, fmt).unlink(missing_ok=True)
+        self.conn.execute("DELETE FROM entries")
+        self.conn.commit()
+        return len(rows)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "ParseCache":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clear", action="store_true", help="Delete every cached entry")
+    args = parser.parse_args()
+
+    cache = ParseCache()
+    if args.clear:
+        print(f"Removed {cache.clear()} cached entries")
+    s = cache.stats()
+    print(f"{s['entries']} entries, {s['bytes'] / 1e6:.1f} of {s['maxBytes'] / 1e6:.0f} MB ({FORMAT})")
+    for kind, count in sorted(s["kinds"].items()):
+        print(f"  {kind}: {count}")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Checkpoint journal so an interrupted import can resume where it stopped.
+
+Every batch gets an idempotency key derived from the function name and the
+batch contents. The journal (a small SQLite file per importer under
+.import_state/checkpoints) records each key's outcome, plus the hashes of
+the records it delivered, as soon as the batch returns, so a crash or Ctrl-C
+loses at most the batches still in flight. Records the server reported as
+failed inside an otherwise successful batch are not counted as delivered.
+With --resume, delivered records are skipped and only failed or never-sent
+ones are re-driven. Skipping happens per record, so it still works when batch sizes
+differ between attempts.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .config import state_path
+from .manifest import record_hash
+
+Batch = List[Dict[str, Any]]
+
+
+def batch_key(name: str, batch: Batch) -> str:
+    """Idempotency key for one batch sent to a Convex function"""
+    return _key(name, [record_hash(record) for record in batch])
+
+
+def _key(name: str, hashes: List[str]) -> str:
+    digest = hashlib.sha1(name.encode("utf-8"))
+    for h in hashes:
+        digest.update(h.encode("ascii"))
+    return digest.hexdigest()
+
+
+class CheckpointJournal:
+    """Per-importer record of which batches have completed"""
+
+    def __init__(self, run: str, resume: bool = False, path: Optional[Path] = None):
+        self.run = run
+        self.resume = resume
+        self.path = path or state_path("checkpoints", f"{run}.sqlite")
+        self.skipped = 0
+        self.conn = sqlite3.connect(str(self.path))
+        # WAL commits skip the per-batch fsync but still survive a killed process
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS batches (
+                key TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                batch_num INTEGER,
+                size INTEGER,
+                status TEXT NOT NULL,
+                result TEXT,
+                updated_at REAL
+            )"""
+        )
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS delivered (
+                name TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                PRIMARY KEY (name, hash)
+            )"""
+        )
+        if not resume:
+            self.conn.execute("DELETE FROM batches")
+            self.conn.execute("DELETE FROM delivered")
+        self.conn.commit()
+
+    def is_done(self, key: str) -> bool:
+        row = self.conn.execute("SELECT status FROM batches WHERE key = ?", (key,)).fetchone()
+        return bool(row) and row[0] == "done"
+
+    def pending(
+        self,
+        name: str,
+        records: Iterable[Dict[str, Any]],
+        on_skip: Optional[Callable[[Batch], None]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield only records no completed batch has delivered yet"""
+        if not self.resume:
+            yield from records
+            return
+
+        delivered = {
+            row[0] for row in self.conn.execute("SELECT hash FROM delivered WHERE name = ?", (name,))
+        }
+        for record in records:
+            if record_hash(record) in delivered:
+                self.skipped += 1
+                if on_skip:
+                    on_skip([record])
+                continue
+            yield record
+
+    def record(
+        self,
+        name: str,
+        batch_num: int,
+        batch: Batch,
+        result: Any,
+        failed: Optional[Batch] = None
+    ) -> None:
+        """Store a batch outcome; exceptions are recorded as failed
+
+        `failed` lists the records of a returned batch that the server
+        reported as errors; they stay undelivered so --resume re-drives them.
+        """
+        raised = isinstance(result, Exception)
+        payload = str(result) if raised else json.dumps(result, default=str)
+        hashes = [record_hash(record) for record in batch]
+        failed_hashes = {record_hash(record) for record in failed or ()}
+        status = "failed" if raised else "partial" if failed_hashes else "done"
+        self.conn.execute(
+            "INSERT OR REPLACE INTO batches VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (_key(name, hashes), name, batch_num, len(batch), status, payload, time.time())
+        )
+        if not raised:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO delivered VALUES (?, ?)",
+                ((name, h) for h in hashes if h not in failed_hashes)
+            )
+        self.conn.commit()
+
+    def counts(self) -> Dict[str, int]:
+        rows = self.conn.execute("SELECT status, COUNT(*) FROM batches GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def print_summary(self) -> None:
+        c = self.counts()
+        print(f"Checkpoint ({self.run}): {c.get('done', 0)} batches done, {c.get('partial', 0)} with failed "
+              f"records, {c.get('failed', 0)} failed, {self.skipped} records skipped as already delivered")
+        if c.get("failed") or c.get("partial"):
+            print("  Re-run with --resume to retry only the failed records")
+
+    def close(self) -> None:
+        self.conn.close()
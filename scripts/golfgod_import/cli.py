@@ -0,0 +1,271 @@
+"""
+golfgod-import: one entry point for every Convex import.
+
+    golfgod-import tournaments [--years 2026 --fix-2026]
+    golfgod-import bios
+    golfgod-import photos
+    golfgod-import results --results-dir <dir>
+    golfgod-import rounds --rounds-file <csv>
+    golfgod-import all [--results-dir <dir> --rounds-file <csv>]
+    golfgod-import summaries [--repair]
+    golfgod-import search [terms...] [--synthetic 1000,10000,100000 --cleanup]
+    golfgod-import maintenance tournaments|results|players|all [--resume]
+    golfgod-import export [tables...] [--incremental]
+    golfgod-import validate [tables...] [--shards 8 --cleanup]
+    golfgod-import photos --profile [--cprofile]
+
+--profile records wall time per import phase, a latency histogram per Convex
+function, payload bytes and retries, and writes them as JSON under
+.import_state/profiles. --cprofile adds the hottest Python functions.
+
+Every subcommand in a run shares one Convex client. Importer modules are
+loaded only once a subcommand is chosen, and nothing connects at import
+time, so --help stays fast.
+"""
+
+import argparse
+import importlib
+import sys
+from typing import List, Optional
+
+# Subcommand → importer module (loaded lazily); each exposes run(runtime, args)
+COMMANDS = {
+    "tournaments": "golfgod_import.tournaments",
+    "results": "golfgod_import.results",
+    "rounds": "golfgod_import.rounds",
+    "photos": "golfgod_import.photos",
+    "bios": "golfgod_import.bios",
+    "summaries": "golfgod_import.summaries",
+    "search": "golfgod_import.search",
+    "maintenance": "golfgod_import.maintenance",
+    "export": "golfgod_import.export",
+    "validate": "golfgod_import.validate",
+}
+
+# `all` runs importers in dependency order: schedules first, then results
+# (which create players by ESPN ID) and the round stats linked to them, then
+# photos and bios that enrich the players
+PIPELINE = ("tournaments", "results", "rounds", "photos", "bios")
+# Pipeline steps that only run when their input option is given
+OPTIONAL_INPUTS = {"results": "results_dir", "rounds": "rounds_file"}
+
+
+def _add_common(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--backend", choices=["convex", "http", "subprocess", "stub"], default="convex",
+                        help="http speaks the Convex HTTP API, e.g. to the local stand-in")
+    parser.add_argument("--url", help="Convex deployment URL (default: NEXT_PUBLIC_CONVEX_URL / CONVEX_URL)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Batches kept in flight at once")
+    parser.add_argument("--batch-size", type=int, help="Records per mutation (default: per importer)")
+    parser.add_argument("--full", action="store_true", help="Send every record, ignoring the change manifest")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip batches that completed in the last interrupted run")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-parse source files instead of loading cached records")
+    parser.add_argument("--min-confidence", type=float, default=0.85,
+                        help="Lowest fuzzy name-match score accepted without review")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time phases and Convex calls; write a JSON report and print a summary")
+    parser.add_argument("--cprofile", action="store_true",
+                        help="Run under cProfile and print the hottest functions")
+
+
+def _add_tournaments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--schedule-file", help="PGA Tour schedule JSON")
+    parser.add_argument("--years", type=int, nargs="+", help="Only import these seasons")
+    parser.add_argument("--clear", action="store_true", help="Clear existing tournaments first")
+    parser.add_argument("--tombstones", action="store_true",
+                        help="Delete tournaments that disappeared from the source file")
+    parser.add_argument("--fix-2026", action="store_true",
+                        help="Run fix2026TournamentData after importing")
+
+
+def _add_bios(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--bios-file", help="Player bios CSV")
+
+
+def _add_photos(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--photos-file", help="Player photos CSV")
+
+
+def _add_results(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--results-dir", help="Directory of {espnId}_{First}_{Last}.json player files")
+    parser.add_argument("--workers", type=int, help="Processes parsing result files (default: CPU count)")
+
+
+def _add_rounds(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--rounds-file", help="Round-level stats CSV, one row per player round")
+    parser.add_argument("--chunk-rows", type=int, default=50000, help="Rows read and validated at a time")
+
+
+def _add_summaries(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--repair", action="store_true", help="Rebuild years whose summaries differ")
+
+
+def _add_search(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("terms", nargs="*", help="Search terms (default: a built-in benchmark set)")
+    parser.add_argument("--limit", type=int, default=50, help="Results per page")
+    parser.add_argument("--pages", type=int, default=1, help="Pages to follow per term")
+    parser.add_argument("--repeat", type=int, default=3, help="Run every term N times")
+    parser.add_argument("--synthetic", help="Benchmark at these table sizes, e.g. 1000,10000,100000")
+    parser.add_argument("--cleanup", action="store_true", help="Delete the synthetic tournaments afterwards")
+    parser.add_argument("--backfill", action="store_true", help="Fill searchText on existing tournaments first")
+
+
+def _add_maintenance(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("jobs", nargs="*", metavar="job",
+                        help="What to clear: tournaments, results, players or all")
+    parser.add_argument("--preserve-follows", action="store_true",
+                        help="Keep userFollows rows when clearing players")
+
+
+def _add_export(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("tables", nargs="*", metavar="table",
+                        help="Tables to export (default: players, tournamentResults, pgaTournaments, "
+                             "courses, playerCourseStats)")
+    parser.add_argument("--out", help="Snapshot directory (default: .import_state/snapshots)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Append only newly created rows of append-only tables (tournamentResults); "
+                             "other tables are always read in full")
+    parser.add_argument("--keep", type=int, default=3, help="Snapshot versions to keep")
+
+
+def _add_validate(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("tables", nargs="*", metavar="table",
+                        help="Tables to check (default: players, tournamentResults, playerStats, "
+                             "userFollows, playerCourseStats, roundStats)")
+    parser.add_argument("--shards", type=int, help="Creation-time slices per table (default: --concurrency)")
+    parser.add_argument("--cleanup", action="store_true", help="Delete the orphaned rows found")
+    parser.add_argument("--report", help="JSON report path (default: .import_state/validation/report.json)")
+
+
+ARGUMENTS = {
+    "tournaments": _add_tournaments,
+    "bios": _add_bios,
+    "photos": _add_photos,
+    "results": _add_results,
+    "rounds": _add_rounds,
+}
+
+# Commands that check or maintain data rather than import it (not part of `all`)
+TOOLS = {
+    "summaries": _add_summaries,
+    "search": _add_search,
+    "maintenance": _add_maintenance,
+    "export": _add_export,
+    "validate": _add_validate,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="golfgod-import", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.required = True
+
+    helps = {
+        "tournaments": "Import PGA Tour schedules",
+        "bios": "Import player biographies",
+        "photos": "Import player photos and world rankings",
+        "results": "Import per-player tournament results",
+        "rounds": "Import round-level stats linked to tournament results",
+        "summaries": "Verify materialized year summaries against a full recomputation",
+        "search": "Search tournaments and benchmark search latency",
+        "maintenance": "Clear tables in bounded, resumable pages",
+        "export": "Snapshot tables to local Arrow files for offline analysis (--incremental appends new tournamentResults rows)",
+        "validate": "Check every row for duplicates, orphans and missing rankings in parallel shards",
+    }
+    for name, add_arguments in {**ARGUMENTS, **TOOLS}.items():
+        sub = subparsers.add_parser(name, help=helps[name])
+        _add_common(sub)
+        add_arguments(sub)
+
+    everything = subparsers.add_parser("all", help="Run every import in dependency order")
+    _add_common(everything)
+    for add_arguments in ARGUMENTS.values():
+        add_arguments(everything)
+    return parser
+
+
+def run_command(runtime, name: str, args: argparse.Namespace) -> int:
+    module = importlib.import_module(COMMANDS[name])
+    runtime.profiler.begin_step(name)
+    try:
+        return module.run(runtime, args) or 0
+    finally:
+        runtime.profiler.end_step()
+
+
+def write_profile(profiler, cpu, label: str) -> None:
+    """Save and summarise --profile / --cprofile output for this run"""
+    from .profiling import hot_functions, print_hot_functions, report_base
+
+    base = report_base(label)
+    extra = {}
+    if cpu:
+        cpu.dump_stats(base + ".prof")
+        print_hot_functions(base + ".prof")
+        extra["hotFunctions"] = hot_functions(base + ".prof")
+    if profiler.enabled:
+        profiler.print_summary()
+        profiler.write(base + ".json", extra)
+        print(f"Profile written to {base}.json")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    args = build_parser().parse_args(argv)
+
+    # Fill in options that only some subcommands define
+    for add_arguments in (*ARGUMENTS.values(), *TOOLS.values()):
+        defaults = argparse.ArgumentParser(add_help=False)
+        add_arguments(defaults)
+        for key, value in vars(defaults.parse_args([])).items():
+            if not hasattr(args, key):
+                setattr(args, key, value)
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    if args.command == "all":
+        steps = [name for name in PIPELINE if name not in OPTIONAL_INPUTS or getattr(args, OPTIONAL_INPUTS[name])]
+    else:
+        steps = [args.command]
+
+    from .profiling import Profiler
+    from .runtime import ImportRuntime
+
+    profiler = Profiler(enabled=args.profile)
+    cpu = None
+    if args.cprofile:
+        import cProfile
+        cpu = cProfile.Profile()
+
+    try:
+        with ImportRuntime.create(args.backend, args.url, profiler) as runtime:
+            if cpu:
+                cpu.enable()
+            try:
+                for name in steps:
+                    if len(steps) > 1:
+                        print(f"\n{'=' * 50}\n{name.upper()}\n{'=' * 50}")
+                    code = run_command(runtime, name, args)
+                    if code:
+                        print(f"\n❌ {name} import failed; stopping")
+                        return code
+                print(f"\n{runtime.calls} Convex calls in {runtime.call_seconds:.2f}s")
+            finally:
+                if cpu:
+                    cpu.disable()
+                # A failed or interrupted run is often the one worth profiling
+                if cpu or profiler.enabled:
+                    write_profile(profiler, cpu, args.command)
+    except KeyboardInterrupt:
+        print("\n\n❌ Import cancelled by user. Run again with --resume to continue.")
+        return 130
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+Environment and Convex URL resolution shared by the import scripts
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Fallback deployment used when no env var is set
+DEFAULT_CONVEX_URL = "https://brainy-tiger-452.convex.cloud"
+
+
+def load_env() -> None:
+    """Load .env.local and .env from the repo root if python-dotenv is available"""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+
+    load_dotenv(REPO_ROOT / ".env.local")
+    load_dotenv(REPO_ROOT / ".env")
+
+
+def resolve_convex_url(explicit: Optional[str] = None) -> str:
+    """Resolve the Convex deployment URL from args, env vars, or the fallback"""
+    if explicit:
+        return explicit
+
+    load_env()
+    url = os.getenv("NEXT_PUBLIC_CONVEX_URL") or os.getenv("CONVEX_URL")
+    if not url:
+        url = DEFAULT_CONVEX_URL
+        print(f"Using hardcoded Convex URL: {url}")
+    return url
+
+# Local state (manifests, checkpoints, caches) kept out of git. The benchmark
+# suite points this at a scratch directory so runs do not share state.
+STATE_DIR = Path(os.getenv("GOLFGOD_IMPORT_STATE_DIR") or REPO_ROOT / ".import_state")
+
+
+def state_path(*parts: str) -> Path:
+    """Path inside the local import state directory, creating parents"""
+    path = STATE_DIR.joinpath(*parts)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
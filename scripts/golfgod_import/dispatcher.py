@@ -0,0 +1,248 @@
+"""
+Concurrent batch dispatcher that keeps N mutations in flight.
+
+Rate-limit errors pause every worker with an exponential backoff that decays
+again on success, instead of sleeping a fixed amount between batches.
+
+With a RejectFile, a batch that fails for any other reason is split in
+halves and each half re-sent, recursively, until the records the function
+refuses are isolated. Those go to the reject file; everything else is
+delivered in the largest halves that succeed, so one bad record costs
+O(log n) extra calls instead of one call per record.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+
+RATE_LIMIT_MARKERS = ("rate limit", "ratelimit", "too many requests", "429", "overloaded")
+# Errors that mean the batch was too much work, not that its records are bad
+CAPACITY_MARKERS = ("timed out", "timeout", "too many reads", "too many writes", "too large")
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """True when a Convex error looks like throttling rather than a bad batch"""
+    message = str(error).lower()
+    return any(marker in message for marker in RATE_LIMIT_MARKERS)
+
+
+def is_capacity_error(error: Exception) -> bool:
+    """True for timeouts and transport failures, which a smaller batch may avoid"""
+    if isinstance(error, OSError):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in CAPACITY_MARKERS)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class DispatchStats:
+    """Throughput and latency counters for one dispatcher run"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.finished = self.started
+        self.batches = 0
+        self.failed = 0
+        self.retries = 0
+        self.bisect_calls = 0
+        self.rejected = 0
+        self.latencies: List[float] = []
+
+    def record(self, latency: float) -> None:
+        with self.lock:
+            self.latencies.append(latency)
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = max(self.finished - self.started, 1e-9)
+        return {
+            "batches": self.batches,
+            "failed": self.failed,
+            "retries": self.retries,
+            "bisectCalls": self.bisect_calls,
+            "rejected": self.rejected,
+            "seconds": round(elapsed, 3),
+            "batchesPerSec": round(self.batches / elapsed, 2),
+            "p50Ms": round(percentile(self.latencies, 50) * 1000, 1),
+            "p95Ms": round(percentile(self.latencies, 95) * 1000, 1),
+        }
+
+    def print_summary(self, label: str = "Dispatch") -> None:
+        s = self.summary()
+        print(f"{label}: {s['batches']} batches in {s['seconds']}s "
+              f"({s['batchesPerSec']} batches/sec), p50 {s['p50Ms']}ms, p95 {s['p95Ms']}ms, "
+              f"{s['retries']} retries, {s['failed']} failed")
+        if s["bisectCalls"]:
+            print(f"  Isolated {s['rejected']} rejected records with {s['bisectCalls']} extra calls")
+
+
+class BatchDispatcher:
+    """Send batches through a runtime with at most `concurrency` calls in flight"""
+
+    def __init__(
+        self,
+        runtime: Any,
+        name: str,
+        arg_name: str,
+        concurrency: int = 4,
+        max_retries: int = 5,
+        base_backoff: float = 0.25,
+        max_backoff: float = 8.0,
+        sizer: Any = None,
+        rejects: Any = None
+    ):
+        self.runtime = runtime
+        self.name = name
+        self.arg_name = arg_name
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.sizer = sizer  # Optional BatchSizer fed with each batch's latency
+        self.rejects = rejects  # Optional RejectFile; enables bisecting failed batches
+        self.stats = DispatchStats()
+        self._lock = threading.Lock()
+        self._backoff = 0.0
+        self._pause_until = 0.0
+
+    def _wait_for_pause(self) -> None:
+        while True:
+            with self._lock:
+                delay = self._pause_until - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    def _throttled(self) -> None:
+        with self._lock:
+            self._backoff = min(self.max_backoff, max(self.base_backoff, self._backoff * 2))
+            pause = self._backoff * (1 + random.random() * 0.25)
+            self._pause_until = max(self._pause_until, time.monotonic() + pause)
+            self.stats.retries += 1
+        profiler = getattr(self.runtime, "profiler", None)
+        if profiler:
+            profiler.record_retry(self.name)
+
+    def _succeeded(self) -> None:
+        with self._lock:
+            self._backoff /= 2
+            if self._backoff < self.base_backoff / 4:
+                self._backoff = 0.0
+
+    def send(self, batch: List[Dict[str, Any]], observe: bool = True) -> Any:
+        """Send one batch, retrying rate-limit errors; other errors are returned
+
+        Bisection calls pass observe=False so isolating bad records does not
+        feed the batch sizer a run of artificially small batches.
+        """
+        attempt = 0
+        while True:
+            self._wait_for_pause()
+            start = time.perf_counter()
+            try:
+                result = self.runtime.mutation(self.name, {self.arg_name: batch})
+                latency = time.perf_counter() - start
+                self.stats.record(latency)
+                self._succeeded()
+                if self.sizer and observe:
+                    self.sizer.observe(len(batch), latency)
+                return result
+            except Exception as e:
+                latency = time.perf_counter() - start
+                self.stats.record(latency)
+                if is_rate_limited(e) and attempt < self.max_retries:
+                    attempt += 1
+                    self._throttled()
+                    continue
+                # Bad records are bisected and rejected; only load problems should shrink batches
+                if self.sizer and observe and is_capacity_error(e):
+                    self.sizer.observe(len(batch), latency, e)
+                return e
+
+    def _isolate(self, batch: List[Dict[str, Any]], error: Exception) -> List[Tuple[List[Dict[str, Any]], Any]]:
+        """Bisect a failed batch; returns (sub-batch, result) for every piece sent"""
+        if not isinstance(batch, list) or len(batch) == 1:
+            # A single record, or a single-payload call such as importTournamentResultsBatch
+            self.rejects.add(self.name, batch[0] if isinstance(batch, list) else batch, error)
+            with self._lock:
+                self.stats.rejected += 1
+            return [(batch, error)]
+
+        outcomes = []
+        middle = len(batch) // 2
+        for half in (batch[:middle], batch[middle:]):
+            result = self.send(half, observe=False)
+            with self._lock:
+                self.stats.bisect_calls += 1
+            if isinstance(result, Exception) and self._should_bisect(result):
+                outcomes.extend(self._isolate(half, result))
+            else:
+                outcomes.append((half, result))
+        return outcomes
+
+    def _should_bisect(self, error: Exception) -> bool:
+        # Throttling and network failures say nothing about the records themselves
+        return self.rejects is not None and not is_rate_limited(error) and not isinstance(error, OSError)
+
+    def _send_numbered(self, batch_num: int, batch: List[Dict[str, Any]]) -> Tuple[int, List[Tuple[List[Dict[str, Any]], Any]]]:
+        result = self.send(batch)
+        if isinstance(result, Exception) and self._should_bisect(result):
+            return batch_num, self._isolate(batch, result)
+        return batch_num, [(batch, result)]
+
+    def _finish(self, future: Future) -> Iterator[Tuple[int, List[Dict[str, Any]], Any]]:
+        batch_num, outcomes = future.result()
+        with self._lock:
+            self.stats.batches += 1
+            if any(isinstance(result, Exception) for _, result in outcomes):
+                self.stats.failed += 1
+            self.stats.finished = time.perf_counter()
+        for batch, result in outcomes:
+            yield batch_num, batch, result
+
+    def dispatch(
+        self,
+        batches: Iterable[List[Dict[str, Any]]]
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]], Any]]:
+        """Yield (batch_num, batch, result) in completion order
+
+        Batches are pulled from the iterable lazily, so at most `concurrency`
+        of them are held in memory at once. Failed batches yield the exception.
+        A bisected batch yields each piece under its original batch_num; the
+        rejected records come back one per piece with their exception.
+        """
+        self.stats = DispatchStats()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            pending: Set[Future] = set()
+            for batch_num, batch in enumerate(batches, start=1):
+                if len(pending) >= self.concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from self._finish(future)
+                pending.add(pool.submit(self._send_numbered, batch_num, batch))
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from self._finish(future)
+
+
+def chunked(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Group an iterable of records into lists of at most `size`"""
+    batch: List[Dict[str, Any]] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
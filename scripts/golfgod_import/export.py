@@ -0,0 +1,292 @@
+"""
+Export Convex tables to a local, memory-mappable Arrow snapshot.
+
+    golfgod-import export [table ...] [--incremental] [--out DIR] [--keep 3]
+
+Pages through players, tournamentResults, pgaTournaments, courses and
+playerCourseStats with dataManagement:exportTablePage cursors (tables in
+parallel, up to --concurrency at once) and writes each table as an Arrow
+IPC file. Analyses that used to page through Convex queries can then run
+locally on Arrow / NumPy columns.
+
+Snapshots are versioned: every export writes a new directory (v0001, v0002,
+...) holding one <table>.arrow per table and a manifest.json with each
+table's row count, newest _creationTime and column types, then points
+snapshot.json at it. Versions beyond --keep are removed. Tables not named
+on the command line are carried over from the previous version unchanged.
+
+Every table is read in full by default. With --incremental, append-only
+tables (APPEND_ONLY: tournamentResults, which imports only ever insert)
+fetch just the rows created after the previous version's newest
+_creationTime and append them; tables whose rows are patched in place
+(player bios and photos, tournament upserts, course edits, the running
+sums in playerCourseStats) are still read in full. _creationTime never
+changes, so deleted rows are not seen either: don't use --incremental
+after a clear.
+
+Reading memory-maps the files, so tables load without copying:
+
+    from golfgod_import.export import open_snapshot
+    results = open_snapshot()["tournamentResults"]
+"""
+
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from . import config
+from .dispatcher import is_rate_limited
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+FUNCTION = "dataManagement:exportTablePage"
+TABLES = ("players", "tournamentResults", "pgaTournaments", "courses", "playerCourseStats")
+# Tables whose rows are never patched once inserted; only these refresh incrementally
+APPEND_ONLY = ("tournamentResults",)
+PAGE_SIZE = 1000  # MAX_EXPORT_BATCH in convex/dataManagement.ts
+FORMAT = 1  # Bump when the snapshot layout changes
+KEEP = 3
+MAX_RETRIES = 6
+POINTER = "snapshot.json"
+
+
+def default_directory() -> Path:
+    return config.state_path("snapshots", POINTER).parent
+
+
+def _column(values: List[Any]) -> Any:
+    """Arrow array for one column; values of mixed types are kept as JSON text"""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if value is None else json.dumps(value) for value in values], pa.string())
+
+
+def rows_to_table(rows: Sequence[Dict[str, Any]]) -> Any:
+    """Documents as an Arrow table; a field missing from a document is null"""
+    names = list(dict.fromkeys(name for row in rows for name in row))
+    return pa.table({name: _column([row.get(name) for row in rows]) for name in names})
+
+
+def concat(tables: Sequence[Any]) -> Any:
+    """Stack tables whose columns differ; missing columns become null, ints widen to doubles"""
+    tables = [t for t in tables if t.num_columns]
+    if not tables:
+        return pa.table({})
+    return pa.concat_tables(tables, promote_options="permissive")
+
+
+def _page(client: Any, table: str, cursor: Optional[str], since: Optional[float]) -> Dict[str, Any]:
+    args: Dict[str, Any] = {"table": table, "cursor": cursor, "batchSize": PAGE_SIZE}
+    if since is not None:
+        args["since"] = since
+    attempt = 0
+    while True:
+        try:
+            return client.query(FUNCTION, args)
+        except Exception as e:
+            if not is_rate_limited(e) or attempt >= MAX_RETRIES:
+                raise
+            time.sleep(min(30.0, 0.5 * 2 ** attempt))
+            attempt += 1
+            client.profiler.record_retry(FUNCTION)
+
+
+def fetch_table(client: Any, table: str, since: Optional[float] = None) -> Tuple[Any, int]:
+    """Rows created after `since` (every row when None) as one table, plus the page count"""
+    pages: List[Any] = []
+    cursor = None
+    calls = 0
+    while True:
+        page = _page(client, table, cursor, since)
+        calls += 1
+        if page["rows"]:
+            pages.append(rows_to_table(page["rows"]))
+        if not page["hasMore"]:
+            return concat(pages), calls
+        cursor = page["cursor"]
+
+
+def read_table(path: Path) -> Any:
+    """Memory-map one snapshot file; the columns point into the page cache"""
+    with pa.memory_map(str(path), "r") as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def write_table(table: Any, path: Path) -> int:
+    """Write an Arrow IPC file atomically; returns its size in bytes"""
+    tmp = path.with_suffix(".tmp")
+    with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, path)
+    return path.stat().st_size
+
+
+class Snapshot:
+    """The versions of a snapshot directory and the manifest of the current one"""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory else default_directory()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        pointer = self.directory / POINTER
+        self.current: Optional[str] = json.loads(pointer.read_text())["current"] if pointer.exists() else None
+        self.manifest: Dict[str, Any] = {}
+        if self.current:
+            self.manifest = json.loads((self.directory / self.current / "manifest.json").read_text())
+
+    def versions(self) -> List[str]:
+        """Completed versions, oldest first"""
+        return sorted(p.parent.name for p in self.directory.glob("v*/manifest.json"))
+
+    def next_version(self) -> str:
+        numbers = [int(name[1:]) for name in self.versions()]
+        return f"v{max(numbers, default=0) + 1:04d}"
+
+    def path(self, table: str, version: Optional[str] = None) -> Path:
+        return self.directory / (version or self.current or "") / f"{table}.arrow"
+
+    def table_info(self, table: str) -> Optional[Dict[str, Any]]:
+        return self.manifest.get("tables", {}).get(table)
+
+    def publish(self, version: str, manifest: Dict[str, Any], keep: int) -> List[str]:
+        """Write the manifest, point snapshot.json at the version, prune old ones; returns the pruned"""
+        (self.directory / version / "manifest.json").write_text(json.dumps(manifest, indent=2))
+        pointer = self.directory / POINTER
+        tmp = pointer.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"current": version, "format": FORMAT}))
+        os.replace(tmp, pointer)
+        self.current, self.manifest = version, manifest
+
+        pruned = self.versions()[:-max(1, keep)]
+        for name in pruned:
+            shutil.rmtree(self.directory / name, ignore_errors=True)
+        return pruned
+
+
+def open_snapshot(directory: Optional[Path] = None, version: Optional[str] = None) -> Dict[str, Any]:
+    """Every table of a snapshot version (the current one by default), memory-mapped"""
+    snapshot = Snapshot(directory)
+    version = version or snapshot.current
+    if version is None:
+        raise FileNotFoundError(f"No snapshot in {snapshot.directory}; run golfgod-import export first")
+    manifest = json.loads((snapshot.directory / version / "manifest.json").read_text())
+    return {table: read_table(snapshot.path(table, version)) for table in manifest["tables"]}
+
+
+def export_table(client: Any, snapshot: Snapshot, version: str, table: str, incremental: bool) -> Dict[str, Any]:
+    """Write one table into the new version; returns its manifest entry"""
+    previous = snapshot.table_info(table) if incremental and table in APPEND_ONLY else None
+    since = previous["maxCreationTime"] if previous else None
+
+    start = time.perf_counter()
+    fresh, calls = fetch_table(client, table, since)
+    if previous:
+        table_data = concat([read_table(snapshot.path(table)), fresh])
+    else:
+        table_data = fresh
+    size = write_table(table_data, snapshot.path(table, version))
+    seconds = time.perf_counter() - start
+
+    newest = previous["maxCreationTime"] if previous else None
+    if fresh.num_rows:
+        # Pages come back in creation order, but take the max rather than rely on it
+        newest = max(newest or 0, pc.max(fresh.column("_creationTime")).as_py())
+    info = {
+        "rows": table_data.num_rows,
+        "newRows": fresh.num_rows,
+        "incremental": previous is not None,
+        "maxCreationTime": newest,
+        "bytes": size,
+        "calls": calls,
+        "seconds": round(seconds, 3),
+        "columns": {field.name: str(field.type) for field in table_data.schema},
+    }
+    mode = "incremental" if previous else "full"
+    rate = f"{fresh.num_rows / seconds:.0f} rows/sec" if seconds > 0 else "-"
+    print(f"  {table}: {info['rows']} rows ({fresh.num_rows} new, {mode}) in {seconds:.1f}s ({rate}), "
+          f"{size / 1e6:.1f} MB", flush=True)
+    return info
+
+
+def export(
+    client: Any,
+    tables: Sequence[str] = TABLES,
+    directory: Optional[Path] = None,
+    incremental: bool = False,
+    concurrency: int = 4,
+    keep: int = KEEP
+) -> Tuple[Snapshot, str]:
+    """Write a new snapshot version; returns the snapshot and the version written"""
+    snapshot = Snapshot(directory)
+    version = snapshot.next_version()
+    # A version without a manifest is left over from a failed export
+    shutil.rmtree(snapshot.directory / version, ignore_errors=True)
+    (snapshot.directory / version).mkdir()
+    print(f"Writing {version} to {snapshot.directory}"
+          + (f" (base {snapshot.current})" if snapshot.current and incremental else ""))
+
+    infos: Dict[str, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(tables)))) as pool:
+        futures = {table: pool.submit(export_table, client, snapshot, version, table, incremental) for table in tables}
+        for table, future in futures.items():
+            infos[table] = future.result()
+
+    # Tables not exported this time carry over from the previous version
+    for table, info in snapshot.manifest.get("tables", {}).items():
+        if table not in infos:
+            try:
+                os.link(snapshot.path(table), snapshot.path(table, version))
+            except OSError:
+                shutil.copyfile(snapshot.path(table), snapshot.path(table, version))
+            infos[table] = dict(info, newRows=0, carried=True)
+
+    manifest = {
+        "format": FORMAT,
+        "version": version,
+        "base": snapshot.current,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "tables": infos,
+    }
+    pruned = snapshot.publish(version, manifest, keep)
+    if pruned:
+        print(f"Removed old versions: {', '.join(pruned)}")
+    return snapshot, version
+
+
+def run(client: Any, args: Any) -> int:
+    """Export the requested tables; returns a process exit code"""
+    if pa is None:
+        print("Error: the export needs pyarrow (pip install pyarrow)")
+        return 1
+    tables = args.tables or list(TABLES)
+    unknown = [table for table in tables if table not in TABLES]
+    if unknown:
+        print(f"Unknown tables: {', '.join(unknown)}")
+        print(f"Choose from: {', '.join(TABLES)}")
+        return 2
+
+    print(f"=== Export: {', '.join(tables)} ===")
+    start = time.perf_counter()
+    try:
+        snapshot, version = export(client, tables, Path(args.out) if args.out else None,
+                                   args.incremental and not args.full, args.concurrency, args.keep)
+    except Exception as e:
+        print(f"\n❌ Export failed: {e}")
+        print("The previous snapshot is still current")
+        return 1
+
+    seconds = time.perf_counter() - start
+    infos = snapshot.manifest["tables"]
+    fresh = sum(info["newRows"] for info in infos.values())
+    total = sum(info["rows"] for info in infos.values())
+    print(f"\n✅ {version}: {total} rows in {len(infos)} tables ({fresh} fetched) in {seconds:.1f}s")
+    print(f"   {snapshot.directory / version}")
+    return 0
@@ -0,0 +1,180 @@
+"""
+Clear tables as bounded, resumable delete jobs instead of one-shot mutations.
+
+    golfgod-import maintenance tournaments
+    golfgod-import maintenance results players [--preserve-follows]
+    golfgod-import maintenance all --resume
+
+Every call to dataManagement:clearTableBatch deletes at most one page
+(--batch-size rows, capped on the server) and returns a cursor, so no
+mutation runs long enough to time out and the next page starts after the
+rows already deleted. Tables that do not depend on each other are cleared
+in parallel (up to --concurrency at once); tables that others reference
+(players, and the year summaries derived from tournaments) go in a later
+stage. Each table's cursor is saved after every page under
+.import_state/maintenance, so --resume continues an interrupted job.
+
+Jobs:
+    tournaments  pgaTournaments, then any yearSummaries left over
+    results      tournamentResults, roundStats and playerCourseStats
+    players      everything keyed by player (results, stats, follows), then players
+    all          all of the above
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .config import state_path
+from .dispatcher import is_rate_limited
+
+FUNCTION = "dataManagement:clearTableBatch"
+BATCH_SIZE = 200  # Rows per mutation; the server caps this at 500
+MAX_RETRIES = 6
+PROGRESS_INTERVAL = 5.0  # Seconds between progress lines per table
+
+PLAYER_TABLES = ("tournamentResults", "roundStats", "playerCourseStats", "playerStats", "userFollows")
+
+# Job → stages; tables within a stage are cleared in parallel, stages in order
+JOBS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    "tournaments": (("pgaTournaments",), ("yearSummaries",)),
+    "results": (("tournamentResults", "roundStats", "playerCourseStats"),),
+    "players": (PLAYER_TABLES, ("players",)),
+}
+
+
+def plan(jobs: Iterable[str], preserve_follows: bool = False) -> List[List[str]]:
+    """Merge the jobs' stages; a table runs once, in the first stage that needs it"""
+    stages: List[List[str]] = []
+    seen = set()
+    for job in (JOBS if "all" in jobs else jobs):
+        for n, tables in enumerate(JOBS[job]):
+            while len(stages) <= n:
+                stages.append([])
+            for table in tables:
+                if table in seen or (preserve_follows and table == "userFollows"):
+                    continue
+                seen.add(table)
+                stages[n].append(table)
+    return [tables for tables in stages if tables]
+
+
+class ClearState:
+    """Per-table cursor and progress, saved after every page for --resume"""
+
+    def __init__(self, name: str, resume: bool = False):
+        self.path = state_path("maintenance", f"{name}.json")
+        self.lock = threading.Lock()
+        self.tables: Dict[str, Dict[str, Any]] = {}
+        if resume and self.path.exists():
+            self.tables = json.loads(self.path.read_text())
+
+    def get(self, table: str) -> Dict[str, Any]:
+        with self.lock:
+            return self.tables.setdefault(table, {"cursor": None, "deleted": 0, "seconds": 0.0, "done": False})
+
+    def update(self, table: str, **fields: Any) -> None:
+        with self.lock:
+            self.tables[table].update(fields)
+            self.path.write_text(json.dumps(self.tables, indent=2))
+
+    def finish(self) -> None:
+        """Forget the job once every table is done, so the next run starts fresh"""
+        self.path.unlink(missing_ok=True)
+
+
+def _clear_page(client: Any, table: str, cursor: Optional[str], batch_size: int) -> Dict[str, Any]:
+    attempt = 0
+    while True:
+        try:
+            return client.mutation(FUNCTION, {"table": table, "cursor": cursor, "batchSize": batch_size})
+        except Exception as e:
+            if not is_rate_limited(e) or attempt >= MAX_RETRIES:
+                raise
+            time.sleep(min(30.0, 0.5 * 2 ** attempt))
+            attempt += 1
+            client.profiler.record_retry(FUNCTION)
+
+
+def clear_table(client: Any, table: str, state: ClearState, batch_size: int) -> Dict[str, Any]:
+    """Delete every row of one table page by page; returns its final progress"""
+    progress = state.get(table)
+    if progress["done"]:
+        print(f"  {table}: already cleared ({progress['deleted']} rows)")
+        return progress
+
+    cursor, deleted, seconds = progress["cursor"], progress["deleted"], progress["seconds"]
+    start = time.perf_counter()
+    last_report = start
+    while True:
+        result = _clear_page(client, table, cursor, batch_size)
+        now = time.perf_counter()
+        cursor, deleted = result["cursor"], deleted + result["deleted"]
+        done = not result["hasMore"]
+        state.update(table, cursor=cursor, deleted=deleted, seconds=seconds + now - start, done=done)
+        if done:
+            break
+        if now - last_report >= PROGRESS_INTERVAL:
+            last_report = now
+            print(f"  {table}: {deleted} deleted ({_rate(deleted, seconds + now - start)})", flush=True)
+
+    progress = state.get(table)
+    print(f"  {table}: cleared {deleted} rows in {progress['seconds']:.1f}s ({_rate(deleted, progress['seconds'])})",
+          flush=True)
+    return progress
+
+
+def _rate(rows: int, seconds: float) -> str:
+    return f"{rows / seconds:.0f} rows/sec" if seconds > 0 else "-"
+
+
+def clear(
+    client: Any,
+    jobs: Sequence[str],
+    batch_size: Optional[int] = None,
+    concurrency: int = 4,
+    resume: bool = False,
+    preserve_follows: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """Run the jobs' stages in order; returns each table's progress"""
+    stages = plan(jobs, preserve_follows)
+    state = ClearState("-".join(sorted(set(jobs))), resume=resume)
+    results: Dict[str, Dict[str, Any]] = {}
+    for n, tables in enumerate(stages, 1):
+        print(f"\nStage {n}/{len(stages)}: {', '.join(tables)}")
+        with client.profiler.span(f"stage {n}"), \
+                ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(tables)))) as pool:
+            futures = {table: pool.submit(clear_table, client, table, state, batch_size or BATCH_SIZE)
+                       for table in tables}
+            for table, future in futures.items():
+                results[table] = future.result()
+    state.finish()
+    return results
+
+
+def run(client: Any, args: Any) -> int:
+    """Clear the requested tables; returns a process exit code"""
+    unknown = [job for job in args.jobs if job not in JOBS and job != "all"]
+    if not args.jobs or unknown:
+        if unknown:
+            print(f"Unknown jobs: {', '.join(unknown)}")
+        print(f"Choose one or more of: {', '.join(JOBS)}, all")
+        return 2
+
+    print(f"=== Maintenance: clearing {', '.join(args.jobs)} ===")
+    if args.resume:
+        print("Resuming from saved cursors")
+    start = time.perf_counter()
+    try:
+        results = clear(client, args.jobs, args.batch_size, args.concurrency, args.resume, args.preserve_follows)
+    except Exception as e:
+        print(f"\n❌ Clear failed: {e}")
+        print("Run again with --resume to continue from the last completed page")
+        return 1
+
+    seconds = time.perf_counter() - start
+    total = sum(progress["deleted"] for progress in results.values())
+    print(f"\n✅ Deleted {total} rows from {len(results)} tables in {seconds:.1f}s ({_rate(total, seconds)})")
+    return 0
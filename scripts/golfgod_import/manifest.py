@@ -0,0 +1,91 @@
+"""
+Per-record content hashes so re-imports only send rows that changed.
+
+The manifest stores one hash per record key (tournament_id, espnId, ...) for
+each dataset. A run classifies every source record against it, sends only
+inserted or modified ones, and records their hashes once the batch succeeds.
+Keys that were not seen this run are reported as deletions (tombstones).
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .config import state_path
+
+
+def record_hash(record: Dict[str, Any]) -> str:
+    """Stable hash of a mutation-ready record"""
+    payload = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class ChangeManifest:
+    """Persistent {key: hash} map for one dataset"""
+
+    def __init__(self, dataset: str, key_field: str, path: Optional[Path] = None):
+        self.dataset = dataset
+        self.key_field = key_field
+        self.path = path or state_path("manifests", f"{dataset}.json")
+        self.hashes: Dict[str, str] = {}
+        self.pending: Dict[str, str] = {}
+        self.seen: set = set()
+        self.counts = {"inserted": 0, "modified": 0, "unchanged": 0}
+
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # Hashes stored under another key field (an older layout) don't apply
+            if data.get("keyField", key_field) == key_field:
+                self.hashes = data.get("hashes", {})
+
+    def classify(self, record: Dict[str, Any]) -> str:
+        """Return inserted, modified or unchanged for a record"""
+        key = str(record[self.key_field])
+        digest = record_hash(record)
+        self.seen.add(key)
+
+        previous = self.hashes.get(key)
+        if previous == digest:
+            status = "unchanged"
+        else:
+            status = "inserted" if previous is None else "modified"
+            self.pending[key] = digest
+        self.counts[status] += 1
+        return status
+
+    def changed(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield only records that are new or differ from the manifest"""
+        for record in records:
+            if self.classify(record) != "unchanged":
+                yield record
+
+    def mark_sent(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Record hashes for records whose batch was accepted by Convex"""
+        self.mark_keys(record[self.key_field] for record in records)
+
+    def mark_keys(self, keys: Iterable[Any]) -> None:
+        for key in map(str, keys):
+            if key in self.pending:
+                self.hashes[key] = self.pending.pop(key)
+
+    def deleted_keys(self) -> List[str]:
+        """Keys in the manifest that were absent from this run's source"""
+        return sorted(key for key in self.hashes if key not in self.seen)
+
+    def forget(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self.hashes.pop(key, None)
+
+    def save(self) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"dataset": self.dataset, "keyField": self.key_field, "hashes": self.hashes}, f)
+        os.replace(tmp, self.path)
+
+    def print_summary(self) -> None:
+        c = self.counts
+        print(f"Change detection ({self.dataset}): {c['inserted']} new, {c['modified']} modified, "
+              f"{c['unchanged']} unchanged, {len(self.deleted_keys())} removed from source")
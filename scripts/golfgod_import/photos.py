@@ -0,0 +1,201 @@
+"""
+Import player photos from CSV into Convex database
+"""
+
+from typing import List, Dict, Any, Optional
+
+from .cache import ParseCache
+from .checkpoint import CheckpointJournal
+from .batching import batch_sizer
+from .dispatcher import BatchDispatcher
+from .manifest import ChangeManifest
+from .normalize import normalize_photos
+from .rejects import RejectFile
+from .resolver import PlayerIndex, ReviewFile, ensure_name_index, record_key, resolve_players, split_resolved
+from .runtime import ImportRuntime
+from .snapshots import PHOTO_COUNTERS, print_diff, print_snapshot, take_snapshot
+
+# Configuration
+CSV_FILE_PATH = "/Users/tjmcgovern/golfdata/player_photos_all_200.csv"
+BATCH_SIZE = 25  # Process 25 players at a time to avoid timeouts
+CACHE_KIND = "photos:1"  # Bump when normalize_photos output changes
+
+
+def read_csv_data(csv_file: str = CSV_FILE_PATH, use_cache: bool = True) -> Optional[List[Dict[str, Any]]]:
+    """Read player photo data from CSV file (None when it cannot be read)"""
+    try:
+        # Only players where photo_exists is true
+        with ParseCache(enabled=use_cache) as cache:
+            players = cache.load(CACHE_KIND, csv_file, normalize_photos)
+            cache.print_summary("photos")
+            return players
+    except FileNotFoundError:
+        print(f"Error: CSV file not found at {csv_file}")
+        return None
+    except Exception as e:
+        print(f"Error reading CSV file: {e}")
+        return None
+
+
+def failed_photos(batch: List[Dict[str, Any]], error_details: List[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
+    """Records of a batch named in its errorDetails, matched on the one field the mutation reports
+
+    updatePlayerPhotosById reports failures by playerId, updatePlayerPhotosBatch
+    by playerName; details or records without the field never match.
+    """
+    failed = {e[key] for e in error_details if e.get(key) is not None}
+    return [p for p in batch if p.get(key) is not None and p[key] in failed]
+
+
+def run(client: ImportRuntime, args: Any) -> int:
+    """Import the photos CSV; returns a process exit code"""
+    csv_file = args.photos_file or CSV_FILE_PATH
+
+    print("=== Player Photo Import Script ===")
+    print(f"CSV File: {csv_file}")
+    print(f"Batch Size: {args.batch_size or 'adaptive'}")
+    print(f"Concurrency: {args.concurrency}")
+
+    profiler = client.profiler
+
+    # Counters before the import, diffed against the final ones at the end
+    profiler.phase("status")
+    initial_status = take_snapshot(client)
+    print_snapshot("Current Database Status", initial_status, PHOTO_COUNTERS)
+
+    # Read CSV data
+    profiler.phase("read")
+    print("\nReading CSV data...")
+    players = read_csv_data(csv_file, use_cache=not args.no_cache)
+    if players is None:
+        return 1
+    print(f"Found {len(players)} players with photos in CSV")
+
+    # Only send players whose photo row is new or changed since the last run
+    manifest = ChangeManifest("photos", "espnId")
+    players = [p for p in players if manifest.classify(p) != "unchanged" or args.full]
+    manifest.print_summary()
+
+    if not players:
+        print("No players to import")
+        return 0
+
+    # Import in batches
+    print("\nStarting import...")
+    total_processed = 0
+    total_updated = 0
+    total_created = 0
+    total_errors = 0
+    all_errors = []
+
+    # Resolve existing players locally; known players get ID-addressed patches,
+    # new ones go through updatePlayerPhotosBatch which creates them. Names
+    # that only nearly match a roster player are held for review rather than
+    # created as duplicates.
+    profiler.phase("resolve")
+    print("Resolving players...")
+    review = ReviewFile("photos")
+    ensure_name_index(client)
+    resolved = resolve_players(PlayerIndex.load(client, args.min_confidence), players, review=review)
+    review.save()
+    matched, unmatched = split_resolved(players, resolved)
+    unmatched = [p for p in unmatched if not resolved[record_key(p)].needs_review]
+    print(f"  {len(matched)} existing players, {len(unmatched)} new, {len(review.entries)} held for review")
+    by_espn_id = {p['espnId']: p for p in players}
+    by_id = [
+        {'playerId': player_id, 'espnId': p['espnId'], 'photoUrl': p['photoUrl'], 'worldRank': p['worldRank']}
+        for player_id, p in matched
+    ]
+
+    # Batches that finished in an interrupted run are skipped on --resume
+    journal = CheckpointJournal("photos", resume=args.resume)
+    # Failed batches are bisected; records refused on their own land here
+    rejects = RejectFile("photos", resume=args.resume)
+    profiler.phase("send")
+
+    for mutation_name, records, error_key in (
+        ("playerPhotos:updatePlayerPhotosById", by_id, 'playerId'),
+        ("playerPhotos:updatePlayerPhotosBatch", unmatched, 'playerName'),
+    ):
+        if not records:
+            continue
+
+        sizer = batch_sizer(mutation_name, args.batch_size, BATCH_SIZE)
+        dispatcher = BatchDispatcher(
+            client, mutation_name, "players", concurrency=args.concurrency, sizer=sizer, rejects=rejects
+        )
+
+        batches = sizer.batches(journal.pending(mutation_name, records, on_skip=manifest.mark_sent))
+
+        for batch_num, batch, result in dispatcher.dispatch(batches):
+            print(f"\nBatch {batch_num} ({len(batch)} players)...")
+
+            # Show player names in this batch
+            batch_names = [by_espn_id[p['espnId']]['playerName'] for p in batch[:5]]  # Show first 5
+            if len(batch) > 5:
+                batch_names.append(f"... and {len(batch) - 5} more")
+            print(f"  Players: {', '.join(batch_names)}")
+
+            if isinstance(result, Exception):
+                journal.record(mutation_name, batch_num, batch, result)
+                print(f"Error in batch import: {result}")
+                result = {
+                    'errors': len(batch),
+                    'errorDetails': [
+                        {'playerName': by_espn_id[p['espnId']]['playerName'], 'error': str(result)} for p in batch
+                    ],
+                }
+            else:
+                # Players the mutation reported as errors stay unsent for the next run / --resume
+                failed = failed_photos(batch, result.get('errorDetails') or [], error_key)
+                journal.record(mutation_name, batch_num, batch, result, failed)
+                manifest.mark_sent([p for p in batch if p not in failed])
+
+            # Update totals
+            total_processed += result.get('processed', 0)
+            total_updated += result.get('updated', 0)
+            total_created += result.get('created', 0)
+            total_errors += result.get('errors', 0)
+
+            if result.get('errorDetails'):
+                all_errors.extend(result['errorDetails'])
+
+            # Show batch results
+            print(f"  Processed: {result.get('processed', 0)}")
+            print(f"  Updated: {result.get('updated', 0)}")
+            print(f"  Created: {result.get('created', 0)}")
+            if result.get('errors', 0) > 0:
+                print(f"  Errors: {result.get('errors', 0)}")
+
+        print()
+        dispatcher.stats.print_summary(mutation_name.split(":")[1])
+        sizer.print_summary()
+        sizer.save()
+
+    journal.print_summary()
+    journal.close()
+    rejects.print_summary()
+    rejects.close()
+    manifest.save()
+
+    # Final summary
+    print("\n" + "=" * 50)
+    print("=== Import Complete ===")
+    print(f"Total Processed: {total_processed}")
+    print(f"Total Updated: {total_updated}")
+    print(f"Total Created: {total_created}")
+    print(f"Total Errors: {total_errors}")
+
+    # Show errors if any
+    if all_errors:
+        print("\n=== Errors ===")
+        for error in all_errors[:10]:  # Show first 10 errors
+            print(f"  {error.get('playerName') or error.get('playerId')}: {error['error']}")
+        if len(all_errors) > 10:
+            print(f"  ... and {len(all_errors) - 10} more errors")
+
+    profiler.phase("status")
+    print_diff(initial_status, take_snapshot(client), PHOTO_COUNTERS)
+
+    print("\n✅ Import process complete!")
+    return 0
@@ -0,0 +1,231 @@
+"""
+Opt-in profiling for import runs (--profile, --cprofile).
+
+With --profile every Convex call made through the runtime is timed into a
+per-function latency histogram along with request/response bytes, errors
+and rate-limit retries. Importers mark their phases (read, resolve, send,
+...) so the report also shows where the wall time of each step went. The
+report is written as JSON under .import_state/profiles and summarised on
+stdout. Measuring payload bytes costs one extra JSON encode per call, so a
+profiled run is somewhat slower; when profiling is off every hook returns
+immediately.
+
+--cprofile runs the command under cProfile and prints the hottest
+functions by cumulative time; the raw stats are saved next to the JSON
+for snakeviz / pstats. cProfile only sees the main thread, so time spent
+inside dispatcher worker threads shows up as waiting in dispatch().
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .config import state_path
+
+# Upper bounds (ms) of the latency histogram buckets; the last one is open-ended
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+HOT_FUNCTIONS = 25
+
+
+def _json_bytes(value: Any) -> int:
+    try:
+        return len(json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return 0
+
+
+class CallStats:
+    """Latency histogram, payload bytes, errors and retries for one Convex function"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.histogram = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, seconds: float, request_bytes: int, response_bytes: int, failed: bool) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+        ms = seconds * 1000
+        bucket = next((i for i, bound in enumerate(BUCKETS_MS) if ms <= bound), len(BUCKETS_MS))
+        self.histogram[bucket] += 1
+
+    def quantile_ms(self, q: float) -> float:
+        """Upper bound of the bucket holding quantile q (histogram resolution)"""
+        if not self.calls:
+            return 0.0
+        target, seen = q * self.calls, 0
+        for i, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                return float(BUCKETS_MS[i]) if i < len(BUCKETS_MS) else round(self.max_seconds * 1000, 1)
+        return round(self.max_seconds * 1000, 1)
+
+    def summary(self) -> Dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "seconds": round(self.seconds, 3),
+            "meanMs": round(self.seconds / self.calls * 1000, 1) if self.calls else 0.0,
+            "p50Ms": self.quantile_ms(0.5),
+            "p95Ms": self.quantile_ms(0.95),
+            "maxMs": round(self.max_seconds * 1000, 1),
+            "requestBytes": self.request_bytes,
+            "responseBytes": self.response_bytes,
+            "histogram": {label: count for label, count in zip(labels, self.histogram) if count},
+        }
+
+
+class Profiler:
+    """Phase wall times and per-function call statistics for one import run"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.calls: Dict[str, CallStats] = {}
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.step: Optional[str] = None
+        self._step_started = 0.0
+        self._phase: Optional[str] = None
+        self._phase_started = 0.0
+
+    def _add_phase(self, name: str, seconds: float, items: int = 0) -> None:
+        phase = self.phases.setdefault(name, {"seconds": 0.0, "count": 0, "items": 0})
+        phase["seconds"] += seconds
+        phase["count"] += 1
+        phase["items"] += items
+
+    def _qualified(self, name: str) -> str:
+        return f"{self.step}/{name}" if self.step else name
+
+    def begin_step(self, step: str) -> None:
+        """Start a CLI step (one importer); phase names are prefixed with it"""
+        if not self.enabled:
+            return
+        self.end_phase()
+        self.step = step
+        self._step_started = time.perf_counter()
+
+    def end_step(self) -> None:
+        if not self.enabled or self.step is None:
+            return
+        self.end_phase()
+        self._add_phase(self.step, time.perf_counter() - self._step_started)
+        self.step = None
+
+    def phase(self, name: str) -> None:
+        """End the current phase of this step, if any, and start `name`"""
+        if not self.enabled:
+            return
+        self.end_phase()
+        self._phase = self._qualified(name)
+        self._phase_started = time.perf_counter()
+
+    def end_phase(self) -> None:
+        if self.enabled and self._phase is not None:
+            self._add_phase(self._phase, time.perf_counter() - self._phase_started)
+            self._phase = None
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time a nested piece of work inside the current phase (e.g. a fallback path)"""
+        if not self.enabled:
+            yield
+            return
+        parent = self._phase or self.step
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self.lock:
+                self._add_phase(f"{parent}/{name}" if parent else name, time.perf_counter() - start)
+
+    def add_busy(self, name: str, seconds: float, items: int) -> None:
+        """Record time already measured elsewhere (e.g. summed across worker processes)"""
+        if self.enabled:
+            with self.lock:
+                self._add_phase(self._qualified(name), seconds, items)
+
+    def record_call(self, name: str, seconds: float, args: Any, result: Any, failed: bool) -> None:
+        request_bytes, response_bytes = _json_bytes(args), _json_bytes(result)
+        with self.lock:
+            stats = self.calls.get(name)
+            if stats is None:
+                stats = self.calls[name] = CallStats()
+            stats.add(seconds, request_bytes, response_bytes, failed)
+
+    def record_retry(self, name: str) -> None:
+        if self.enabled:
+            with self.lock:
+                self.calls.setdefault(name, CallStats()).retries += 1
+
+    def report(self) -> Dict[str, Any]:
+        self.end_phase()
+        return {
+            "seconds": round(time.perf_counter() - self.started, 3),
+            "phases": {
+                name: {"seconds": round(p["seconds"], 3), "count": int(p["count"]), "items": int(p["items"])}
+                for name, p in self.phases.items()
+            },
+            "calls": {name: stats.summary() for name, stats in sorted(self.calls.items())},
+        }
+
+    def write(self, path: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """Write the JSON report, merged with `extra` (e.g. hot functions)"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({**self.report(), **(extra or {})}, f, indent=2)
+
+    def print_summary(self) -> None:
+        r = self.report()
+        print(f"\n=== Profile ({r['seconds']}s) ===")
+        if r["phases"]:
+            print("Phases (wall time; nested entries overlap their parent):")
+            for name, p in r["phases"].items():
+                items = f", {p['items']} items" if p["items"] else ""
+                print(f"  {name:<32} {p['seconds']:>9.3f}s  x{p['count']}{items}")
+        if r["calls"]:
+            print("Convex calls:")
+            for name, s in r["calls"].items():
+                print(f"  {name}: {s['calls']} calls, {s['errors']} errors, {s['retries']} retries, "
+                      f"mean {s['meanMs']}ms, p50 ≤{s['p50Ms']}ms, p95 ≤{s['p95Ms']}ms, max {s['maxMs']}ms, "
+                      f"{s['requestBytes'] / 1024:.1f} KB sent, {s['responseBytes'] / 1024:.1f} KB received")
+                print("    " + "  ".join(f"{label}:{count}" for label, count in s["histogram"].items()))
+
+
+def report_base(label: str) -> str:
+    """Timestamped path prefix under .import_state/profiles; add .json / .prof"""
+    return str(state_path("profiles", f"{label}-{time.strftime('%Y%m%d-%H%M%S')}"))
+
+
+def print_hot_functions(stats_path: str, limit: int = HOT_FUNCTIONS) -> None:
+    """Top functions by cumulative time from a saved cProfile dump"""
+    import pstats
+
+    print(f"\n=== Hot functions (cProfile, main thread; raw stats in {stats_path}) ===")
+    pstats.Stats(stats_path).strip_dirs().sort_stats("cumulative").print_stats(limit)
+
+
+def hot_functions(stats_path: str, limit: int = HOT_FUNCTIONS) -> List[Dict[str, Any]]:
+    """The same ranking as print_hot_functions, for the JSON report"""
+    import pstats
+
+    stats = pstats.Stats(stats_path).stats
+    ranked = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [
+        {"function": f"{file}:{line}({func})", "calls": nc, "totalSeconds": round(tt, 4),
+         "cumulativeSeconds": round(ct, 4)}
+        for (file, line, func), (_, nc, tt, ct, _) in ranked
+    ]
@@ -0,0 +1,50 @@
+"""
+Reject files for records a Convex function refused on their own.
+
+When a batch fails, the dispatcher bisects it until the failing records are
+isolated; each of those is appended here with the function name and error
+(one JSON object per line under .import_state/rejects) instead of failing
+the whole batch. Rejected records are never marked delivered, so a later
+run (or --resume) sends them again once the data or the function is fixed.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import state_path
+
+
+class RejectFile:
+    """Append-only JSONL of rejected records for one importer run"""
+
+    def __init__(self, dataset: str, resume: bool = False, path: Optional[Path] = None):
+        self.dataset = dataset
+        self.path = path or state_path("rejects", f"{dataset}.jsonl")
+        self.count = 0
+        self.lock = threading.Lock()
+        # A fresh run starts a fresh file; --resume keeps the earlier rejects
+        self.file = open(self.path, "a" if resume else "w", encoding="utf-8")
+
+    def add(self, name: str, record: Dict[str, Any], error: Any) -> None:
+        line = json.dumps({"function": name, "error": str(error), "record": record, "at": time.time()},
+                          default=str)
+        with self.lock:
+            self.file.write(line + "\n")
+            self.file.flush()
+            self.count += 1
+
+    def print_summary(self) -> None:
+        if self.count:
+            print(f"Rejected ({self.dataset}): {self.count} records written to {self.path}")
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> "RejectFile":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,262 @@
+"""
+Local player identity resolution against a roster pulled once per run.
+
+The whole players table is paged down through players:getPlayerRosterPage
+(id, name, ESPN ID) and indexed in memory: by ESPN ID, by exact and
+normalized name, by the name with its spaces removed ("Si Woo Kim" and
+"Siwoo Kim" both become "siwookim"), and by phonetic blocking keys. Every
+incoming ESPN ID / name pair is then resolved locally with a confidence
+score, and importers send ID-addressed patches carrying the exact playerId.
+
+Fuzzy matching only compares a name with the roster players that share one
+of its blocking keys (first initial + Soundex of the last name, or Soundex
+of the whole compacted name), so it stays cheap for large rosters. A fuzzy
+match is accepted when it scores at least the minimum confidence and beats
+the runner-up clearly; near misses are written to a review file under
+.import_state/review with their candidates instead of being guessed.
+"""
+
+import difflib
+import json
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .config import state_path
+
+PAGE_SIZE = 1000  # Server-side cap per getPlayerRosterPage call
+MIN_CONFIDENCE = 0.85
+MIN_MARGIN = 0.05  # Best fuzzy candidate must beat the runner-up by this much
+REVIEW_CANDIDATES = 3
+
+# Confidence of each exact match kind; fuzzy matches score below these
+CONFIDENCE = {"espnId": 1.0, "name": 0.98, "normalized": 0.95, "compact": 0.9}
+FUZZY_WEIGHT = 0.9
+
+_SOUNDEX = {c: d for d, letters in {"1": "bfpv", "2": "cgjkqsxz", "3": "dt", "4": "l", "5": "mn", "6": "r"}.items()
+            for c in letters}
+
+
+# Only the block normalizePlayerName strips (Combining Diacritical Marks)
+_COMBINING_MARKS = re.compile("[\u0300-\u036f]")
+
+
+def normalize_name(name: str) -> str:
+    """Same normalization as convex/utils/playerLookup.ts normalizePlayerName"""
+    name = _COMBINING_MARKS.sub("", unicodedata.normalize("NFD", name)).lower()
+    name = re.sub(r"[^a-z0-9\s-]", "", name)
+    return re.sub(r"[\s-]+", " ", name).strip()
+
+
+def soundex(word: str) -> str:
+    """American Soundex code of a word ("" for no letters)"""
+    letters = [c for c in word if c.isalpha()]
+    if not letters:
+        return ""
+    code, previous = letters[0].upper(), _SOUNDEX.get(letters[0], "")
+    for c in letters[1:]:
+        digit = _SOUNDEX.get(c, "")
+        if digit and digit != previous:
+            code += digit
+        if c not in "hw":
+            previous = digit
+    return (code + "000")[:4]
+
+
+def blocking_keys(normalized: str) -> List[str]:
+    tokens = normalized.split()
+    if not tokens:
+        return []
+    return [f"{tokens[0][0]}:{soundex(tokens[-1])}", f"*:{soundex(''.join(tokens))}"]
+
+
+class Match:
+    """Resolution of one ESPN ID / name: playerId is None when unresolved"""
+
+    def __init__(self, player_id: Optional[str], confidence: float, method: Optional[str],
+                 candidates: Optional[List[Dict[str, Any]]] = None):
+        self.player_id = player_id
+        self.confidence = confidence
+        self.method = method
+        self.candidates = candidates or []
+
+    @property
+    def needs_review(self) -> bool:
+        """Unresolved, but the roster has players with similar names"""
+        return self.player_id is None and bool(self.candidates)
+
+
+class PlayerIndex:
+    """In-memory roster with exact, normalized, compact and phonetic lookups"""
+
+    def __init__(self, players: Iterable[Dict[str, Any]], min_confidence: float = MIN_CONFIDENCE):
+        self.min_confidence = min_confidence
+        self.players: Dict[str, Dict[str, Any]] = {}
+        self.by_espn: Dict[str, str] = {}
+        self.by_name: Dict[str, List[str]] = {}
+        self.by_normalized: Dict[str, List[str]] = {}
+        self.by_compact: Dict[str, List[str]] = {}
+        self.blocks: Dict[str, List[str]] = {}
+        for player in players:
+            self.add(player)
+
+    @classmethod
+    def load(cls, client: Any, min_confidence: float = MIN_CONFIDENCE) -> "PlayerIndex":
+        """Page the whole roster down once"""
+        players: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            page = client.query("players:getPlayerRosterPage", {"cursor": cursor, "batchSize": PAGE_SIZE})
+            players.extend(page["players"])
+            if not page["hasMore"]:
+                return cls(players, min_confidence)
+            cursor = page["cursor"]
+
+    def add(self, player: Dict[str, Any]) -> None:
+        player_id = player["_id"]
+        normalized = normalize_name(player["name"])
+        self.players[player_id] = dict(player, compact=normalized.replace(" ", ""))
+        if player.get("espnId"):
+            self.by_espn[player["espnId"]] = player_id
+        self.by_name.setdefault(player["name"], []).append(player_id)
+        self.by_normalized.setdefault(normalized, []).append(player_id)
+        self.by_compact.setdefault(normalized.replace(" ", ""), []).append(player_id)
+        for key in blocking_keys(normalized):
+            self.blocks.setdefault(key, []).append(player_id)
+
+    def _compatible(self, player_ids: List[str], espn_id: str) -> List[str]:
+        # A roster player already carrying a different ESPN ID is someone else with a similar name
+        return [pid for pid in dict.fromkeys(player_ids)
+                if not (espn_id and self.players[pid].get("espnId") and self.players[pid]["espnId"] != espn_id)]
+
+    def resolve(self, espn_id: Optional[str], name: Optional[str]) -> Match:
+        espn_id = str(espn_id or "")
+        if espn_id and espn_id in self.by_espn:
+            return Match(self.by_espn[espn_id], CONFIDENCE["espnId"], "espnId")
+        if not name or not name.strip():
+            return Match(None, 0.0, None)
+
+        normalized = normalize_name(name)
+        compact = normalized.replace(" ", "")
+        conflicts: List[str] = []
+        for method, same_name in (("name", self.by_name.get(name.strip(), [])),
+                                  ("normalized", self.by_normalized.get(normalized, [])),
+                                  ("compact", self.by_compact.get(compact, []))):
+            ids = self._compatible(same_name, espn_id)
+            if len(ids) == 1:
+                return Match(ids[0], CONFIDENCE[method], method)
+            if ids:
+                # Duplicate roster rows for one name: leave the choice to a person
+                return Match(None, 0.0, None, [self._candidate(pid, CONFIDENCE[method]) for pid in ids])
+            conflicts.extend(same_name)
+        if conflicts:
+            # Same name but a different ESPN ID on the roster: a namesake or a bad ID
+            return Match(None, 0.0, None, [self._candidate(pid, 0.0) for pid in dict.fromkeys(conflicts)])
+
+        blocked = self._compatible([pid for key in blocking_keys(normalized) for pid in self.blocks.get(key, [])],
+                                   espn_id)
+        scored = sorted(
+            ((FUZZY_WEIGHT * difflib.SequenceMatcher(None, compact, self.players[pid]["compact"]).ratio(), pid)
+             for pid in blocked),
+            reverse=True,
+        )
+        if not scored:
+            return Match(None, 0.0, None)
+        best, player_id = scored[0]
+        runner_up = scored[1][0] if len(scored) > 1 else 0.0
+        if best >= self.min_confidence and best - runner_up >= MIN_MARGIN:
+            return Match(player_id, round(best, 3), "fuzzy")
+        return Match(None, 0.0, None, [self._candidate(pid, score) for score, pid in scored[:REVIEW_CANDIDATES]])
+
+    def _candidate(self, player_id: str, confidence: float) -> Dict[str, Any]:
+        player = self.players[player_id]
+        return {"playerId": player_id, "name": player["name"], "espnId": player.get("espnId"),
+                "confidence": round(confidence, 3)}
+
+
+class ReviewFile:
+    """Names the resolver would not guess, with their closest roster candidates"""
+
+    def __init__(self, dataset: str):
+        self.dataset = dataset
+        self.path = state_path("review", f"{dataset}.jsonl")
+        self.entries: List[Dict[str, Any]] = []
+
+    def add(self, espn_id: Optional[str], name: Optional[str], match: Match) -> None:
+        self.entries.append({"espnId": espn_id, "name": name, "candidates": match.candidates})
+
+    def save(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as f:
+            for entry in self.entries:
+                f.write(json.dumps(entry) + "\n")
+        if self.entries:
+            print(f"Review ({self.dataset}): {len(self.entries)} names need a person to match them, "
+                  f"written to {self.path}")
+
+
+def record_key(record: Dict[str, Any], espn_field: str = "espnId", name_field: str = "playerName") -> str:
+    """ESPN ID when the record has one, otherwise its name"""
+    return str(record.get(espn_field) or "") or f"name:{record.get(name_field) or ''}"
+
+
+def resolve_players(
+    index: PlayerIndex,
+    records: Iterable[Dict[str, Any]],
+    espn_field: str = "espnId",
+    name_field: str = "playerName",
+    review: Optional[ReviewFile] = None
+) -> Dict[str, Match]:
+    """Resolve each record's ESPN ID / name locally; keyed by record_key"""
+    resolved: Dict[str, Match] = {}
+    methods: Dict[str, int] = {}
+    for record in records:
+        key = record_key(record, espn_field, name_field)
+        if key in resolved:
+            continue
+        espn_id, name = record.get(espn_field), record.get(name_field)
+        match = resolved[key] = index.resolve(espn_id, name)
+        methods[match.method or "unresolved"] = methods.get(match.method or "unresolved", 0) + 1
+        if review and match.needs_review:
+            review.add(espn_id, name, match)
+    print("  Resolved locally: " + ", ".join(f"{count} {method}" for method, count in sorted(methods.items())))
+    return resolved
+
+
+def split_resolved(
+    records: Iterable[Dict[str, Any]],
+    resolved: Dict[str, Match],
+    espn_field: str = "espnId",
+    name_field: str = "playerName"
+) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[Dict[str, Any]]]:
+    """Split records into (playerId, record) pairs and unresolved records"""
+    matched: List[Tuple[str, Dict[str, Any]]] = []
+    unmatched: List[Dict[str, Any]] = []
+    for record in records:
+        match = resolved.get(record_key(record, espn_field, name_field))
+        if match and match.player_id:
+            matched.append((match.player_id, record))
+        else:
+            unmatched.append(record)
+    return matched, unmatched
+
+
+def ensure_name_index(client: Any) -> None:
+    """Backfill players.normalizedName before the first name lookup.
+
+    The server's name lookups (players:resolvePlayers and the batch mutations)
+    only match case and spacing variants through the by_normalized_name index,
+    which misses players created before the field existed. Every importer that
+    matches by name calls this first; once the backfill has run it costs one
+    read.
+    """
+    if not client.query("players:getNameIndexStatus", {})["pending"]:
+        return
+    print("Backfilling normalized player names (one-time)...")
+    cursor, updated = None, 0
+    while True:
+        page = client.mutation("players:backfillNormalizedNames", {"cursor": cursor, "batchSize": 200})
+        updated += page["updated"]
+        if not page["hasMore"]:
+            break
+        cursor = page["cursor"]
+    print(f"  {updated} players updated")
@@ -0,0 +1,28 @@
+"""
+Import per-player tournament result files through importTournamentResultsBatch
+"""
+
+from typing import Any
+
+from .ingest import ingest, print_totals
+from .results_files import iter_player_files
+from .runtime import ImportRuntime
+
+
+def run(client: ImportRuntime, args: Any) -> int:
+    """Import every player file in the results directory; returns a process exit code"""
+    if not args.results_dir:
+        print("Error: --results-dir is required for the results import")
+        return 1
+    if not list(iter_player_files(args.results_dir)):
+        print(f"Error: no player files found in {args.results_dir}")
+        return 1
+
+    print(f"Importing player results from {args.results_dir}")
+    totals, stats = ingest(client, args.results_dir, workers=args.workers,
+                           concurrency=args.concurrency, resume=args.resume, use_cache=not args.no_cache,
+                           min_confidence=args.min_confidence)
+    print_totals("Results import", totals)
+    stats.print_summary()
+    print("\n✅ Results import completed!")
+    return 0
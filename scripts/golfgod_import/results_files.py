@@ -0,0 +1,104 @@
+"""
+Per-player tournament result files → importMasterData payloads.
+
+A results directory holds one `{espnId}_{First}_{Last}.json` file per player
+(the format read by app/api/import-json-files). Each file is converted to the
+master-data `playerData` shape that importMasterData:importTournamentResultsBatch
+expects.
+"""
+
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+TO_PAR_SENTINEL = -78  # Scraper placeholder for "no score to par"
+
+_COURSE_VARIANT = re.compile(r"^(.+?)\s*\((.+)\)$")
+
+
+def course_name(raw: str) -> str:
+    """Course name without its "(variant)" suffix, as parseCourseInfo in convex/utils/dataProcessing.ts"""
+    trimmed = raw.strip()
+    match = _COURSE_VARIANT.match(trimmed)
+    return match.group(1).strip() if match else trimmed
+
+
+def _format_to_par(value: Any) -> Optional[str]:
+    if value is None or value == TO_PAR_SENTINEL:
+        return None
+    if isinstance(value, str):
+        return value
+    value = int(value)
+    if value == 0:
+        return "E"
+    return f"+{value}" if value > 0 else str(value)
+
+
+def _rounds(scores: Any) -> List[int]:
+    rounds: List[int] = []
+    for score in scores or []:
+        try:
+            rounds.append(int(score))
+        except (TypeError, ValueError):
+            continue
+    return rounds
+
+
+def _name_from_filename(path: Path) -> str:
+    words = path.stem.split("_")[1:]
+    return " ".join(word[:1].upper() + word[1:].lower() for word in words)
+
+
+def convert_tournament(tournament: Dict[str, Any]) -> Dict[str, Any]:
+    """One per-player tournament entry in master-data form"""
+    if "rounds" in tournament and "tournament_name" in tournament:
+        return tournament  # Already master format
+
+    converted: Dict[str, Any] = {
+        "tournament_name": tournament.get("tournament") or tournament.get("tournament_name") or "",
+        "course_name": tournament.get("course") or "",
+        "year": int(tournament.get("year") or 0),
+        "date": tournament.get("date") or "",
+        "rounds": _rounds(tournament.get("scores")),
+        "finish": tournament.get("position") or "",
+    }
+    to_par = _format_to_par(tournament.get("to_par"))
+    if to_par is not None:
+        converted["score_to_par"] = to_par
+    if tournament.get("overall_score") is not None:
+        converted["total_score"] = str(tournament["overall_score"])
+    if tournament.get("earnings") is not None:
+        converted["earnings"] = str(tournament["earnings"])
+    return converted
+
+
+def player_from_json(data: Dict[str, Any], path: Union[str, Path]) -> Dict[str, Any]:
+    """A parsed player file as an importTournamentResultsBatch playerData"""
+    path = Path(path)
+    tournaments = [convert_tournament(t) for t in data.get("tournaments") or []]
+    return {
+        "player_id": str(data.get("player_id") or path.stem.split("_")[0]),
+        "player_name": data.get("player_name") or _name_from_filename(path),
+        "tournaments": tournaments,
+    }
+
+
+def load_player_file(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read one player file as an importTournamentResultsBatch playerData"""
+    with open(path, "r", encoding="utf-8") as f:
+        return player_from_json(json.load(f), path)
+
+
+def split_by_year(player: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """One playerData per season, oldest first"""
+    seasons: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+    for t in player["tournaments"]:
+        seasons[t.get("year")].append(t)
+    return [dict(player, tournaments=seasons[year]) for year in sorted(seasons, key=str)]
+
+
+def iter_player_files(directory: Union[str, Path]) -> Iterator[Path]:
+    """Player result files in a directory, in a stable order"""
+    return iter(sorted(Path(directory).glob("*.json")))
@@ -0,0 +1,581 @@
+#!/usr/bin/env python3
+"""
+Columnar bulk import of round-level stats into roundStats.
+
+    golfgod-import rounds --rounds-file rounds.csv [--chunk-rows 50000]
+
+The source CSV has one row per player round: player_id (ESPN ID), year,
+tournament, round, score, and optionally tee_time, the hole-level counts
+(fairways_hit/_possible, greens_hit/_possible, putts, birdies, pars,
+bogeys, double_bogeys, eagles), scrambling, sand_saves, strokes gained
+(sg_total, sg_ott, sg_app, sg_arg, sg_putt) and weather (wind_speed,
+temperature, conditions).
+
+The file is read in chunks, one sequence per column, and each chunk is
+validated and transformed column-at-a-time: numbers are parsed once per
+distinct value, rows are linked to their tournamentResults row through a
+local (ESPN ID, year, tournament) key map paged down once via
+roundStats:getRoundStatsKeyPage, and toPar is score minus the course's par
+(72 when unknown, as importTournamentResultsBatch assumes). Rows with a
+round outside 1-4, a score outside 1-99, no matching result, or a result
+with no known course are dropped and counted by reason.
+
+The rounds of each result are sent together as one payload (the result's
+IDs once, then its rounds) to roundStats:importRoundStatsBatch, which
+upserts by (tournamentResultId, round); there is no mutation per round.
+Rows are grouped by result within each chunk, and a result whose rows
+straddle two chunks is merged before sending; a result whose rows are
+scattered across non-adjacent chunks is sent as several payloads. Change
+detection hashes each (result, round) on its own, so either way a re-run
+sends only the rounds that changed.
+
+With pyarrow installed, chunks come from Arrow's streaming CSV reader and
+are processed with compute kernels; otherwise pure-Python columns are used.
+
+Benchmark the local stage on a synthetic file (no Convex calls):
+    python -m golfgod_import.rounds --rows 1000000
+"""
+
+import argparse
+import csv
+import math
+import os
+import re
+import tempfile
+import time
+from itertools import compress, islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .batching import batch_sizer
+from .checkpoint import CheckpointJournal
+from .dispatcher import BatchDispatcher
+from .manifest import ChangeManifest
+from .normalize import arrow_records, map_distinct, no_gc, pa, zip_records
+from .rejects import RejectFile
+
+if pa is not None:
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+
+MUTATION = "roundStats:importRoundStatsBatch"
+KEY_PAGE = "roundStats:getRoundStatsKeyPage"
+PAGE_SIZE = 1000  # Server-side cap per key page
+BATCH_SIZE = 50  # Results per mutation (~200 rounds)
+MAX_BATCH_SIZE = 200  # MAX_RESULTS_PER_BATCH in convex/roundStats.ts
+CHUNK_ROWS = 50_000
+ROW_BYTES = 128  # Rough CSV row size, to turn --chunk-rows into an Arrow block size
+DEFAULT_PAR = 72
+ROUNDS = (1, 4)
+SCORES = (1, 99)  # validateRounds keeps 0 < score < 100
+PROGRESS_INTERVAL = 5.0
+
+# Output field → CSV column, by type
+INT_FIELDS = (("fairwaysHit", "fairways_hit"), ("fairwaysPossible", "fairways_possible"),
+              ("greensHit", "greens_hit"), ("greensPossible", "greens_possible"), ("putts", "putts"),
+              ("birdies", "birdies"), ("pars", "pars"), ("bogeys", "bogeys"),
+              ("doubleBogeys", "double_bogeys"), ("eagles", "eagles"))
+FLOAT_FIELDS = (("sgTotal", "sg_total"), ("sgOtt", "sg_ott"), ("sgApp", "sg_app"), ("sgArg", "sg_arg"),
+                ("sgPutt", "sg_putt"), ("windSpeed", "wind_speed"), ("temperature", "temperature"))
+TEXT_FIELDS = (("teeTime", "tee_time"), ("scrambling", "scrambling"), ("sandSaves", "sand_saves"),
+               ("conditions", "conditions"))
+KEY_COLUMNS = ("player_id", "year", "tournament", "round", "score")
+COLUMNS = KEY_COLUMNS + tuple(c for fields in (INT_FIELDS, FLOAT_FIELDS, TEXT_FIELDS) for _, c in fields)
+FIELDS = ("round", "score", "toPar") + tuple(f for fields in (INT_FIELDS, FLOAT_FIELDS, TEXT_FIELDS) for f, _ in fields)
+REASONS = ("round", "score", "unlinked", "course")
+
+_INTEGER = re.compile(r"^\s*-?\d+\s*$")
+_NUMBER = re.compile(r"^\s*-?(\d+\.?\d*|\.\d+)\s*$")
+
+Columns = Dict[str, Sequence[Any]]
+
+
+def result_key(espn_id: Any, year: Any, tournament: Any) -> str:
+    return f"{espn_id}|{year}|{tournament}"
+
+
+class ResultKeys:
+    """(ESPN ID, year, tournament) → the tournamentResults row its rounds belong to
+
+    Rows are held as parallel columns so a chunk links with one index lookup
+    per row and a take() per output column.
+    """
+
+    def __init__(self, results: Iterable[Dict[str, Any]]):
+        self.index: Dict[str, int] = {}
+        self.result_ids: List[str] = []
+        self.player_ids: List[str] = []
+        self.course_ids: List[Optional[str]] = []
+        self.years: List[int] = []
+        self.pars: List[int] = []
+        self.unkeyed = 0
+        for r in results:
+            if not r.get("espnId"):
+                self.unkeyed += 1  # Player without an ESPN ID; no source row can name it
+                continue
+            key = result_key(r["espnId"], r["year"], r["tournament"])
+            if key in self.index:
+                continue
+            self.index[key] = len(self.result_ids)
+            self.result_ids.append(r["_id"])
+            self.player_ids.append(r["playerId"])
+            self.course_ids.append(r.get("courseId"))
+            self.years.append(r["year"])
+            self.pars.append(r.get("par") or DEFAULT_PAR)
+        self._arrow: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def load(cls, client: Any) -> "ResultKeys":
+        """Page the key map of every tournament result down once"""
+        results: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            page = client.query(KEY_PAGE, {"cursor": cursor, "batchSize": PAGE_SIZE})
+            results.extend(page["results"])
+            if not page["hasMore"]:
+                return cls(results)
+            cursor = page["cursor"]
+
+    def __len__(self) -> int:
+        return len(self.result_ids)
+
+    def arrow(self) -> Dict[str, Any]:
+        """The key map as Arrow arrays, built on first use"""
+        if self._arrow is None:
+            self._arrow = {
+                "keys": pa.array(list(self.index), pa.string()),
+                "hasCourse": pa.array([c is not None for c in self.course_ids], pa.bool_()),
+                "pars": pa.array(self.pars, pa.int64()),
+            }
+        return self._arrow
+
+    def payload(self, i: int) -> Dict[str, Any]:
+        """A result's IDs, sent once ahead of its rounds"""
+        return {"tournamentResultId": self.result_ids[i], "playerId": self.player_ids[i],
+                "courseId": self.course_ids[i], "year": self.years[i]}
+
+
+class RoundStats:
+    """Row counts and timings for one rounds import"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished = self.started
+        self.chunks = 0
+        self.rows = 0
+        self.valid = 0
+        self.rejected = {reason: 0 for reason in REASONS}
+        self.prepare_seconds = 0.0
+        self.payloads = 0
+        self.inserted = 0
+        self.updated = 0
+        self.errors = 0
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = max(self.finished - self.started, 1e-9)
+        written = self.inserted + self.updated
+        return {
+            "chunks": self.chunks,
+            "rows": self.rows,
+            "valid": self.valid,
+            "rejected": dict(self.rejected),
+            "payloads": self.payloads,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "errors": self.errors,
+            "seconds": round(elapsed, 3),
+            "prepareSeconds": round(self.prepare_seconds, 3),
+            "prepareRowsPerSec": round(self.rows / self.prepare_seconds, 1) if self.prepare_seconds else 0.0,
+            "rowsPerSec": round(written / elapsed, 1),
+        }
+
+    def print_summary(self) -> None:
+        s = self.summary()
+        rejected = ", ".join(f"{count} {reason}" for reason, count in s["rejected"].items() if count) or "none"
+        print(f"Rounds: {s['rows']} rows in {s['chunks']} chunks, {s['valid']} valid (rejected: {rejected})")
+        print(f"  prepare {s['prepareSeconds']}s ({s['prepareRowsPerSec']} rows/sec), "
+              f"{s['payloads']} result payloads")
+        print(f"  {s['inserted']} inserted, {s['updated']} updated, {s['errors']} errors in {s['seconds']}s "
+              f"({s['rowsPerSec']} rounds/sec end to end)")
+
+
+def _int(value: str) -> Optional[int]:
+    return int(value) if _INTEGER.match(value) else None
+
+
+def _number(value: str) -> Optional[float]:
+    return float(value) if _NUMBER.match(value) else None
+
+
+def _text(value: str) -> Optional[str]:
+    return value.strip() or None
+
+
+def _in_range(values: Sequence[Optional[int]], bounds: Tuple[int, int]) -> List[bool]:
+    low, high = bounds
+    return [v is not None and low <= v <= high for v in values]
+
+
+def _python_chunks(path: Union[str, Path], chunk_rows: int, skip: int = 0) -> Iterator[Columns]:
+    """Chunks of up to chunk_rows rows as {column: tuple} ('' for missing columns)"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        index = {name: i for i, name in enumerate(header)}
+        width = len(header)
+        rows_iter = (row for row in reader if row)
+        for _ in islice(rows_iter, skip):
+            pass
+        while True:
+            rows = list(islice(rows_iter, chunk_rows))
+            if not rows:
+                return
+            if any(len(row) != width for row in rows):
+                rows = [(row + [""] * width)[:width] for row in rows]
+            transposed = list(zip(*rows))
+            yield {name: transposed[index[name]] if name in index else ("",) * len(rows) for name in COLUMNS}
+
+
+def _arrow_chunks(path: Union[str, Path], chunk_rows: int) -> Iterator[Any]:
+    """Record batches of string columns from Arrow's streaming reader ('' for missing columns)"""
+    reader = pa_csv.open_csv(
+        str(path),
+        read_options=pa_csv.ReadOptions(block_size=max(1 << 16, chunk_rows * ROW_BYTES)),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in COLUMNS},
+            include_columns=list(COLUMNS),
+            include_missing_columns=True,
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+        ),
+    )
+    for batch in reader:
+        yield {name: pc.fill_null(batch.column(name).cast(pa.string()), "") for name in COLUMNS}
+
+
+def read_chunks(path: Union[str, Path], chunk_rows: int = CHUNK_ROWS, use_arrow: bool = True) -> Iterator[Columns]:
+    """Column chunks of the rounds CSV; Arrow arrays when available, else tuples
+
+    A ragged row makes Arrow give up partway; the Python reader then takes
+    over after the rows already yielded.
+    """
+    if not (use_arrow and pa is not None):
+        yield from _python_chunks(path, chunk_rows)
+        return
+    done = 0
+    try:
+        for chunk in _arrow_chunks(path, chunk_rows):
+            yield chunk
+            done += len(chunk["player_id"])
+    except pa.ArrowInvalid:
+        yield from _python_chunks(path, chunk_rows, skip=done)
+
+
+def _prepare_python(columns: Columns, keys: ResultKeys) -> Tuple[List[int], List[Dict[str, Any]], Dict[str, int]]:
+    years = map_distinct(columns["year"], _int)
+    rounds = map_distinct(columns["round"], _int)
+    scores = map_distinct(columns["score"], _int)
+    espn_ids = map_distinct(columns["player_id"], str.strip)
+    tournaments = map_distinct(columns["tournament"], str.strip)
+    linked = list(map(keys.index.get, map(result_key, espn_ids, years, tournaments)))
+
+    round_ok = _in_range(rounds, ROUNDS)
+    score_ok = _in_range(scores, SCORES)
+    has_course = [i is not None and keys.course_ids[i] is not None for i in linked]
+    rejected = {
+        "round": round_ok.count(False),
+        "score": sum(r and not s for r, s in zip(round_ok, score_ok)),
+        "unlinked": sum(r and s and i is None for r, s, i in zip(round_ok, score_ok, linked)),
+        "course": sum(r and s and i is not None and not c for r, s, i, c in zip(round_ok, score_ok, linked, has_course)),
+    }
+
+    keep = [r and s and c for r, s, c in zip(round_ok, score_ok, has_course)]
+    linked = list(compress(linked, keep))
+    rounds = list(compress(rounds, keep))
+    scores = list(compress(scores, keep))
+    pars = list(map(keys.pars.__getitem__, linked))
+    parsed = [rounds, scores, [s - p for s, p in zip(scores, pars)]]
+    for parse, fields in ((_int, INT_FIELDS), (_number, FLOAT_FIELDS), (_text, TEXT_FIELDS)):
+        parsed += [map_distinct(list(compress(columns[c], keep)), parse) for _, c in fields]
+    return linked, zip_records(FIELDS, parsed), rejected
+
+
+def _arrow_int(column: Any) -> Any:
+    ok = pc.match_substring_regex(column, _INTEGER.pattern)
+    return pc.if_else(ok, pc.cast(pc.if_else(ok, pc.utf8_trim_whitespace(column), "0"), pa.int64()), None)
+
+
+def _arrow_number(column: Any) -> Any:
+    ok = pc.match_substring_regex(column, _NUMBER.pattern)
+    return pc.if_else(ok, pc.cast(pc.if_else(ok, pc.utf8_trim_whitespace(column), "0"), pa.float64()), None)
+
+
+def _arrow_text(column: Any) -> Any:
+    value = pc.utf8_trim_whitespace(column)
+    return pc.if_else(pc.equal(value, ""), None, value)
+
+
+def _arrow_in_range(values: Any, bounds: Tuple[int, int]) -> Any:
+    low, high = bounds
+    return pc.fill_null(pc.and_(pc.greater_equal(values, low), pc.less_equal(values, high)), False)
+
+
+def _count(mask: Any) -> int:
+    return pc.sum(pc.cast(mask, pa.int64())).as_py() or 0
+
+
+def _prepare_arrow(columns: Columns, keys: ResultKeys) -> Tuple[List[int], List[Dict[str, Any]], Dict[str, int]]:
+    key_map = keys.arrow()
+    year = _arrow_int(columns["year"])
+    rounds = _arrow_int(columns["round"])
+    scores = _arrow_int(columns["score"])
+    key = pc.binary_join_element_wise(pc.utf8_trim_whitespace(columns["player_id"]), pc.cast(year, pa.string()),
+                                      pc.utf8_trim_whitespace(columns["tournament"]), "|")
+    linked = pc.index_in(key, value_set=key_map["keys"])
+
+    round_ok = _arrow_in_range(rounds, ROUNDS)
+    score_ok = pc.and_(round_ok, _arrow_in_range(scores, SCORES))
+    is_linked = pc.and_(score_ok, pc.is_valid(linked))
+    keep = pc.and_(is_linked, pc.fill_null(pc.take(key_map["hasCourse"], linked), False))
+    rejected = {
+        "round": _count(pc.invert(round_ok)),
+        "score": _count(pc.and_(round_ok, pc.invert(score_ok))),
+        "unlinked": _count(pc.and_(score_ok, pc.invert(is_linked))),
+        "course": _count(pc.and_(is_linked, pc.invert(keep))),
+    }
+
+    linked = pc.filter(linked, keep)
+    scores = pc.filter(scores, keep)
+    table = {
+        "round": pc.filter(rounds, keep),
+        "score": scores,
+        "toPar": pc.subtract(scores, pc.take(key_map["pars"], linked)),
+    }
+    for parse, fields in ((_arrow_int, INT_FIELDS), (_arrow_number, FLOAT_FIELDS), (_arrow_text, TEXT_FIELDS)):
+        for field, c in fields:
+            table[field] = parse(pc.filter(columns[c], keep))
+    return linked.to_pylist(), arrow_records(pa.table(table)), rejected
+
+
+def prepare_chunk(columns: Columns, keys: ResultKeys) -> Tuple[List[int], List[Dict[str, Any]], Dict[str, int]]:
+    """Validate, link and transform one chunk
+
+    Returns the key-map index of every kept row, its round record, and the
+    dropped row counts by reason.
+    """
+    with no_gc():
+        if isinstance(columns["player_id"], (tuple, list)):
+            return _prepare_python(columns, keys)
+        return _prepare_arrow(columns, keys)
+
+
+def _payload(keys: ResultKeys, i: int, rounds: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+    return dict(keys.payload(i), rounds=[rounds[r] for r in sorted(rounds)])
+
+
+def iter_payloads(
+    chunks: Iterable[Columns],
+    keys: ResultKeys,
+    stats: Optional[RoundStats] = None
+) -> Iterator[Dict[str, Any]]:
+    """One payload per result and chunk; the last result of a chunk waits for the next chunk"""
+    stats = stats or RoundStats()
+    carry: Optional[Tuple[int, Dict[int, Dict[str, Any]]]] = None
+    for columns in chunks:
+        start = time.perf_counter()
+        linked, records, rejected = prepare_chunk(columns, keys)
+        groups: Dict[int, Dict[int, Dict[str, Any]]] = {}
+        if carry:
+            groups[carry[0]] = carry[1]
+        for i, record in zip(linked, records):
+            groups.setdefault(i, {})[record["round"]] = record  # A repeated round keeps the last row
+        stats.prepare_seconds += time.perf_counter() - start
+        stats.chunks += 1
+        stats.rows += len(columns["player_id"])
+        stats.valid += len(records)
+        for reason, count in rejected.items():
+            stats.rejected[reason] += count
+
+        last = linked[-1] if linked else (carry[0] if carry else None)
+        carry = (last, groups.pop(last)) if last is not None else None
+        for i, rounds in groups.items():
+            stats.payloads += 1
+            yield _payload(keys, i, rounds)
+    if carry:
+        stats.payloads += 1
+        yield _payload(keys, *carry)
+
+
+def round_key(payload: Dict[str, Any], record: Dict[str, Any]) -> str:
+    """Manifest key of one round"""
+    return f"{payload['tournamentResultId']}:{record['round']}"
+
+
+def changed_rounds(
+    payloads: Iterable[Dict[str, Any]],
+    manifest: ChangeManifest,
+    full: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """Each payload cut down to its new or modified rounds (all of them with full); empty payloads are dropped"""
+    for payload in payloads:
+        ids = {k: v for k, v in payload.items() if k != "rounds"}
+        rounds = [record for record in payload["rounds"]
+                  if manifest.classify(dict(ids, roundKey=round_key(payload, record), **record)) != "unchanged"
+                  or full]
+        if rounds:
+            yield dict(payload, rounds=rounds)
+
+
+def mark_rounds_sent(manifest: ChangeManifest, payloads: Iterable[Dict[str, Any]]) -> None:
+    manifest.mark_keys(round_key(p, record) for p in payloads for record in p["rounds"])
+
+
+def run(client: Any, args: Any) -> int:
+    """Import the rounds CSV; returns a process exit code"""
+    if not args.rounds_file:
+        print("Error: --rounds-file is required for the rounds import")
+        return 1
+    if not os.path.exists(args.rounds_file):
+        print(f"Error: rounds file not found at {args.rounds_file}")
+        return 1
+
+    print("=== Round Stats Import ===")
+    print(f"Rounds File: {args.rounds_file}")
+    print(f"Chunk: {args.chunk_rows} rows ({'arrow' if pa is not None else 'python'} columns)")
+    print(f"Batch Size: {args.batch_size or 'adaptive'} results")
+    print(f"Concurrency: {args.concurrency}")
+
+    profiler = client.profiler
+    profiler.phase("keys")
+    keys = ResultKeys.load(client)
+    print(f"\n{len(keys)} tournament results to link rounds to"
+          + (f" ({keys.unkeyed} skipped: player has no ESPN ID)" if keys.unkeyed else ""))
+    if not keys:
+        print("No tournament results found; run the results import first")
+        return 1
+
+    profiler.phase("send")
+    stats = RoundStats()
+    manifest = ChangeManifest("rounds", "roundKey")
+    journal = CheckpointJournal("rounds", resume=args.resume)
+    rejects = RejectFile("rounds", resume=args.resume)
+    sizer = batch_sizer(MUTATION, args.batch_size, BATCH_SIZE, max_size=MAX_BATCH_SIZE)
+    dispatcher = BatchDispatcher(client, MUTATION, "results", concurrency=args.concurrency, sizer=sizer,
+                                 rejects=rejects)
+
+    payloads = iter_payloads(read_chunks(args.rounds_file, args.chunk_rows), keys, stats)
+    changed = changed_rounds(payloads, manifest, args.full)
+    batches = sizer.batches(journal.pending(MUTATION, changed, on_skip=lambda b: mark_rounds_sent(manifest, b)))
+    last_report = time.perf_counter()
+    try:
+        for batch_num, batch, result in dispatcher.dispatch(batches):
+            if isinstance(result, Exception):
+                journal.record(MUTATION, batch_num, batch, result)
+                print(f"  Batch {batch_num} ({len(batch)} results): {result}")
+                stats.errors += sum(len(p["rounds"]) for p in batch)
+                continue
+            # Results with a round that failed to write are re-sent next run / on --resume
+            failed_ids = set(result.get("failedResults") or ())
+            failed = [p for p in batch if p["tournamentResultId"] in failed_ids]
+            journal.record(MUTATION, batch_num, batch, result, failed)
+            mark_rounds_sent(manifest, [p for p in batch if p["tournamentResultId"] not in failed_ids])
+            stats.inserted += result.get("inserted", 0)
+            stats.updated += result.get("updated", 0)
+            stats.errors += len(result.get("errors") or [])
+
+            now = time.perf_counter()
+            if now - last_report >= PROGRESS_INTERVAL:
+                last_report = now
+                written = stats.inserted + stats.updated
+                print(f"  {stats.rows} rows read, {written} rounds written "
+                      f"({written / (now - stats.started):.0f} rounds/sec)", flush=True)
+    finally:
+        stats.finished = time.perf_counter()
+        profiler.add_busy("prepare (busy)", stats.prepare_seconds, stats.rows)
+        print()
+        dispatcher.stats.print_summary("importRoundStatsBatch")
+        sizer.print_summary()
+        sizer.save()
+        journal.print_summary()
+        journal.close()
+        rejects.print_summary()
+        rejects.close()
+        manifest.print_summary()
+        manifest.save()
+        stats.print_summary()
+
+    print("\n✅ Round stats import complete!")
+    return 0
+
+
+def synthetic_round_row(espn_id: str, year: int, tournament: str, round_num: Any, score: Any, n: int) -> List[Any]:
+    """One CSV row in COLUMNS order; n varies the detail stats and mixes in messy values"""
+    return [
+        espn_id, year, tournament, round_num, score,
+        n % 15, 14, n % 19, 18, 26 + n % 8, n % 7, 10 + n % 5, n % 4, n % 2, "n/a" if n % 13 == 0 else n % 2,
+        f"{n % 9 / 4 - 1:.3f}", f"{n % 5 / 10:.2f}", "", "0.4", f"{n % 7 / 10 - 0.3:.2f}", n % 25, 55 + n % 30,
+        "AM" if n % 2 else "PM", f"{n % 5}/{n % 5 + 2}", "1/2", "" if n % 4 else " Sunny ",
+    ]
+
+
+def write_synthetic_rounds(path: Path, rows: int, players: int = 1000) -> List[Dict[str, Any]]:
+    """A rounds CSV with messy rows mixed in; returns the key-map rows it links to"""
+    results = []
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for n in range(math.ceil(rows / 4)):
+            espn_id, year, tournament = str(1000 + n % players), 2015 + n // players % 12, f"Event {n // players}"
+            results.append({"_id": f"tournamentResults:{n}", "playerId": f"players:{n % players}",
+                            "espnId": espn_id, "year": year, "tournament": tournament,
+                            "courseId": f"courses:{n % 50}" if n % 101 else None, "par": 70 + n % 3})
+            for r in range(1, 5):
+                i = n * 4 + r
+                writer.writerow(synthetic_round_row(
+                    espn_id if i % 211 else "0", year, tournament, r if i % 307 else "",
+                    "DNS" if i % 401 == 0 else 60 + i % 20, i,
+                ))
+    return results
+
+
+def _best_of(repeat: int, fn: Any, *args: Any) -> Tuple[Any, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--repeat", type=int, default=3, help="Report the best of N runs")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "rounds.csv"
+        keys = ResultKeys(write_synthetic_rounds(path, args.rows))
+        print(f"{args.rows} synthetic rounds, chunks of {args.chunk_rows}, best of {args.repeat}")
+
+        def prepare(use_arrow: bool) -> List[Dict[str, Any]]:
+            stats = RoundStats()
+            payloads = list(iter_payloads(read_chunks(path, args.chunk_rows, use_arrow), keys, stats))
+            return [payloads, stats.summary()["rejected"]]
+
+        expected = None
+        for engine, use_arrow in [("python", False)] + ([("arrow", True)] if pa is not None else []):
+            result, seconds = _best_of(args.repeat, prepare, use_arrow)
+            if expected is None:
+                expected = result
+            assert result == expected, f"{engine} payloads differ from the python engine"
+            print(f"  {engine}: {seconds:.3f}s ({args.rows / seconds:,.0f} rows/sec), "
+                  f"{len(result[0])} payloads, rejected {result[1]}")
+        if pa is None:
+            print("  (pip install pyarrow for the Arrow engine)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Long-lived Convex connection shared by every batch of an import run
+"""
+
+import http.client
+import json
+import random
+import subprocess
+import threading
+import time
+from urllib.parse import urlsplit
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .config import resolve_convex_url
+from .dispatcher import chunked, is_rate_limited
+from .profiling import Profiler
+
+# Queries are retried on rate-limit errors like BatchDispatcher retries mutations
+QUERY_RETRIES = 5
+BASE_BACKOFF = 0.25
+MAX_BACKOFF = 8.0
+
+
+class ConvexBackend:
+    """One pooled ConvexClient reused for every call"""
+
+    def __init__(self, url: str):
+        from convex import ConvexClient
+
+        self.url = url
+        self.client = ConvexClient(url)
+
+    def query(self, name: str, args: Optional[Dict[str, Any]] = None) -> Any:
+        return self.client.query(name, args or {})
+
+    def mutation(self, name: str, args: Optional[Dict[str, Any]] = None) -> Any:
+        return self.client.mutation(name, args or {})
+
+    def close(self) -> None:
+        pass
+
+
+class HttpBackend:
+    """Convex HTTP API (POST /api/query, /api/mutation), one keep-alive connection per thread
+
+    Speaks the same wire format as a deployment's HTTP API, so it works both
+    against Convex and against the local stand-in (golfgod_import.standin).
+    """
+
+    def __init__(self, url: str, timeout: float = 60.0):
+        parts = urlsplit(url)
+        self.url = url
+        self.https = parts.scheme == "https"
+        self.netloc = parts.netloc
+        self.timeout = timeout
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections: List[http.client.HTTPConnection] = []
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            conn = self.local.conn = cls(self.netloc, timeout=self.timeout)
+            with self.lock:
+                self.connections.append(conn)
+        return conn
+
+    def _post(self, kind: str, name: str, args: Optional[Dict[str, Any]]) -> Any:
+        body = json.dumps({"path": name, "args": args or {}, "format": "json"})
+        conn = self._connection()
+        try:
+            conn.request("POST", f"/api/{kind}", body, {"Content-Type": "application/json"})
+            response = conn.getresponse()
+            payload = response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            self.local.conn = None
+            raise
+
+        if response.status == 429:
+            raise RuntimeError(f"429 Too Many Requests: {payload.decode('utf-8', 'replace')}")
+        try:
+            data = json.loads(payload) if payload else {}
+        except ValueError:
+            raise RuntimeError(f"HTTP {response.status}: {payload[:200]!r}")
+        if response.status >= 400 or data.get("status") == "error":
+            raise RuntimeError(data.get("errorMessage") or f"HTTP {response.status}")
+        return data.get("value")
+
+    def query(self, name: str, args: Optional[Dict[str, Any]] = None) -> Any:
+        return self._post("query", name, args)
+
+    def mutation(self, name: str, args: Optional[Dict[str, Any]] = None) -> Any:
+        return self._post("mutation", name, args)
+
+    def close(self) -> None:
+        with self.lock:
+            for conn in self.connections:
+                conn.close()
+            self.connections.clear()
+
+
+class SubprocessBackend:
+    """Legacy path: one `npx convex run` process per call, kept for benchmarks"""
+
+    def __init__(self, command: Sequence[str] = ("npx", "convex", "run")):
+        self.command = list(command)
+
+    def call(self, name: str, args: Optional[Dict[str, Any]] = None) -> Any:
+        result = subprocess.run(
+            self.command + [name, json.dumps(args or {})],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return json.loads(result.stdout) if result.stdout.strip() else None
+
+    query = call
+    mutation = call
+
+    def close(self) -> None:
+        pass
+
+
+class ImportRuntime:
+    """Runs queries, mutations and batched imports over a single backend"""
+
+    def __init__(self, backend: Any, profiler: Optional[Profiler] = None):
+        self.backend = backend
+        self.profiler = profiler or Profiler()
+        self.calls = 0
+        self.call_seconds = 0.0
+
+    @classmethod
+    def create(
+        cls,
+        backend: str = "convex",
+        url: Optional[str] = None,
+        profiler: Optional[Profiler] = None
+    ) -> "ImportRuntime":
+        """Build a runtime for the named backend: convex, http, subprocess or stub"""
+        if backend == "convex":
+            return cls(ConvexBackend(resolve_convex_url(url)), profiler)
+        if backend == "http":
+            return cls(HttpBackend(resolve_convex_url(url)), profiler)
+        if backend == "subprocess":
+            return cls(SubprocessBackend(), profiler)
+        if backend == "stub":
+            from .stub import StubBackend
+            return cls(StubBackend(), profiler)
+        raise ValueError(f"Unknown backend: {backend}")
+
+    def _timed(self, fn: Any, name: str, args: Optional[Dict[str, Any]]) -> Any:
+        start = time.perf_counter()
+        result, failed = None, True
+        try:
+            result = fn(name, args or {})
+            failed = False
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            self.calls += 1
+            self.call_seconds += elapsed
+            if self.profiler.enabled:
+                self.profiler.record_call(name, elapsed, args, result, failed)
+
+    def query(self, name: str, args: Optional[Dict[str, Any]] = None) -> Any:
+        """Run a query, backing off exponentially and retrying while it is rate limited"""
+        attempt = 0
+        while True:
+            try:
+                return self._timed(self.backend.query, name, args)
+            except Exception as e:
+                if not is_rate_limited(e) or attempt >= QUERY_RETRIES:
+                    raise
+                time.sleep(min(MAX_BACKOFF, BASE_BACKOFF * 2 ** attempt) * (1 + random.random() * 0.25))
+                attempt += 1
+                self.profiler.record_retry(name)
+
+    def mutation(self, name: str, args: Optional[Dict[str, Any]] = None) -> Any:
+        return self._timed(self.backend.mutation, name, args)
+
+    def run_batches(
+        self,
+        name: str,
+        records: Iterable[Dict[str, Any]],
+        batch_size: int,
+        arg_name: str
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]], Any]]:
+        """Send records in fixed-size batches, yielding (batch_num, batch, result)
+
+        A failed batch yields the raised exception as its result so callers can
+        report it and carry on with the next batch.
+        """
+        for batch_num, batch in enumerate(chunked(records, batch_size), start=1):
+            try:
+                result = self.mutation(name, {arg_name: batch})
+            except Exception as e:
+                result = e
+            yield batch_num, batch, result
+
+    def close(self) -> None:
+        self.backend.close()
+
+    def __enter__(self) -> "ImportRuntime":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,151 @@
+"""
+Bulk tournament search and search latency benchmark.
+
+Runs a set of search terms through tournaments:searchTournaments (paged,
+newest year first) with several queries in flight, and reports per-query
+latency. With --synthetic, the table is first topped up with generated
+tournaments to each size in turn (e.g. 1000,10000,100000) and the terms
+are re-run at every size. --cleanup deletes the generated rows afterwards.
+
+    golfgod-import search "Open" "Scheffler" --pages 3
+    golfgod-import search --synthetic 1000,10000,100000 --cleanup --backend stub
+    golfgod-import search --backfill     # Index tournaments imported before search_text
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .batching import batch_sizer
+from .dispatcher import BatchDispatcher, chunked, percentile
+
+DEFAULT_TERMS = ("Open", "Championship", "Classic", "Invitational", "Scheffler", "McIlroy", "Pebble", "Memorial")
+SYNTHETIC_PREFIX = "synthetic_"
+SYNTHETIC_FIRST_YEAR = 1900  # Generated seasons stay clear of real ones
+
+_PLACES = ("Pebble Beach", "Riviera", "Sawgrass", "Augusta", "Muirfield", "Torrey Pines", "Bay Hill",
+           "Harbour Town", "Colonial", "Quail Hollow", "Memorial Park", "Kapalua", "Sedgefield", "TPC Boston")
+_KINDS = ("Open", "Classic", "Championship", "Invitational", "Pro-Am", "Challenge")
+_FIRST = ("Scottie", "Rory", "Jon", "Xander", "Collin", "Viktor", "Patrick", "Justin", "Tony", "Hideki")
+_LAST = ("Scheffler", "McIlroy", "Rahm", "Schauffele", "Morikawa", "Hovland", "Cantlay", "Thomas", "Finau", "Matsuyama")
+
+
+def synthetic_tournaments(start: int, stop: int, seed: int = 7) -> Iterator[Dict[str, Any]]:
+    """Deterministic tournaments shaped like the schedule import, ids synthetic_{n}"""
+    for n in range(start, stop):
+        rng = random.Random(seed * 1_000_003 + n)
+        winner_first, winner_last = rng.choice(_FIRST), rng.choice(_LAST)
+        yield {
+            "tournament_id": f"{SYNTHETIC_PREFIX}{n:07d}",
+            "name": f"{rng.choice(_PLACES)} {rng.choice(_KINDS)} {n}",
+            "year": SYNTHETIC_FIRST_YEAR + n % 100,
+            "winner_name": f"{winner_first} {winner_last}",
+            "winner_espn_id": 9_000_000 + rng.randrange(5000),
+            "prize_money": rng.randrange(1, 20) * 500_000,
+            "status": "completed",
+            "scraped_at": "1970-01-01T00:00:00Z",
+        }
+
+
+def _send(client: Any, name: str, arg_name: str, batches: Iterator[List[Any]], concurrency: int) -> int:
+    dispatcher = BatchDispatcher(client, name, arg_name, concurrency=concurrency)
+    failed = 0
+    for _, _, result in dispatcher.dispatch(batches):
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"  {name}: {result}")
+    return failed
+
+
+def seed_synthetic(client: Any, start: int, stop: int, concurrency: int, batch_size: Optional[int]) -> None:
+    name = "tournaments:importTournamentsBatch"
+    sizer = batch_sizer(name, batch_size, 50)
+    begin = time.perf_counter()
+    _send(client, name, "tournaments", sizer.batches(synthetic_tournaments(start, stop)), concurrency)
+    sizer.save()
+    print(f"Seeded synthetic tournaments {start}..{stop} in {time.perf_counter() - begin:.1f}s")
+
+
+def delete_synthetic(client: Any, count: int, concurrency: int) -> None:
+    ids = (f"{SYNTHETIC_PREFIX}{n:07d}" for n in range(count))
+    _send(client, "tournaments:deleteTournaments", "tournament_ids", chunked(ids, 200), concurrency)
+    print(f"Deleted {count} synthetic tournaments")
+
+
+def backfill(client: Any) -> int:
+    cursor, updated = None, 0
+    while True:
+        result = client.mutation("tournaments:backfillTournamentSearchText", {"cursor": cursor})
+        updated += result["updated"]
+        if not result["hasMore"]:
+            return updated
+        cursor = result["cursor"]
+
+
+def search(client: Any, term: str, limit: int, pages: int) -> Tuple[int, List[float]]:
+    """Results and per-page latencies for one term, following up to `pages` cursors"""
+    cursor, found, latencies = None, 0, []
+    for _ in range(pages):
+        start = time.perf_counter()
+        page = client.query("tournaments:searchTournaments", {"searchTerm": term, "limit": limit, "cursor": cursor})
+        latencies.append(time.perf_counter() - start)
+        found += len(page["tournaments"])
+        if not page["hasMore"]:
+            break
+        cursor = page["cursor"]
+    return found, latencies
+
+
+def bench(client: Any, terms: List[str], limit: int, pages: int, repeat: int, concurrency: int) -> Dict[str, Any]:
+    """Run every term `repeat` times with `concurrency` searches in flight"""
+    jobs = [term for _ in range(repeat) for term in terms]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        outcomes = list(pool.map(lambda term: search(client, term, limit, pages), jobs))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for _, page_latencies in outcomes for latency in page_latencies]
+    return {
+        "queries": len(latencies),
+        "results": sum(found for found, _ in outcomes),
+        "seconds": round(elapsed, 3),
+        "queriesPerSec": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50Ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95Ms": round(percentile(latencies, 95) * 1000, 1),
+        "maxMs": round(max(latencies, default=0.0) * 1000, 1),
+        "perTerm": {term: found for term, (found, _) in zip(jobs, outcomes)},
+    }
+
+
+def print_bench(label: str, s: Dict[str, Any]) -> None:
+    print(f"{label}: {s['queries']} queries, {s['results']} results in {s['seconds']}s "
+          f"({s['queriesPerSec']} queries/sec), p50 {s['p50Ms']}ms, p95 {s['p95Ms']}ms, max {s['maxMs']}ms")
+    for term, found in s["perTerm"].items():
+        print(f"  {term!r}: {found} results")
+
+
+def run(client: Any, args: Any) -> int:
+    """Search (or benchmark search) tournaments; returns a process exit code"""
+    if args.backfill:
+        print(f"Indexed searchText on {backfill(client)} tournaments")
+
+    terms = args.terms or list(DEFAULT_TERMS)
+    sizes = sorted(int(size) for size in args.synthetic.split(",")) if args.synthetic else []
+
+    if not sizes:
+        print_bench("Search", bench(client, terms, args.limit, args.pages, args.repeat, args.concurrency))
+        return 0
+
+    seeded = 0
+    try:
+        for size in sizes:
+            if size > seeded:
+                seed_synthetic(client, seeded, size, args.concurrency, args.batch_size)
+                seeded = size
+            print_bench(f"\n{size} synthetic tournaments",
+                        bench(client, terms, args.limit, args.pages, args.repeat, args.concurrency))
+    finally:
+        if args.cleanup and seeded:
+            delete_synthetic(client, seeded, args.concurrency)
+    return 0
@@ -0,0 +1,91 @@
+"""
+Before/after snapshots of the maintained player counters.
+
+The players table keeps completeness counters (total, with photo, ESPN ID,
+world ranking, each bio field, complete bios) up to date on every write, so
+a snapshot is one small query instead of a scan of the whole table. The
+photo and bio importers take one snapshot before sending and one after and
+print the difference.
+
+Players imported before the counters existed are counted once by an
+explicit paged backfill (players:rebuildPlayerCounters); until it has run
+the counter queries return null and writes leave the counters unseeded.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+from .runtime import ImportRuntime
+
+Snapshot = Dict[str, int]
+
+# Players counted per rebuildPlayerCounters call
+SEED_PAGE_SIZE = 500
+
+# (counter, label) in report order
+PHOTO_COUNTERS = (
+    ("total", "Total players"),
+    ("withPhoto", "With photo"),
+    ("withEspnId", "With ESPN ID"),
+    ("withWorldRanking", "With world ranking"),
+)
+BIO_COUNTERS = (
+    ("total", "Total players"),
+    ("withBirthDate", "With birth date"),
+    ("withBirthPlace", "With birth place"),
+    ("withCollege", "With college"),
+    ("withHeight", "With height"),
+    ("withWeight", "With weight"),
+    ("withTurnedPro", "With turned pro"),
+    ("withSwing", "With swing"),
+    ("completeBio", "Complete profiles"),
+)
+
+
+def seed_player_counters(client: ImportRuntime) -> int:
+    """Recount every player into the counters, one page per mutation; returns players counted"""
+    cursor, counted = None, 0
+    while True:
+        page = client.mutation("players:rebuildPlayerCounters", {"cursor": cursor, "batchSize": SEED_PAGE_SIZE})
+        counted += page["processed"]
+        if not page["hasMore"]:
+            return counted
+        cursor = page["cursor"]
+
+
+def take_snapshot(client: ImportRuntime) -> Optional[Snapshot]:
+    """Current counters; runs the one-time paged backfill first if they aren't seeded yet"""
+    try:
+        counts = client.query("players:getPlayerCounters")
+        if counts is None:
+            print("Seeding player counters (one-time)...")
+            print(f"  {seed_player_counters(client)} players counted")
+            counts = client.query("players:getPlayerCounters")
+        return counts
+    except Exception as e:
+        print(f"Could not fetch player counters: {e}")
+        return None
+
+
+def print_snapshot(title: str, snapshot: Optional[Snapshot], counters: Sequence[Tuple[str, str]]) -> None:
+    if snapshot is None:
+        return
+    print(f"\n=== {title} ===")
+    for name, label in counters:
+        print(f"  {label}: {snapshot.get(name, 0)}")
+
+
+def print_diff(
+    before: Optional[Snapshot],
+    after: Optional[Snapshot],
+    counters: Sequence[Tuple[str, str]]
+) -> None:
+    """After-import counters with the change since the before snapshot"""
+    if after is None:
+        return
+    if before is None:
+        print_snapshot("Database Status", after, counters)
+        return
+    print("\n=== Changes ===")
+    for name, label in counters:
+        change = after.get(name, 0) - before.get(name, 0)
+        print(f"  {label}: {after.get(name, 0)}" + (f" ({change:+d})" if change else ""))
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Local HTTP stand-in for the Convex deployment.
+
+Serves the Convex HTTP API (POST /api/query and /api/mutation with
+{"path", "args", "format"}) from the in-process stub handlers, so the
+importers can run end to end with --backend http without touching the real
+deployment. Every request can be delayed (fixed latency plus uniform
+jitter) and a fraction of them can fail, either as a server error or as a
+429 rate limit, to exercise the retry and fallback paths.
+
+Usage (from the scripts directory):
+    python -m golfgod_import.standin --port 3210 --latency 0.02 --jitter 0.01 --failure-rate 0.01
+    golfgod-import all --backend http --url http://127.0.0.1:3210 --results-dir ...
+"""
+
+import argparse
+import json
+import random
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+from .stub import HANDLERS, StubBackend
+
+KINDS = ("query", "mutation", "action")
+
+
+class StandIn:
+    """Threaded HTTP server wrapping a StubBackend, with latency and failure injection"""
+
+    def __init__(
+        self,
+        backend: Optional[StubBackend] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.backend = backend or StubBackend()
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.throttle_rate = throttle_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {"requests": 0, "failed": 0, "throttled": 0, "errors": 0}
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self) -> type:
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, as the Convex client uses
+
+            def setup(self) -> None:
+                super().setup()
+                # Headers and body go out in separate writes; don't let Nagle hold the body back
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                status, body = standin.handle(self.path, self.rfile.read(length))
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def _roll(self) -> float:
+        with self.lock:
+            self.counts["requests"] += 1
+            return self.rng.random()
+
+    def _count(self, key: str) -> None:
+        with self.lock:
+            self.counts[key] += 1
+
+    def handle(self, path: str, raw: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Status code and JSON body for one request"""
+        kind = path.rstrip("/").rsplit("/", 1)[-1]
+        if not path.startswith("/api/") or kind not in KINDS:
+            return 404, {"status": "error", "errorMessage": f"No route for {path}"}
+        try:
+            request = json.loads(raw or b"{}")
+        except ValueError as e:
+            return 400, {"status": "error", "errorMessage": f"Invalid JSON: {e}"}
+        name = request.get("path", "")
+        if name not in HANDLERS:
+            return 404, {"status": "error", "errorMessage": f"Could not find public function for '{name}'"}
+
+        roll = self._roll()
+        delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+        if roll < self.throttle_rate:
+            self._count("throttled")
+            return 429, {"status": "error", "errorMessage": "Too Many Requests: rate limit exceeded"}
+        if roll < self.throttle_rate + self.failure_rate:
+            self._count("failed")
+            return 500, {"status": "error", "errorMessage": f"Server Error: injected failure in {name}"}
+
+        try:
+            value = self.backend.call(name, request.get("args") or {})
+        except Exception as e:
+            self._count("errors")
+            status = 429 if "429" in str(e) else 500
+            return status, {"status": "error", "errorMessage": f"{type(e).__name__}: {e}"}
+        return 200, {"status": "success", "value": value, "logLines": []}
+
+    def start(self) -> "StandIn":
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self) -> "StandIn":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3210)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra uniform random delay, up to this many seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests failing with a 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests rejected with a 429")
+    parser.add_argument("--max-in-flight", type=int, help="Reject requests above this many concurrent calls (429)")
+    parser.add_argument("--per-record-latency", type=float, default=0.0, help="Seconds added per record in a batch")
+    parser.add_argument("--seed", type=int, help="Seed for the failure rolls and jitter")
+    args = parser.parse_args()
+
+    backend = StubBackend(max_in_flight=args.max_in_flight, per_record_latency=args.per_record_latency)
+    standin = StandIn(backend, args.host, args.port, args.latency, args.jitter,
+                      args.failure_rate, args.throttle_rate, args.seed)
+    print(f"Convex stand-in listening on {standin.url} ({len(HANDLERS)} functions)")
+    try:
+        standin.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin.server.server_close()
+        print(f"{standin.counts['requests']} requests, {standin.counts['failed']} injected failures, "
+              f"{standin.counts['throttled']} throttled, {standin.counts['errors']} handler errors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Streaming loader for the multi-season tournament schedule file.
+
+Yields one record at a time from the top-level `tournaments` array so the
+filter -> transform -> batch pipeline never holds the whole document. Uses
+ijson when it is installed and falls back to an incremental decoder built on
+json.JSONDecoder.raw_decode otherwise.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, Optional, Union
+
+CHUNK_SIZE = 64 * 1024
+
+# Fields accepted by tournaments:importTournamentsBatch
+TOURNAMENT_FIELDS = (
+    "tournament_id", "name", "year", "dates_raw", "start_date", "end_date",
+    "winner_name", "winner_espn_id", "winner_profile_url", "winning_score",
+    "prize_money", "status", "espn_tournament_id", "espn_leaderboard_url", "scraped_at",
+    "previous_winner_name", "previous_winner_espn_id", "previous_winner_profile_url",
+)
+
+_WHITESPACE = " \t\r\n"
+
+
+class _Reader:
+    """Character buffer over a file that refills in chunks"""
+
+    def __init__(self, f: IO[str], chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while self.pos >= len(self.buf):
+            if not self.fill():
+                return ""
+        return self.buf[self.pos]
+
+    def skip_whitespace(self) -> str:
+        while True:
+            ch = self.peek()
+            if ch == "" or ch not in _WHITESPACE:
+                return ch
+            self.pos += 1
+
+    def decode(self, decoder: json.JSONDecoder) -> Any:
+        """Decode one JSON value at the cursor, reading more input as needed"""
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+                # A number ending exactly at the buffer edge may continue in the next chunk
+                if end < len(self.buf) or self.eof or not self.fill():
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+
+
+def _find_array(reader: _Reader, decoder: json.JSONDecoder, key: str) -> None:
+    """Advance the cursor into the array stored under `key` in the root object"""
+    if reader.skip_whitespace() != "{":
+        raise ValueError("Expected a JSON object at the top level")
+    reader.pos += 1
+
+    while True:
+        ch = reader.skip_whitespace()
+        if ch == "}":
+            raise KeyError(key)
+        if ch == ",":
+            reader.pos += 1
+            continue
+
+        name = reader.decode(decoder)
+        if reader.skip_whitespace() != ":":
+            raise ValueError(f"Expected ':' after key {name!r}")
+        reader.pos += 1
+
+        if name == key:
+            if reader.skip_whitespace() != "[":
+                raise ValueError(f"Expected {key!r} to be an array")
+            reader.pos += 1
+            return
+
+        reader.skip_whitespace()
+        reader.decode(decoder)  # skip the value of an unrelated key
+
+
+def _iter_raw_decode(f: IO[str], key: str, chunk_size: int) -> Iterator[Dict[str, Any]]:
+    decoder = json.JSONDecoder()
+    reader = _Reader(f, chunk_size)
+    _find_array(reader, decoder, key)
+
+    while True:
+        ch = reader.skip_whitespace()
+        if ch == "]":
+            return
+        if ch == ",":
+            reader.pos += 1
+            continue
+        if ch == "":
+            raise ValueError(f"Unexpected end of file inside {key!r}")
+        yield reader.decode(decoder)
+
+
+def iter_json_array(
+    source: Union[str, Path, IO[str], IO[bytes]],
+    key: str = "tournaments",
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """Yield each element of the array stored under `key` in a JSON document
+
+    A path is opened in binary mode for ijson, which decodes bytes itself (a
+    text handle makes it warn and take a slower path), and in text mode for
+    the raw_decode fallback. An open handle must suit whichever is used.
+    """
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+    if not hasattr(source, "read"):
+        if ijson is not None:
+            with open(source, "rb") as f:
+                yield from ijson.items(f, f"{key}.item", use_float=True)
+        else:
+            with open(source, "r", encoding="utf-8") as f:
+                yield from _iter_raw_decode(f, key, chunk_size)
+        return
+
+    if ijson is not None:
+        yield from ijson.items(source, f"{key}.item", use_float=True)
+    else:
+        yield from _iter_raw_decode(source, key, chunk_size)
+
+
+def filter_years(records: Iterable[Dict[str, Any]], years: Optional[Iterable[int]]) -> Iterator[Dict[str, Any]]:
+    """Keep records whose `year` is in `years` (all records when years is None)"""
+    wanted = set(years) if years is not None else None
+    for record in records:
+        if wanted is None or record.get("year") in wanted:
+            yield record
+
+
+def clean_tournament(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the fields the mutation accepts, dropping null and empty values"""
+    return {
+        field: record[field]
+        for field in TOURNAMENT_FIELDS
+        if record.get(field) is not None and record.get(field) != ""
+    }
+
+
+def iter_tournaments(path: Union[str, Path], years: Optional[Iterable[int]] = None) -> Iterator[Dict[str, Any]]:
+    """Stream mutation-ready tournaments from the schedule file"""
+    for record in filter_years(iter_json_array(path, "tournaments"), years):
+        yield clean_tournament(record)
@@ -0,0 +1,118 @@
+"""
+Verify the materialized yearSummaries table against a full recomputation.
+
+Pages through every pgaTournaments row, rebuilds the per-year totals the
+same way convex/utils/yearSummaries.ts does, and compares them with what
+tournaments:getYearSummaries serves. --repair rebuilds the years that
+differ on the server, REBUILD_YEARS years per mutation.
+
+    golfgod-import summaries [--repair]
+
+Deployments with tournaments imported before yearSummaries existed have no
+summary rows at first. The tournaments importer seeds them after every run
+(seed_year_summaries: only years without a row are rebuilt), so running
+`golfgod-import tournaments` once is the migration step.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+PAGE_SIZE = 500
+REBUILD_YEARS = 5  # MAX_REBUILD_YEARS in convex/tournaments.ts
+FIELDS = ("totalTournaments", "completedTournaments", "totalPrizeMoney", "uniqueWinners")
+
+
+def summarize_years(tournaments: Iterable[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    """Per-year totals; only completed tournaments count prize money and winners"""
+    summaries: Dict[int, Dict[str, Any]] = {}
+    winners: Dict[int, set] = {}
+    for t in tournaments:
+        year = t["year"]
+        if year not in summaries:
+            summaries[year] = {"year": year, "totalTournaments": 0, "completedTournaments": 0,
+                               "totalPrizeMoney": 0, "uniqueWinners": 0}
+            winners[year] = set()
+        summary = summaries[year]
+        summary["totalTournaments"] += 1
+        if t.get("status") != "completed":
+            continue
+        summary["completedTournaments"] += 1
+        if t.get("prize_money"):
+            summary["totalPrizeMoney"] += t["prize_money"]
+        if t.get("winner_espn_id"):
+            winners[year].add(t["winner_espn_id"])
+    for year, summary in summaries.items():
+        summary["uniqueWinners"] = len(winners[year])
+    return summaries
+
+
+def iter_tournament_fields(client: Any) -> Iterator[Dict[str, Any]]:
+    """Every tournament's summary fields, one page per query"""
+    cursor = None
+    while True:
+        page = client.query("tournaments:getTournamentSummaryPage", {"cursor": cursor, "batchSize": PAGE_SIZE})
+        yield from page["tournaments"]
+        if not page["hasMore"]:
+            return
+        cursor = page["cursor"]
+
+
+def rebuild_years(client: Any, years: Sequence[int]) -> int:
+    """Rebuild summaries on the server a few years per mutation; returns the years rebuilt"""
+    years = sorted(years)
+    for start in range(0, len(years), REBUILD_YEARS):
+        client.mutation("tournaments:rebuildYearSummaries", {"years": years[start:start + REBUILD_YEARS]})
+    return len(years)
+
+
+def seed_year_summaries(client: Any) -> int:
+    """Build summary rows for years that have tournaments but no row (and drop empty ones)"""
+    status = client.query("tournaments:getUnsummarizedYears", {})
+    years = status["missing"] + status["stale"]
+    if years:
+        print(f"Seeding year summaries for {len(years)} years...")
+    return rebuild_years(client, years)
+
+
+def compare(expected: Dict[int, Dict[str, Any]], stored: List[Dict[str, Any]]) -> Dict[int, List[str]]:
+    """Differences per year between recomputed and materialized summaries"""
+    served = {s["year"]: s for s in stored}
+    mismatches: Dict[int, List[str]] = {}
+    for year in sorted(set(expected) | set(served)):
+        want, have = expected.get(year), served.get(year)
+        if want is None:
+            mismatches[year] = ["summary row for a year with no tournaments"]
+        elif have is None:
+            mismatches[year] = ["missing summary row"]
+        else:
+            diffs = [f"{field}: stored {have.get(field)}, expected {want[field]}"
+                     for field in FIELDS if have.get(field) != want[field]]
+            if diffs:
+                mismatches[year] = diffs
+    return mismatches
+
+
+def run(client: Any, args: Any) -> int:
+    """Compare stored year summaries with a recomputation; returns a process exit code"""
+    print("Recomputing year summaries from pgaTournaments...")
+    expected = summarize_years(iter_tournament_fields(client))
+    stored = client.query("tournaments:getYearSummaries", {"limit": 500})
+    mismatches = compare(expected, stored)
+
+    print(f"{len(expected)} years recomputed, {len(stored)} stored, {len(mismatches)} differ")
+    for year, diffs in mismatches.items():
+        print(f"  {year}: " + "; ".join(diffs))
+
+    if not mismatches:
+        print("\n✅ Year summaries match a full recomputation")
+        return 0
+    if not args.repair:
+        print("\nRun with --repair to rebuild the differing years")
+        return 1
+
+    rebuild_years(client, list(mismatches))
+    remaining = compare(expected, client.query("tournaments:getYearSummaries", {"limit": 500}))
+    if remaining:
+        print(f"\n❌ {len(remaining)} years still differ after rebuilding")
+        return 1
+    print(f"\n✅ Rebuilt {len(mismatches)} years")
+    return 0
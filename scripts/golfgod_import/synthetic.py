@@ -0,0 +1,199 @@
+"""
+Synthetic golf datasets for offline benchmarks.
+
+Writes files in the same formats the importers read: the schedule JSON,
+the bios and photos CSVs, a directory of per-player result files, and the
+round-level stats CSV for those results. Sizes scale linearly from a 1x
+base that roughly matches the real sources (twelve seasons of schedules, a
+couple of hundred players). Output is deterministic
+for a given scale and seed, and the same ESPN IDs are used across every
+dataset so results, photos and bios join up the way real data does. A few
+rows carry the messy values the real scrapes have (missing IDs, "n/a",
+ragged birthdates, unranked players) so normalization is exercised too.
+"""
+
+import csv
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from .rounds import COLUMNS as ROUND_COLUMNS, synthetic_round_row
+
+SEASONS = tuple(range(2015, 2027))
+TOURNAMENTS_PER_SEASON = 45
+PLAYERS = 200
+EVENTS_PER_PLAYER = 22
+FIRST_ESPN_ID = 100_000
+
+_FIRST = ("Scottie", "Rory", "Jon", "Xander", "Collin", "Viktor", "Patrick", "Justin", "Tony", "Hideki",
+          "Ludvig", "Wyndham", "Max", "Sahith", "Tommy", "Sungjae", "Keegan", "Russell", "Cameron", "Brian")
+_LAST = ("Scheffler", "McIlroy", "Rahm", "Schauffele", "Morikawa", "Hovland", "Cantlay", "Thomas", "Finau",
+         "Matsuyama", "Aberg", "Clark", "Homa", "Theegala", "Fleetwood", "Im", "Bradley", "Henley", "Young", "Harman")
+_PLACES = ("Pebble Beach", "Riviera", "Sawgrass", "Augusta", "Muirfield", "Torrey Pines", "Bay Hill",
+           "Harbour Town", "Colonial", "Quail Hollow", "Memorial Park", "Kapalua", "Sedgefield", "TPC Boston")
+_KINDS = ("Open", "Classic", "Championship", "Invitational", "Pro-Am", "Challenge")
+_COUNTRIES = ("United States", "England", "Northern Ireland", "Spain", "Japan", "Norway", "Sweden", "Korea")
+_COLLEGES = ("Texas", "Oklahoma State", "Vanderbilt", "Arizona State", "Cal", "Georgia Tech", "")
+
+
+def players(scale: int) -> Iterator[Tuple[str, str, str]]:
+    """(espnId, first, last) for every synthetic player; names are unique"""
+    for n in range(PLAYERS * scale):
+        first, last = _FIRST[n % len(_FIRST)], _LAST[n // len(_FIRST) % len(_LAST)]
+        round_num = n // (len(_FIRST) * len(_LAST))
+        yield str(FIRST_ESPN_ID + n), first, f"{last}{round_num + 1}" if round_num else last
+
+
+def tournaments(scale: int, seed: int = 7) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(seed)
+    roster = list(players(scale))
+    per_season = TOURNAMENTS_PER_SEASON * scale
+    for year in SEASONS:
+        for i in range(per_season):
+            espn_id, first, last = rng.choice(roster)
+            completed = year < SEASONS[-1] or i < per_season // 3
+            month, day = 1 + i * 12 // per_season, 1 + rng.randrange(25)
+            tournament = {
+                "tournament_id": f"{year}_synthetic_{i:06d}",
+                "name": f"{rng.choice(_PLACES)} {rng.choice(_KINDS)} {i}",
+                "year": year,
+                "dates_raw": f"{month}/{day} - {month}/{day + 3}",
+                "start_date": f"{year}-{month:02d}-{day:02d}",
+                "end_date": f"{year}-{month:02d}-{day + 3:02d}",
+                "status": "completed" if completed else "scheduled",
+                "prize_money": rng.randrange(2, 40) * 500_000,
+                "scraped_at": f"{SEASONS[-1]}-01-01T00:00:00Z",
+            }
+            winner = {"name": f"{first} {last}", "espn_id": int(espn_id),
+                      "profile_url": f"https://www.espn.com/golf/player/_/id/{espn_id}"}
+            prefix = "winner" if completed else "previous_winner"
+            for field, value in winner.items():
+                tournament[f"{prefix}_{field}"] = value
+            if completed:
+                tournament["winning_score"] = f"-{rng.randrange(5, 25)}"
+            yield tournament
+
+
+def write_schedule(path: Path, scale: int, seed: int = 7) -> int:
+    rows = list(tournaments(scale, seed))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"scraped_at": f"{SEASONS[-1]}-01-01T00:00:00Z", "tournaments": rows}, f)
+    return len(rows)
+
+
+def write_bios(path: Path, scale: int, seed: int = 7) -> int:
+    rng = random.Random(seed + 1)
+    columns = ["player_id", "player_name", "country", "birthdate", "birthplace", "college",
+               "height", "weight", "turned_pro", "swing"]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for n, (espn_id, first, last) in enumerate(players(scale)):
+            year = rng.randrange(1960, 2003)
+            writer.writerow([
+                "" if n % 97 == 13 else espn_id,  # Occasional row the importer must skip
+                f" {first} {last} ",
+                rng.choice(_COUNTRIES),
+                "" if n % 11 == 0 else f"{rng.randrange(1, 13)}/{rng.randrange(1, 29)}/{year} ({2026 - year})",
+                f"City {n % 50}, ST",
+                rng.choice(_COLLEGES),
+                f"{rng.randrange(5, 7)}' {rng.randrange(0, 12)}\"",
+                f"{rng.randrange(140, 230)} lbs",
+                "n/a" if n % 17 == 0 else str(year + rng.randrange(18, 24)),
+                rng.choice(("Right", "Right", "Right", "Left", "")),
+            ])
+    return n + 1
+
+
+def write_photos(path: Path, scale: int, seed: int = 7) -> int:
+    rng = random.Random(seed + 2)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["player_name", "player_id", "photo_url", "world_rank", "photo_exists"])
+        for n, (espn_id, first, last) in enumerate(players(scale)):
+            writer.writerow([
+                f"{first} {last}",
+                espn_id,
+                f"https://a.espncdn.com/i/headshots/golf/players/full/{espn_id}.png",
+                "" if n % 9 == 0 else n + 1,
+                "false" if rng.random() < 0.1 else "true",
+            ])
+    return n + 1
+
+
+def player_events(scale: int, seed: int = 7) -> Iterator[Tuple[str, str, str, List[Dict[str, Any]]]]:
+    """(espnId, first, last, tournament entries) for every player, as the result files hold them"""
+    rng = random.Random(seed + 3)
+    for espn_id, first, last in players(scale):
+        events = []
+        for i in range(EVENTS_PER_PLAYER):
+            year = SEASONS[i % (len(SEASONS) - 1)]
+            scores = [rng.randrange(63, 78) for _ in range(4 if rng.random() < 0.7 else 2)]
+            events.append({
+                "tournament": f"{_PLACES[i % len(_PLACES)]} {_KINDS[i % len(_KINDS)]}",
+                "course": f"{_PLACES[i % len(_PLACES)]} Golf Club (Par 72)",
+                "year": year,
+                "date": f"{1 + i % 12}/{1 + i % 28}",
+                "scores": scores,
+                "position": str(rng.randrange(1, 70)) if len(scores) == 4 else "CUT",
+                "overall_score": sum(scores),
+                "to_par": sum(scores) - 72 * len(scores),
+                "earnings": rng.randrange(0, 2_000_000) if len(scores) == 4 else 0,
+            })
+        yield espn_id, first, last, events
+
+
+def write_results(directory: Path, scale: int, seed: int = 7) -> int:
+    """One {espnId}_{First}_{Last}.json per player; returns the file count"""
+    directory.mkdir(parents=True, exist_ok=True)
+    files = 0
+    for espn_id, first, last, events in player_events(scale, seed):
+        with open(directory / f"{espn_id}_{first}_{last}.json", "w", encoding="utf-8") as f:
+            json.dump({"player_id": espn_id, "player_name": f"{first} {last}", "tournaments": events}, f)
+        files += 1
+    return files
+
+
+def write_rounds(path: Path, scale: int, seed: int = 7) -> int:
+    """One row per round of the result files' tournaments; returns the row count"""
+    rows = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(ROUND_COLUMNS)
+        for espn_id, _, _, events in player_events(scale, seed):
+            for event in events:
+                for round_num, score in enumerate(event["scores"], start=1):
+                    rows += 1
+                    writer.writerow(synthetic_round_row(espn_id, event["year"], event["tournament"],
+                                                        round_num, score, rows))
+    return rows
+
+
+def generate(root: Path, scale: int, seed: int = 7) -> Dict[str, Any]:
+    """Write every dataset under root (reusing a complete earlier run); returns paths and counts"""
+    root.mkdir(parents=True, exist_ok=True)
+    marker = root / "dataset.json"
+    if marker.exists():
+        manifest = json.loads(marker.read_text())
+        if manifest.get("scale") == scale and manifest.get("seed") == seed and "rounds_file" in manifest:
+            return manifest
+
+    manifest = {
+        "scale": scale,
+        "seed": seed,
+        "schedule_file": str(root / "schedule.json"),
+        "bios_file": str(root / "bios.csv"),
+        "photos_file": str(root / "photos.csv"),
+        "results_dir": str(root / "results"),
+        "rounds_file": str(root / "rounds.csv"),
+    }
+    manifest["records"] = {
+        "tournaments": write_schedule(Path(manifest["schedule_file"]), scale, seed),
+        "bios": write_bios(Path(manifest["bios_file"]), scale, seed),
+        "photos": write_photos(Path(manifest["photos_file"]), scale, seed),
+        "results": write_results(Path(manifest["results_dir"]), scale, seed),
+        "rounds": write_rounds(Path(manifest["rounds_file"]), scale, seed),
+    }
+    marker.write_text(json.dumps(manifest, indent=2))
+    return manifest
@@ -0,0 +1,200 @@
+"""
+Import PGA Tour schedules into the pgaTournaments table
+"""
+
+import os
+from typing import Any
+
+from .batching import batch_sizer
+from .cache import ParseCache
+from .checkpoint import CheckpointJournal
+from .dispatcher import BatchDispatcher
+from .maintenance import clear
+from .manifest import ChangeManifest
+from .rejects import RejectFile
+from .runtime import ImportRuntime
+from .streaming import filter_years, iter_tournaments
+from .summaries import seed_year_summaries
+
+SCHEDULE_FILE = "/Users/tjmcgovern/golfgod_x_convex/pga_tour_schedules_playwright_2015_2026.json"
+BATCH_SIZE = 200  # Existing rows are resolved in one parallel lookup pass per batch
+CACHE_KIND = "tournaments:1"  # Bump when clean_tournament output changes
+
+# Per-row action codes returned by tournaments:upsertTournamentsBulk
+INSERTED, UPDATED, UNCHANGED, DUPLICATE, ERROR = range(5)
+
+
+def run(client: ImportRuntime, args: Any) -> int:
+    """Import the schedule file; returns a process exit code"""
+    json_file = args.schedule_file or SCHEDULE_FILE
+
+    if not os.path.exists(json_file):
+        print(f"Error: JSON file not found at {json_file}")
+        return 1
+
+    print(f"Streaming JSON file: {json_file}")
+    profiler = client.profiler
+
+    if args.clear and not args.resume:
+        profiler.phase("clear")
+        try:
+            print("Clearing existing tournament data...")
+            result = clear(client, ["tournaments"], concurrency=args.concurrency)
+            print(f"Deleted {result['pgaTournaments']['deleted']} existing tournaments")
+            args.full = True
+        except Exception as e:
+            print(f"Error clearing tournaments: {e}")
+
+    # Only send tournaments that are new or changed since the last run.
+    # The file is streamed rather than loaded as one document; an unchanged
+    # file is replayed from the parse cache without parsing it at all.
+    manifest = ChangeManifest("tournaments", "tournament_id")
+    cache = ParseCache(enabled=not args.no_cache)
+    to_send = (
+        t for t in filter_years(cache.stream(CACHE_KIND, json_file, iter_tournaments), args.years)
+        if manifest.classify(t) != "unchanged" or args.full
+    )
+
+    # Import in batches to avoid timeout
+    total_stats = {
+        'total_imported': 0,
+        'total_updated': 0,
+        'total_unchanged': 0,
+        'total_errors': []
+    }
+
+    total_sent = 0
+    mutation_name = "tournaments:upsertTournamentsBulk"
+    sizer = batch_sizer(mutation_name, args.batch_size, BATCH_SIZE)
+    rejects = RejectFile("tournaments", resume=args.resume)
+    dispatcher = BatchDispatcher(
+        client, mutation_name, "tournaments", concurrency=args.concurrency, sizer=sizer, rejects=rejects
+    )
+
+    # Records delivered before an interrupted run are skipped on --resume
+    journal = CheckpointJournal("tournaments", resume=args.resume)
+    # The file is parsed lazily as batches are pulled, so parsing is part of "send"
+    profiler.phase("send")
+    batches = sizer.batches(journal.pending(mutation_name, to_send, on_skip=manifest.mark_sent))
+
+    try:
+        for batch_num, batch, result in dispatcher.dispatch(batches):
+            print(f"\nBatch {batch_num} ({len(batch)} tournaments)...")
+            total_sent += len(batch)
+
+            if isinstance(result, Exception):
+                journal.record(mutation_name, batch_num, batch, result)
+                print(f"Error calling Convex mutation: {result}")
+                result = {"inserted": 0, "updated": 0, "unchanged": 0, "errors": [str(result)]}
+            else:
+                # Rows that failed server-side stay unsent so the next run retries them
+                failed = [t for t, action in zip(batch, result["actions"]) if action == ERROR]
+                journal.record(mutation_name, batch_num, batch, result, failed)
+                manifest.mark_sent([t for t, action in zip(batch, result["actions"]) if action != ERROR])
+
+            # Update statistics
+            total_stats['total_imported'] += result.get('inserted', 0)
+            total_stats['total_updated'] += result.get('updated', 0)
+            total_stats['total_unchanged'] += result.get('unchanged', 0)
+            if result.get('errors'):
+                total_stats['total_errors'].extend(result['errors'])
+
+            print(f"  Imported: {result.get('inserted', 0)}")
+            print(f"  Updated: {result.get('updated', 0)}")
+            if result.get('unchanged'):
+                print(f"  Unchanged (no write): {result['unchanged']}")
+
+            if result.get('errors'):
+                for error in result['errors'][:3]:  # Show first 3 errors
+                    print(f"  Error: {error}")
+    except KeyboardInterrupt:
+        manifest.save()
+        rejects.close()
+        journal.print_summary()
+        print("\n❌ Import interrupted. Run again with --resume to continue.")
+        return 130
+
+    print()
+    dispatcher.stats.print_summary("upsertTournamentsBulk")
+    sizer.print_summary()
+    sizer.save()
+    journal.print_summary()
+    journal.close()
+    rejects.print_summary()
+    rejects.close()
+    cache.print_summary("tournaments")
+    cache.close()
+    manifest.print_summary()
+
+    # A year-filtered run never sees the other years, so nothing counts as removed
+    removed = [] if args.years else manifest.deleted_keys()
+    if removed and args.tombstones:
+        profiler.phase("tombstones")
+        try:
+            result = client.mutation("tournaments:deleteTournaments", {"tournament_ids": removed})
+            manifest.forget(removed)
+            print(f"Deleted {result.get('deleted', 0)} tournaments no longer in the source file")
+        except Exception as e:
+            print(f"Error deleting removed tournaments: {e}")
+    elif removed:
+        print(f"{len(removed)} tournaments are no longer in the source file (pass --tombstones to delete)")
+
+    manifest.save()
+
+    # Print final summary
+    print("\n" + "="*50)
+    print("IMPORT SUMMARY")
+    print("="*50)
+    print(f"Total tournaments in file: {sum(manifest.counts.values())}")
+    print(f"Tournaments sent: {total_sent}")
+    print(f"New tournaments imported: {total_stats['total_imported']}")
+    print(f"Existing tournaments updated: {total_stats['total_updated']}")
+    print(f"Unchanged (writes skipped): {total_stats['total_unchanged']}")
+    print(f"Errors encountered: {len(total_stats['total_errors'])}")
+
+    if total_stats['total_errors']:
+        print("\nFirst 10 errors:")
+        for error in total_stats['total_errors'][:10]:
+            print(f"  - {error}")
+
+    if args.fix_2026:
+        # Set 2026 status and move winner fields to previous_winner_*
+        profiler.phase("fix2026")
+        print("\nRunning fix2026TournamentData mutation...")
+        try:
+            response = client.mutation("tournaments:fix2026TournamentData", {})
+            print(f"Fixed {response.get('updated', 0)} tournaments")
+            if response.get('errors'):
+                print(f"Errors: {response['errors']}")
+        except Exception as e:
+            print(f"Error running fix mutation: {e}")
+
+    # Show some statistics
+    profiler.phase("statistics")
+    print("\nAnalyzing imported data...")
+    try:
+        # Years imported before yearSummaries existed have no row yet
+        seed_year_summaries(client)
+
+        # Get year summaries
+        summaries = client.query("tournaments:getYearSummaries", {})
+
+        print("\nTournaments by Year:")
+        for summary in summaries[:5]:  # Show first 5 years
+            print(f"  {summary['year']}: {summary['totalTournaments']} tournaments, "
+                  f"{summary['completedTournaments']} completed, "
+                  f"${summary['totalPrizeMoney'] / 1000000:.1f}M prize money")
+
+        # Get recent tournaments
+        recent = client.query("tournaments:getRecentTournaments", {})
+        print(f"\nMost recent completed tournaments:")
+        for t in recent[:5]:
+            winner_info = f"{t.get('winner_name', 'TBD')}" if t.get('winner_name') else "TBD"
+            print(f"  {t['year']} {t['name']}: Winner - {winner_info}")
+
+    except Exception as e:
+        print(f"Could not fetch statistics: {e}")
+
+    print("\n✅ Tournament import completed!")
+    print("You can now view the tournaments in your web application.")
+    return 0
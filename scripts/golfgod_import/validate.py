@@ -0,0 +1,320 @@
+"""
+Check every row of the database for integrity problems, in parallel shards.
+
+    golfgod-import validate [table ...] [--shards 8] [--cleanup]
+
+dataManagement:validateDatabase only looks at the first few hundred rows of
+each table. This command covers all of them: each table's creation-time
+range (dataManagement:getTableTimeRange) is split into --shards slices, and
+every slice is paged through dataManagement:validateTablePage on its own
+cursor, up to --concurrency slices at once. The server checks each page's
+references (one read per distinct ID) and returns compact facts; the pages
+are merged here into one report:
+
+    players            duplicate names and ESPN IDs, players without results
+                       or with incomplete identity (no ESPN ID, country Unknown)
+    rankings           missing or shared top-10 world ranks, who is #1
+    tournamentResults  rows, with earnings, with scores, orphaned
+    playerStats, userFollows, playerCourseStats, roundStats
+                       rows and orphans per missing reference
+
+The report is printed and written as JSON under .import_state/validation
+(or --report). --cleanup then deletes the orphaned rows through
+dataManagement:deleteOrphanRows, which checks each row again first. The exit
+code is 1 when any issue was found.
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from .config import state_path
+from .dispatcher import is_rate_limited
+from .resolver import normalize_name
+
+PAGE_FUNCTION = "dataManagement:validateTablePage"
+RANGE_FUNCTION = "dataManagement:getTableTimeRange"
+DELETE_FUNCTION = "dataManagement:deleteOrphanRows"
+TABLES = ("players", "tournamentResults", "playerStats", "userFollows", "playerCourseStats", "roundStats")
+PAGE_SIZE = 1000  # MAX_VALIDATE_BATCH in convex/dataManagement.ts
+DELETE_BATCH = 500  # MAX_ORPHAN_DELETE in convex/dataManagement.ts
+MAX_RETRIES = 6
+PROGRESS_INTERVAL = 5.0  # Seconds between progress lines
+TOP_RANKS = 10
+SHOWN = 5  # Examples listed per issue
+
+Shard = Tuple[str, Optional[float], Optional[float]]
+
+
+def _call(client: Any, kind: str, name: str, args: Dict[str, Any]) -> Any:
+    call = client.query if kind == "query" else client.mutation
+    attempt = 0
+    while True:
+        try:
+            return call(name, args)
+        except Exception as e:
+            if not is_rate_limited(e) or attempt >= MAX_RETRIES:
+                raise
+            time.sleep(min(30.0, 0.5 * 2 ** attempt))
+            attempt += 1
+            client.profiler.record_retry(name)
+
+
+def split_range(first: Optional[float], last: Optional[float], count: int) -> List[Tuple[Optional[float], Optional[float]]]:
+    """[from, to) creation-time bounds of `count` equal slices; the outer ends are open"""
+    if first is None:
+        return []
+    if count <= 1 or last is None or last <= first:
+        return [(None, None)]
+    step = (last - first) / count
+    edges: List[Optional[float]] = [None, *(first + step * i for i in range(1, count)), None]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def plan_shards(client: Any, tables: Sequence[str], shards: int) -> List[Shard]:
+    """Every (table, from, to) slice to page; empty tables have none"""
+    plan: List[Shard] = []
+    for table in tables:
+        bounds = _call(client, "query", RANGE_FUNCTION, {"table": table})
+        plan.extend((table, lo, hi) for lo, hi in split_range(bounds["first"], bounds["last"], shards))
+    return plan
+
+
+class Findings:
+    """Page facts merged across every shard; safe to add to from several threads"""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.players: List[Dict[str, Any]] = []
+        self.referenced: Set[str] = set()
+        self.orphans: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.calls = 0
+        self.last_report = time.perf_counter()
+
+    def add(self, page: Dict[str, Any]) -> None:
+        table = page["table"]
+        with self.lock:
+            self.calls += 1
+            for key, value in page["counts"].items():
+                self.counts[table][key] += value
+            self.players.extend(page["players"])
+            self.referenced.update(page["referencedPlayers"])
+            self.orphans[table].extend(page["orphans"])
+
+    def rows(self) -> int:
+        return sum(counts["rows"] for counts in self.counts.values())
+
+    def progress_due(self) -> bool:
+        with self.lock:
+            now = time.perf_counter()
+            if now - self.last_report < PROGRESS_INTERVAL:
+                return False
+            self.last_report = now
+            return True
+
+
+def check_shard(client: Any, shard: Shard, findings: Findings, start: float) -> int:
+    """Page through one slice; returns the rows it held"""
+    table, lo, hi = shard
+    args: Dict[str, Any] = {"table": table, "batchSize": PAGE_SIZE}
+    if lo is not None:
+        args["from"] = lo
+    if hi is not None:
+        args["to"] = hi
+    cursor = None
+    rows = 0
+    while True:
+        page = _call(client, "query", PAGE_FUNCTION, dict(args, cursor=cursor))
+        findings.add(page)
+        rows += page["counts"]["rows"]
+        if findings.progress_due():
+            total = findings.rows()
+            print(f"  {total} rows checked ({_rate(total, time.perf_counter() - start)})", flush=True)
+        if not page["hasMore"]:
+            return rows
+        cursor = page["cursor"]
+
+
+def _rate(rows: int, seconds: float) -> str:
+    return f"{rows / seconds:.0f} rows/sec" if seconds > 0 else "-"
+
+
+def _groups(players: Sequence[Dict[str, Any]], key: Any) -> List[Dict[str, Any]]:
+    """Players sharing a non-empty key, largest groups first"""
+    by_key: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for player in players:
+        value = key(player)
+        if value:
+            by_key[value].append(player)
+    groups = [
+        {"key": value, "names": sorted({p["name"].strip() for p in group}), "ids": [p["_id"] for p in group]}
+        for value, group in by_key.items() if len(group) > 1
+    ]
+    return sorted(groups, key=lambda group: (-len(group["ids"]), group["key"]))
+
+
+def build_report(findings: Findings, tables: Sequence[str]) -> Dict[str, Any]:
+    """The merged integrity report; `issues` lists every problem found"""
+    report: Dict[str, Any] = {"tables": {}, "issues": []}
+    issues = report["issues"]
+
+    if "players" in tables:
+        players = findings.players
+        ranked = [p for p in players if p["worldRanking"]]
+        holders: Dict[int, List[str]] = defaultdict(list)
+        for p in ranked:
+            if p["worldRanking"] <= TOP_RANKS:
+                holders[p["worldRanking"]].append(p["name"])
+        number1 = holders.get(1, [None])[0]
+        without_results = None
+        if "tournamentResults" in tables:
+            without_results = [p["_id"] for p in players if p["_id"] not in findings.referenced]
+        report["players"] = {
+            "total": len(players),
+            "withRankings": len(ranked),
+            "withoutEspnId": sum(1 for p in players if not p["espnId"]),
+            "unknownCountry": sum(1 for p in players if p["country"] == "Unknown"),
+            "withoutResults": None if without_results is None else len(without_results),
+            "duplicateNames": _groups(players, lambda p: normalize_name(p["name"] or "")),
+            "duplicateEspnIds": _groups(players, lambda p: p["espnId"]),
+        }
+        missing = [rank for rank in range(1, TOP_RANKS + 1) if rank not in holders]
+        shared = {rank: names for rank, names in sorted(holders.items()) if len(names) > 1}
+        report["topRankings"] = {
+            "hasNumber1": number1 is not None,
+            "number1": number1,
+            "top10Complete": not missing,
+            "missingRanks": missing,
+            "sharedRanks": shared,
+        }
+
+        if number1 is None:
+            issues.append("No player with world ranking #1")
+        elif "scheffler" not in number1.lower():
+            issues.append(f"World #1 is {number1}, not Scottie Scheffler")
+        if missing:
+            issues.append(f"Missing world rankings: {', '.join(map(str, missing))}")
+        for rank, names in shared.items():
+            issues.append(f"World ranking {rank} held by {len(names)} players: {', '.join(names[:SHOWN])}")
+        duplicates = report["players"]["duplicateNames"]
+        if duplicates:
+            examples = ", ".join(group["names"][0] for group in duplicates[:SHOWN])
+            issues.append(f"{len(duplicates)} duplicate player names: {examples}")
+        if report["players"]["duplicateEspnIds"]:
+            issues.append(f"{len(report['players']['duplicateEspnIds'])} ESPN IDs shared by several players")
+
+    for table in tables:
+        if table == "players":
+            continue
+        orphans = findings.orphans.get(table, [])
+        by_field: Dict[str, int] = defaultdict(int)
+        for row in orphans:
+            for field in row["missing"]:
+                by_field[field] += 1
+        entry = dict(findings.counts.get(table, {"rows": 0}))
+        entry.update(orphaned=len(orphans), missing=dict(by_field))
+        report["tables"][table] = entry
+        if orphans:
+            detail = ", ".join(f"{count} missing {field}" for field, count in sorted(by_field.items()))
+            issues.append(f"{len(orphans)} orphaned {table} ({detail})")
+    return report
+
+
+def validate(
+    client: Any,
+    tables: Sequence[str] = TABLES,
+    shards: int = 4,
+    concurrency: int = 4
+) -> Tuple[Findings, Dict[str, Any]]:
+    """Check every row of the tables; returns the merged findings and the report"""
+    client.profiler.phase("plan")
+    plan = plan_shards(client, tables, shards)
+    print(f"{len(plan)} shards across {len(tables)} tables, {concurrency} at a time")
+
+    findings = Findings()
+    start = time.perf_counter()
+    client.profiler.phase("check")
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = [pool.submit(check_shard, client, shard, findings, start) for shard in plan]
+        for future in futures:
+            future.result()
+    return findings, build_report(findings, tables)
+
+
+def delete_orphans(client: Any, findings: Findings, concurrency: int = 4) -> Dict[str, int]:
+    """Delete the orphaned rows found, in bounded batches; returns rows deleted per table"""
+    batches = [
+        (table, [row["_id"] for row in rows[i:i + DELETE_BATCH]])
+        for table, rows in findings.orphans.items()
+        for i in range(0, len(rows), DELETE_BATCH)
+    ]
+    deleted: Dict[str, int] = defaultdict(int)
+    client.profiler.phase("cleanup")
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = [(table, pool.submit(_call, client, "mutation", DELETE_FUNCTION, {"table": table, "ids": ids}))
+                   for table, ids in batches]
+        for table, future in futures:
+            deleted[table] += future.result()["deleted"]
+    return dict(deleted)
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    players = report.get("players")
+    if players:
+        without = players["withoutResults"]
+        print(f"  players: {players['total']} ({players['withRankings']} ranked, "
+              f"{players['withoutEspnId']} without ESPN ID, {players['unknownCountry']} country Unknown"
+              + (f", {without} without results" if without is not None else "") + ")")
+        ranks = report["topRankings"]
+        print(f"  top {TOP_RANKS}: #1 {ranks['number1'] or '-'}, "
+              + ("complete" if ranks["top10Complete"] else f"missing {ranks['missingRanks']}"))
+    for table, entry in report["tables"].items():
+        extra = "".join(f", {entry[key]} {label}" for key, label in
+                        (("withEarnings", "with earnings"), ("withScores", "with scores")) if key in entry)
+        print(f"  {table}: {entry['rows']} rows{extra}, {entry['orphaned']} orphaned")
+
+
+def run(client: Any, args: Any) -> int:
+    """Validate the requested tables; returns a process exit code"""
+    tables = args.tables or list(TABLES)
+    unknown = [table for table in tables if table not in TABLES]
+    if unknown:
+        print(f"Unknown tables: {', '.join(unknown)}")
+        print(f"Choose from: {', '.join(TABLES)}")
+        return 2
+
+    print(f"=== Validate: {', '.join(tables)} ===")
+    start = time.perf_counter()
+    try:
+        findings, report = validate(client, tables, args.shards or args.concurrency, args.concurrency)
+    except Exception as e:
+        print(f"\n❌ Validation failed: {e}")
+        return 1
+    seconds = time.perf_counter() - start
+    rows = findings.rows()
+    report["checked"] = {"rows": rows, "calls": findings.calls, "seconds": round(seconds, 3)}
+
+    print(f"\nChecked {rows} rows in {findings.calls} pages in {seconds:.1f}s ({_rate(rows, seconds)})")
+    print_report(report)
+
+    if args.cleanup and any(findings.orphans.values()):
+        deleted = delete_orphans(client, findings, args.concurrency)
+        report["cleanup"] = deleted
+        print("\nDeleted orphans: " + ", ".join(f"{count} {table}" for table, count in deleted.items()))
+
+    path = Path(args.report) if args.report else state_path("validation", "report.json")
+    path.write_text(json.dumps(report, indent=2))
+    print(f"Report written to {path}")
+
+    if report["issues"]:
+        print(f"\n⚠️  {len(report['issues'])} issues:")
+        for issue in report["issues"]:
+            print(f"  - {issue}")
+        return 1
+    print("\n✅ No integrity issues found")
+    return 0
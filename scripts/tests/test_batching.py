@@ -0,0 +1,70 @@
+from golfgod_import.batching import BatchSizer, batch_sizer, load_sizes, payload_bytes
+
+
+def observe_window(sizer, latencies):
+    for seconds in latencies:
+        sizer.observe(sizer.size, seconds)
+
+
+def test_grows_while_p95_stays_well_under_target():
+    sizer = BatchSizer("test:import", 100, window=4, target_p95=1.0)
+    observe_window(sizer, [0.2, 0.3, 0.2, 0.5])
+    assert sizer.size == 150
+    observe_window(sizer, [0.2] * 4)
+    assert sizer.size == 225
+    assert sizer.history == [100, 150, 225]
+
+
+def test_one_slow_batch_in_the_window_halves_the_size():
+    # Mean latency is fine; p95 is what counts
+    sizer = BatchSizer("test:import", 100, window=6, target_p95=1.0)
+    observe_window(sizer, [0.1, 0.1, 0.1, 0.1, 0.1, 1.5])
+    assert sizer.size == 50
+
+
+def test_holds_between_the_grow_and_shrink_thresholds():
+    sizer = BatchSizer("test:import", 100, window=3, target_p95=1.0)
+    observe_window(sizer, [0.7, 0.8, 0.9])
+    assert sizer.size == 100
+    assert sizer.recent == []  # The next decision uses a fresh window
+
+
+def test_small_batches_do_not_count_toward_the_window():
+    sizer = BatchSizer("test:import", 100, window=2, target_p95=1.0)
+    for _ in range(5):
+        sizer.observe(10, 5.0)  # A trailing or byte-capped batch
+    assert sizer.size == 100
+    assert sizer.recent == []
+
+
+def test_capacity_errors_halve_and_rate_limits_do_not():
+    sizer = BatchSizer("test:import", 100, min_size=30)
+    sizer.observe(100, 1.0, RuntimeError("429 Too Many Requests"))
+    assert sizer.size == 100
+    sizer.observe(100, 1.0, RuntimeError("Function execution timed out"))
+    assert sizer.size == 50
+    sizer.observe(50, 1.0, RuntimeError("Function execution timed out"))
+    assert sizer.size == 30
+
+
+def test_fixed_size_never_changes():
+    sizer = batch_sizer("test:import", 100, 50, window=1)
+    sizer.observe(100, 0.01)
+    sizer.observe(100, 9.0, RuntimeError("Function execution timed out"))
+    assert sizer.size == 100
+
+
+def test_batches_close_at_the_byte_limit():
+    record = {"name": "x" * 100}
+    sizer = BatchSizer("test:import", 10, adaptive=False, max_bytes=payload_bytes(record) * 3)
+    sizes = [len(batch) for batch in sizer.batches([record] * 10)]
+    assert sizes == [3, 3, 3, 1]
+    assert sizer.byte_capped == 3
+
+
+def test_converged_size_is_the_next_runs_starting_point():
+    sizer = batch_sizer("test:import", None, 100, window=1)
+    sizer.observe(100, 5.0)
+    sizer.save()
+    assert load_sizes() == {"test:import": 50}
+    assert batch_sizer("test:import", None, 100).size == 50
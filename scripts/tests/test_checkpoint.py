@@ -0,0 +1,58 @@
+from golfgod_import.checkpoint import CheckpointJournal, batch_key
+
+NAME = "playerBios:updatePlayerBiosById"
+
+
+def players(*ids):
+    return [{"playerId": f"players:{i}", "college": f"College {i}"} for i in ids]
+
+
+def interrupted_run():
+    """Batch 1 delivered, batch 2 with one failed record, batch 3 raised, batch 4 never sent"""
+    journal = CheckpointJournal("bios")
+    journal.record(NAME, 1, players(1, 2), {"updated": 2})
+    journal.record(NAME, 2, players(3, 4), {"updated": 1, "failed": ["players:4"]}, players(4))
+    journal.record(NAME, 3, players(5, 6), RuntimeError("Function execution timed out"))
+    assert journal.counts() == {"done": 1, "partial": 1, "failed": 1}
+    journal.close()
+
+
+def test_resume_skips_only_delivered_records():
+    interrupted_run()
+
+    skipped = []
+    journal = CheckpointJournal("bios", resume=True)
+    pending = list(journal.pending(NAME, players(1, 2, 3, 4, 5, 6, 7), on_skip=skipped.extend))
+    assert [p["playerId"] for p in pending] == ["players:4", "players:5", "players:6", "players:7"]
+    assert [p["playerId"] for p in skipped] == ["players:1", "players:2", "players:3"]
+    assert journal.skipped == 3
+    journal.close()
+
+
+def test_resume_matches_records_not_batches():
+    interrupted_run()
+
+    # Batch sizes changed between runs; records 1-3 are still recognised
+    journal = CheckpointJournal("bios", resume=True)
+    assert not journal.is_done(batch_key(NAME, players(1, 2, 3)))
+    assert journal.is_done(batch_key(NAME, players(1, 2)))
+    pending = list(journal.pending(NAME, players(3, 2, 1)))
+    assert pending == []
+    journal.close()
+
+
+def test_resume_is_per_function():
+    interrupted_run()
+
+    journal = CheckpointJournal("bios", resume=True)
+    assert len(list(journal.pending("playerBios:updatePlayerBiosBatch", players(1, 2)))) == 2
+    journal.close()
+
+
+def test_a_fresh_run_forgets_the_previous_journal():
+    interrupted_run()
+
+    journal = CheckpointJournal("bios")
+    assert journal.counts() == {}
+    assert len(list(journal.pending(NAME, players(1, 2)))) == 2
+    journal.close()
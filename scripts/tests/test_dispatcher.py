@@ -0,0 +1,90 @@
+import json
+
+from golfgod_import.dispatcher import BatchDispatcher
+from golfgod_import.rejects import RejectFile
+
+
+class FakeRuntime:
+    """Refuses any batch holding a record marked bad; throttles while `throttle` > 0"""
+
+    profiler = None
+
+    def __init__(self, throttle: int = 0):
+        self.throttle = throttle
+        self.sent = []
+
+    def mutation(self, name, args):
+        batch = args["records"]
+        if self.throttle:
+            self.throttle -= 1
+            raise RuntimeError("429 Too Many Requests: rate limit exceeded")
+        if any(record.get("bad") for record in batch):
+            raise ValueError("ArgumentValidationError: bad record")
+        self.sent.append(batch)
+        return {"inserted": len(batch)}
+
+
+def records(n, bad=()):
+    return [dict({"n": i}, bad=True) if i in bad else {"n": i} for i in range(n)]
+
+
+def test_bisection_isolates_the_bad_record_and_delivers_the_rest(state_dir):
+    runtime = FakeRuntime()
+    with RejectFile("test") as rejects:
+        dispatcher = BatchDispatcher(runtime, "test:import", "records", concurrency=1, rejects=rejects)
+        outcomes = list(dispatcher.dispatch([records(8, bad={5})]))
+
+    failed = [(batch, result) for _, batch, result in outcomes if isinstance(result, Exception)]
+    assert failed == [([{"n": 5, "bad": True}], failed[0][1])]
+    delivered = sorted(r["n"] for batch in runtime.sent for r in batch)
+    assert delivered == [0, 1, 2, 3, 4, 6, 7]
+    # Every piece comes back under the original batch number
+    assert {batch_num for batch_num, _, _ in outcomes} == {1}
+    # 8 → 4 + 4 → 2 + 2 → 1 + 1: two extra calls per level
+    summary = dispatcher.stats.summary()
+    assert summary["bisectCalls"] == 6
+    assert summary["rejected"] == 1
+    assert summary["failed"] == 1
+
+    lines = (state_dir / "rejects" / "test.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    reject = json.loads(lines[0])
+    assert reject["function"] == "test:import"
+    assert reject["record"] == {"n": 5, "bad": True}
+    assert "bad record" in reject["error"]
+
+
+def test_without_a_reject_file_a_failed_batch_is_returned_whole():
+    runtime = FakeRuntime()
+    dispatcher = BatchDispatcher(runtime, "test:import", "records", concurrency=1)
+    outcomes = list(dispatcher.dispatch([records(4, bad={0})]))
+    assert len(outcomes) == 1
+    assert len(outcomes[0][1]) == 4
+    assert isinstance(outcomes[0][2], ValueError)
+    assert dispatcher.stats.summary()["bisectCalls"] == 0
+
+
+def test_rate_limits_are_retried_not_bisected(state_dir):
+    runtime = FakeRuntime(throttle=2)
+    with RejectFile("test") as rejects:
+        dispatcher = BatchDispatcher(runtime, "test:import", "records", concurrency=1, base_backoff=0.001,
+                                     rejects=rejects)
+        outcomes = list(dispatcher.dispatch([records(4)]))
+
+    assert [result for _, _, result in outcomes] == [{"inserted": 4}]
+    assert dispatcher.stats.summary()["retries"] == 2
+    assert dispatcher.stats.summary()["bisectCalls"] == 0
+    assert rejects.count == 0
+
+
+def test_resume_appends_to_the_reject_file_and_a_fresh_run_starts_over(state_dir):
+    path = state_dir / "rejects" / "test.jsonl"
+    with RejectFile("test") as rejects:
+        rejects.add("test:import", {"n": 1}, ValueError("first"))
+    with RejectFile("test", resume=True) as rejects:
+        rejects.add("test:import", {"n": 2}, ValueError("second"))
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["record"] for line in lines] == [{"n": 1}, {"n": 2}]
+
+    RejectFile("test").close()
+    assert path.read_text(encoding="utf-8") == ""
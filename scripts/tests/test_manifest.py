@@ -0,0 +1,47 @@
+from golfgod_import.manifest import ChangeManifest, record_hash
+
+
+def test_record_hash_ignores_key_order_but_not_values():
+    assert record_hash({"a": 1, "b": "x"}) == record_hash({"b": "x", "a": 1})
+    assert record_hash({"a": 1, "b": "x"}) != record_hash({"a": 1, "b": "y"})
+    assert record_hash({"name": "Ludvig Åberg"}) == record_hash({"name": "Ludvig Åberg"})
+
+
+def test_classify_against_the_saved_manifest():
+    first = ChangeManifest("players", "espnId")
+    records = [{"espnId": "1", "name": "A"}, {"espnId": "2", "name": "B"}, {"espnId": 3, "name": "C"}]
+    assert [first.classify(r) for r in records] == ["inserted"] * 3
+    first.mark_sent(records[:2])  # The third record's batch never succeeded
+    first.save()
+
+    second = ChangeManifest("players", "espnId")
+    changed = list(second.changed([
+        {"espnId": "1", "name": "A"},
+        {"espnId": "2", "name": "B (renamed)"},
+        {"espnId": "3", "name": "C"},
+    ]))
+    assert [r["espnId"] for r in changed] == ["2", "3"]
+    assert second.counts == {"inserted": 1, "modified": 1, "unchanged": 1}
+
+
+def test_deleted_keys_lists_keys_missing_from_this_run():
+    first = ChangeManifest("players", "espnId")
+    records = [{"espnId": "1"}, {"espnId": "2"}]
+    first.mark_sent(list(first.changed(records)))
+    first.save()
+
+    second = ChangeManifest("players", "espnId")
+    list(second.changed([{"espnId": "2"}]))
+    assert second.deleted_keys() == ["1"]
+    second.forget(second.deleted_keys())
+    assert second.deleted_keys() == []
+
+
+def test_hashes_stored_under_another_key_field_are_ignored():
+    old = ChangeManifest("rounds", "tournamentResultId")
+    old.mark_sent(list(old.changed([{"tournamentResultId": "r1", "roundKey": "r1:1"}])))
+    old.save()
+
+    new = ChangeManifest("rounds", "roundKey")
+    assert new.hashes == {}
+    assert new.classify({"tournamentResultId": "r1", "roundKey": "r1:1"}) == "inserted"
@@ -0,0 +1,20 @@
+from golfgod_import.photos import failed_photos
+
+
+def test_failed_photos_by_id_matches_only_reported_ids():
+    batch = [{"playerId": "players:1", "espnId": "1"}, {"playerId": "players:2", "espnId": "2"}]
+    details = [{"playerId": "players:2", "error": "Player not found: players:2"}]
+    assert failed_photos(batch, details, "playerId") == [batch[1]]
+
+
+def test_failed_photos_by_name_matches_only_reported_names():
+    batch = [{"playerName": "Scottie Scheffler", "espnId": "1"}, {"playerName": "Rory McIlroy", "espnId": "2"}]
+    details = [{"playerName": "Rory McIlroy", "error": "boom"}]
+    assert failed_photos(batch, details, "playerName") == [batch[1]]
+
+
+def test_failed_photos_never_matches_missing_fields():
+    batch = [{"playerId": "players:1"}, {"espnId": "2"}]
+    details = [{"playerName": "Someone", "error": "boom"}, {"error": "no key"}]
+    assert failed_photos(batch, details, "playerId") == []
+    assert failed_photos(batch, details, "playerName") == []
@@ -0,0 +1,39 @@
+from golfgod_import.resolver import ensure_name_index, normalize_name
+from golfgod_import.stub import StubBackend
+
+
+def test_normalize_name_matches_the_server_normalizer():
+    # Same results as normalizePlayerName in convex/utils/playerLookup.ts
+    assert normalize_name("  Ludvig  ÅBERG ") == "ludvig aberg"
+    assert normalize_name("Nicolai Højgaard") == "nicolai hjgaard"
+    assert normalize_name("Byeong-Hun An") == "byeong hun an"
+    assert normalize_name("J.J. Spaun") == "jj spaun"
+
+
+def test_normalize_name_strips_only_combining_diacritical_marks():
+    # U+20D7 is a combining mark outside U+0300-U+036F; like the TS
+    # normalizer, it is left to the [^a-z0-9] filter rather than stripped
+    assert normalize_name("Jon⃗ Rahm") == normalize_name("Jon Rahm")
+    assert normalize_name("José Olazabal") == "jose olazabal"
+
+
+def test_ensure_name_index_backfills_players_without_normalized_name():
+    backend = StubBackend()
+    player_id = backend.insert("players", {"name": "Ludvig Åberg"})
+    # A player created before normalizedName existed
+    del backend.table("players")[player_id]["normalizedName"]
+    backend.players_by_normalized.clear()
+    variant = {"players": [{"name": "  LUDVIG  ABERG "}]}
+    assert backend.query("players:resolvePlayers", variant)[0]["playerId"] is None
+
+    ensure_name_index(backend)
+
+    assert backend.query("players:getNameIndexStatus", {}) == {"pending": False}
+    assert backend.query("players:resolvePlayers", variant)[0]["playerId"] == player_id
+
+
+def test_ensure_name_index_is_one_read_once_backfilled():
+    backend = StubBackend()
+    backend.insert("players", {"name": "Scottie Scheffler"})
+    ensure_name_index(backend)
+    assert "players:backfillNormalizedNames" not in backend.calls
@@ -0,0 +1,132 @@
+import csv
+from types import SimpleNamespace
+
+import pytest
+
+from golfgod_import import rounds
+from golfgod_import.manifest import ChangeManifest
+from golfgod_import.normalize import pa
+from golfgod_import.rounds import (
+    COLUMNS, ResultKeys, RoundStats, changed_rounds, iter_payloads, mark_rounds_sent, read_chunks
+)
+from golfgod_import.runtime import ImportRuntime
+from golfgod_import.stub import HANDLERS, StubBackend
+
+RESULTS = [
+    {"_id": f"r{n}", "playerId": f"p{n}", "espnId": str(n), "year": 2024, "tournament": "Open",
+     "courseId": "c1", "par": 70}
+    for n in (1, 2, 3)
+]
+
+
+def write_rounds(path, rows):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["player_id", "year", "tournament", "round", "score"])
+        writer.writerows(rows)
+    return path
+
+
+def round_rows(espn_id, *round_nums, score=70):
+    return [[espn_id, 2024, "Open", r, score] for r in round_nums]
+
+
+def as_arrow(chunks):
+    return [{name: pa.array(list(columns[name]), pa.string()) for name in COLUMNS} for columns in chunks]
+
+
+@pytest.fixture(params=["python", "arrow"])
+def chunks_of(request):
+    """Read a rounds CSV in chunks of `size` rows as Python tuples or Arrow arrays"""
+    if request.param == "arrow" and pa is None:
+        pytest.skip("pyarrow is not installed")
+
+    def read(path, size):
+        chunks = list(read_chunks(path, size, use_arrow=False))
+        return as_arrow(chunks) if request.param == "arrow" else chunks
+    return read
+
+
+def summarize(payloads):
+    return [(p["tournamentResultId"], [r["round"] for r in p["rounds"]]) for p in payloads]
+
+
+def test_a_result_straddling_chunks_is_sent_once(tmp_path, chunks_of):
+    path = write_rounds(tmp_path / "rounds.csv", round_rows("1", 1, 2) + round_rows("2", 1, 2, 3, 4)
+                        + round_rows("3", 1))
+    stats = RoundStats()
+    payloads = list(iter_payloads(chunks_of(path, 3), ResultKeys(RESULTS), stats))
+    assert summarize(payloads) == [("r1", [1, 2]), ("r2", [1, 2, 3, 4]), ("r3", [1])]
+    assert stats.chunks == 3
+    assert stats.payloads == 3
+
+
+def test_a_result_spanning_several_chunks_is_merged(tmp_path, chunks_of):
+    path = write_rounds(tmp_path / "rounds.csv", round_rows("1", 4, 3, 2, 1) + round_rows("2", 1))
+    payloads = list(iter_payloads(chunks_of(path, 1), ResultKeys(RESULTS)))
+    assert summarize(payloads) == [("r1", [1, 2, 3, 4]), ("r2", [1])]
+
+
+def test_carry_survives_a_chunk_with_no_valid_rows(tmp_path, chunks_of):
+    path = write_rounds(tmp_path / "rounds.csv", round_rows("1", 1, 2) + round_rows("1", 9, 9)
+                        + round_rows("1", 3))
+    stats = RoundStats()
+    payloads = list(iter_payloads(chunks_of(path, 2), ResultKeys(RESULTS), stats))
+    assert summarize(payloads) == [("r1", [1, 2, 3])]
+    assert stats.rejected["round"] == 2
+
+
+def test_scattered_rows_become_separate_payloads(tmp_path, chunks_of):
+    path = write_rounds(tmp_path / "rounds.csv", round_rows("1", 1) + round_rows("2", 1) + round_rows("1", 2))
+    payloads = list(iter_payloads(chunks_of(path, 1), ResultKeys(RESULTS)))
+    assert summarize(payloads) == [("r1", [1]), ("r2", [1]), ("r1", [2])]
+
+
+def test_a_repeated_round_keeps_the_last_row(tmp_path, chunks_of):
+    path = write_rounds(tmp_path / "rounds.csv", round_rows("1", 1, score=70) + round_rows("1", 1, score=68))
+    payloads = list(iter_payloads(chunks_of(path, 1), ResultKeys(RESULTS)))
+    assert payloads[0]["rounds"] == [{"round": 1, "score": 68, "toPar": -2}]
+
+
+def test_changed_rounds_sends_only_new_or_modified_rounds(tmp_path):
+    keys = ResultKeys(RESULTS)
+    path = write_rounds(tmp_path / "rounds.csv", round_rows("1", 1, 2, 3) + round_rows("2", 1))
+    manifest = ChangeManifest("rounds", "roundKey")
+    sent = list(changed_rounds(iter_payloads(read_chunks(path, 2, use_arrow=False), keys), manifest))
+    mark_rounds_sent(manifest, sent)
+    manifest.save()
+
+    # A reshuffled file where one round changed score
+    rows = round_rows("2", 1) + round_rows("1", 3, 1) + round_rows("1", 2, score=75)
+    path = write_rounds(tmp_path / "rounds.csv", rows)
+    manifest = ChangeManifest("rounds", "roundKey")
+    payloads = iter_payloads(read_chunks(path, 1, use_arrow=False), keys)
+    assert summarize(changed_rounds(payloads, manifest)) == [("r1", [2])]
+    assert manifest.counts == {"inserted": 0, "modified": 1, "unchanged": 3}
+
+
+def test_rounds_of_failed_results_are_sent_again(tmp_path, monkeypatch):
+    backend = StubBackend()
+    backend.insert("players", {"name": "One", "espnId": "1"})
+    backend.insert("players", {"name": "Two", "espnId": "2"})
+    for key, player_id in (("r1", "players:1"), ("r2", "players:2")):
+        backend.table("tournamentResults")[key] = {"_id": key, "playerId": player_id, "year": 2024,
+                                                   "tournament": "Open", "course": "TPC"}
+
+    stub_import = HANDLERS["roundStats:importRoundStatsBatch"]
+    sent = []
+
+    def import_failing_r2(backend, args):
+        sent.append(summarize(args["results"]))
+        result = stub_import(backend, args)
+        if any(p["tournamentResultId"] == "r2" for p in args["results"]):
+            result["failedResults"] = ["r2"]
+        return result
+    monkeypatch.setitem(HANDLERS, "roundStats:importRoundStatsBatch", import_failing_r2)
+
+    path = write_rounds(tmp_path / "rounds.csv", round_rows("1", 1, 2) + round_rows("2", 1, 2))
+    args = SimpleNamespace(rounds_file=str(path), chunk_rows=1000, batch_size=10, concurrency=1,
+                           resume=False, full=False)
+    assert rounds.run(ImportRuntime(backend), args) == 0
+    assert rounds.run(ImportRuntime(backend), args) == 0
+    assert sent == [[("r1", [1, 2]), ("r2", [1, 2])], [("r2", [1, 2])]]
@@ -0,0 +1,33 @@
+import builtins
+import json
+import warnings
+
+from golfgod_import.streaming import iter_json_array
+
+DOCUMENT = {"meta": {"source": "espn", "years": [2024, 2025]},
+            "tournaments": [{"tournament_id": "t1", "year": 2024, "prize_money": 20000000},
+                            {"tournament_id": "t2", "year": 2025, "name": "Åland Open"}]}
+
+
+def write(tmp_path):
+    path = tmp_path / "schedule.json"
+    path.write_text(json.dumps(DOCUMENT, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_iter_json_array_reads_paths_without_warnings(tmp_path):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert list(iter_json_array(write(tmp_path))) == DOCUMENT["tournaments"]
+
+
+def test_iter_json_array_falls_back_to_raw_decode(tmp_path, monkeypatch):
+    real_import = builtins.__import__
+
+    def no_ijson(name, *args, **kwargs):
+        if name == "ijson":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_ijson)
+    assert list(iter_json_array(write(tmp_path), chunk_size=7)) == DOCUMENT["tournaments"]